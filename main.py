@@ -20,11 +20,17 @@ Usage:
 
 import os
 import sys
-import json
+import time
+import asyncio
 import argparse
 import datetime
+import functools
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Callable, Optional, Dict, Any
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
@@ -34,54 +40,264 @@ from xml_service.xml_injector import PPTXRebuilder
 from translator.visual_engine import RTLVisualEngine
 from translator.content_processor import ContentProcessor
 from translator.chart_processor import ChartProcessor
-from translator.text_translator import TextTranslator
-from translator.llm_prompts import get_anthropic_prompt
+from translator.translation_memory import TranslationMemory
+from translator import json_codec
+from translator.http_pool import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_RETRIES, create_async_http_client
 
 
 # ============================================================================
 # LLM TRANSLATION
 # ============================================================================
+# Models behind the LLM translators (also part of the translation memory namespace)
+OPENAI_MODEL = "gpt-5-mini"
+ANTHROPIC_MODEL = "claude-sonnet-4-20250514"
+
+# Input-token budget of one Anthropic deck request (the reply must fit the
+# non-streaming output limit, so chunks stay smaller than OpenAI's)
+ANTHROPIC_MAX_DECK_TOKENS = 8000
+
+
 def translate_with_openai(content_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
     """
     Translate content using OpenAI API with structured output.
 
     Uses the TextTranslator service with Pydantic validation.
     """
-    translator = TextTranslator(api_key=api_key, model="gpt-5-mini")
+    from translator.text_translator import TextTranslator
+
+    translator = TextTranslator(api_key=api_key, model=OPENAI_MODEL)
     return translator.translate_to_dict(content_json)
 
 
-def translate_with_anthropic(content_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
+def _anthropic_client(
+    api_key: Optional[str] = None,
+    use_async: bool = False,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+):
     """
-    Translate content using Anthropic Claude API.
+    Create a (sync or async) Anthropic client, validating the API key.
 
-    Requires: pip install anthropic
-    Set ANTHROPIC_API_KEY environment variable or pass api_key.
+    The async client uses a pooled keep-alive connection pool of max_connections.
+    Both retry rate limits and server errors DEFAULT_MAX_RETRIES times.
     """
     try:
         import anthropic
     except ImportError:
         raise ImportError("Please install anthropic: pip install anthropic")
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
     api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY not set")
 
-    client = anthropic.Anthropic(api_key=api_key)
+    if use_async:
+        return anthropic.AsyncAnthropic(
+            api_key=api_key,
+            max_retries=DEFAULT_MAX_RETRIES,
+            http_client=create_async_http_client(anthropic, max_connections)
+        )
+    return anthropic.Anthropic(api_key=api_key, max_retries=DEFAULT_MAX_RETRIES)
 
-    system_prompt, user_message = get_anthropic_prompt(
-        json.dumps(content_json, ensure_ascii=False, indent=2)
-    )
 
-    response = client.messages.create(
-        model="claude-sonnet-4-20250514",
-        max_tokens=4096,
-        system=system_prompt,
-        messages=[{"role": "user", "content": user_message}]
+def _anthropic_request(content_json: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the messages.create() parameters for one content payload."""
+    from translator.text_translator import get_anthropic_prompt
+
+    system_prompt, user_message = get_anthropic_prompt(content_json)
+
+    return {
+        "model": ANTHROPIC_MODEL,
+        "max_tokens": 4096,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": user_message}],
+    }
+
+
+def _anthropic_deck_request(units: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the messages.create() parameters for a deck request (many units at once)."""
+    from translator.text_translator import get_anthropic_deck_prompt
+
+    system_prompt, user_message = get_anthropic_deck_prompt(units)
+
+    return {
+        "model": ANTHROPIC_MODEL,
+        # The Arabic reply runs longer than the English prompt
+        "max_tokens": 2 * ANTHROPIC_MAX_DECK_TOKENS,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": user_message}],
+    }
+
+
+def _anthropic_result(content_json: Dict[str, Any], response_text: str) -> Dict[str, Any]:
+    """Merge a Claude reply (translated text only) back into the full payload."""
+    from translator.text_translator import merge_with_original
+
+    return merge_with_original(content_json, json_codec.loads(response_text))
+
+
+def translate_with_anthropic(content_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Translate content using Anthropic Claude API.
+
+    Requires: pip install anthropic
+    Set ANTHROPIC_API_KEY environment variable or pass api_key.
+    """
+    client = _anthropic_client(api_key)
+    response = client.messages.create(**_anthropic_request(content_json))
+
+    return _anthropic_result(content_json, response.content[0].text)
+
+
+def translate_with_anthropic_batch(
+    contents: Dict[str, Dict[str, Any]],
+    api_key: Optional[str] = None,
+    poll_interval: float = 5.0,
+    max_poll_interval: float = 300.0
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Translate many payloads through the Anthropic Message Batches API.
+
+    Args:
+        contents: Mapping of custom_id (e.g. "slide3") to content JSON
+        poll_interval: Initial seconds between status polls
+        max_poll_interval: Upper bound for the exponential poll backoff
+
+    Returns:
+        Mapping of custom_id to translated content JSON
+    """
+    from translator.text_translator import join_split_units, split_units
+
+    client = _anthropic_client(api_key)
+
+    # Oversized payloads become several requests, joined again below
+    contents = split_units(contents)
+    batch = client.messages.batches.create(
+        requests=[
+            {"custom_id": custom_id, "params": _anthropic_request(content)}
+            for custom_id, content in contents.items()
+        ]
     )
 
-    translated_text = response.content[0].text
-    return json.loads(translated_text)
+    # Poll with exponential backoff until processing has ended
+    delay = poll_interval
+    while batch.processing_status != "ended":
+        time.sleep(delay)
+        delay = min(delay * 2, max_poll_interval)
+        batch = client.messages.batches.retrieve(batch.id)
+
+    results = {}
+    for entry in client.messages.batches.results(batch.id):
+        if entry.result.type != "succeeded":
+            raise RuntimeError(f"Batch request '{entry.custom_id}' {entry.result.type}")
+        results[entry.custom_id] = _anthropic_result(
+            contents[entry.custom_id], entry.result.message.content[0].text
+        )
+
+    missing = set(contents) - set(results)
+    if missing:
+        raise RuntimeError(f"Batch returned no result for: {sorted(missing)}")
+
+    return join_split_units(results)
+
+
+def _create_async_client(
+    translator: str,
+    api_key: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    verbose: bool = False
+):
+    """
+    Create one client to be shared by every concurrent request of a run.
+
+    Returns a TextTranslator for "openai" and an AsyncAnthropic client for "anthropic".
+    """
+    if translator == "openai":
+        from translator.text_translator import TextTranslator
+        return TextTranslator(
+            api_key=api_key, model=OPENAI_MODEL, max_connections=max_connections, verbose=verbose
+        )
+    elif translator == "anthropic":
+        return _anthropic_client(api_key, use_async=True, max_connections=max_connections)
+    raise ValueError(f"Unknown translator: {translator}")
+
+
+async def _translate_anthropic_deck_async(
+    units: Dict[str, Dict[str, Any]],
+    client,
+    semaphore: asyncio.Semaphore,
+    verbose: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Translate a chunk of units with one Claude request.
+
+    A reply that cannot be mapped back to every unit is retried as two
+    halves, down to single units. The semaphore is held per request, so
+    retries stay within max_concurrency too.
+    """
+    from translator.text_translator import TranslationError, _halve, split_deck_response
+
+    async with semaphore:
+        response = await client.messages.create(**_anthropic_deck_request(units))
+    try:
+        return split_deck_response(units, response.content[0].text, verbose)
+    except TranslationError as e:
+        if len(units) < 2:
+            raise
+        if verbose:
+            print(f"  Deck request of {len(units)} units failed ({e}), retrying in halves")
+        results = {}
+        for half in await asyncio.gather(
+            *[_translate_anthropic_deck_async(half, client, semaphore, verbose) for half in _halve(units)]
+        ):
+            results.update(half)
+        return results
+
+
+async def _translate_async(
+    content_json: Dict[str, Any],
+    translator: str,
+    api_key: Optional[str] = None,
+    client=None
+) -> Dict[str, Any]:
+    """
+    Translate one content payload without blocking the event loop.
+
+    Args:
+        content_json: Content in the slide schema (slide_context + elements)
+        translator: "openai" or "anthropic"
+        api_key: Optional API key
+        client: Shared client from _create_async_client() (created if omitted)
+    """
+    if client is None:
+        client = _create_async_client(translator, api_key)
+
+    if translator == "openai":
+        return await client.translate_to_dict_async(content_json)
+    elif translator == "anthropic":
+        response = await client.messages.create(**_anthropic_request(content_json))
+        return _anthropic_result(content_json, response.content[0].text)
+
+    raise ValueError(f"Unknown translator: {translator}")
+
+
+# Sample Arabic consulting translations for mock runs (read-only)
+MOCK_ARABIC_SAMPLES = MappingProxyType({
+    "title": "إطار التحول الاستراتيجي",
+    "subtitle": "نظرة عامة على الخدمات الاستشارية",
+    "header": "النتائج الرئيسية والتوصيات",
+    "content": "تحسين الكفاءة التشغيلية بنسبة 25%",
+    "body": "تقليص وقت الوصول إلى السوق بنسبة 40%",
+})
+MOCK_SLIDE_CONTEXT = "شريحة استشارية - عرض تقديمي احترافي"
+
+
+@functools.lru_cache(maxsize=1024)
+def _mock_text(role: str, element_id: Optional[str]) -> str:
+    """Mock Arabic text for an element (memoized: template ids repeat across slides)."""
+    base_text = MOCK_ARABIC_SAMPLES.get(role, MOCK_ARABIC_SAMPLES["content"])
+    return f"{base_text} (#{element_id})"
 
 
 def translate_mock(content_json: Dict[str, Any]) -> Dict[str, Any]:
@@ -91,63 +307,64 @@ def translate_mock(content_json: Dict[str, Any]) -> Dict[str, Any]:
     Uses sample Arabic consulting text to test proper rendering.
     The ID field is preserved to ensure correct text-to-shape mapping.
     """
-    # Sample Arabic consulting translations for testing
-    ARABIC_SAMPLES = {
-        "title": "إطار التحول الاستراتيجي",
-        "subtitle": "نظرة عامة على الخدمات الاستشارية",
-        "header": "النتائج الرئيسية والتوصيات",
-        "content": "تحسين الكفاءة التشغيلية بنسبة 25%",
-        "body": "تقليص وقت الوصول إلى السوق بنسبة 40%",
-    }
-
-    translated = json.loads(json.dumps(content_json))  # Deep copy
-    translated["slide_context"] = "شريحة استشارية - عرض تقديمي احترافي"
+    # Build the output directly (no deep copy): only text fields change
+    translated = dict(content_json)
+    translated["slide_context"] = MOCK_SLIDE_CONTEXT
 
-    for elem in translated.get("elements", []):
+    elements = []
+    for elem in content_json.get("elements", []):
         # CRITICAL: Preserve the ID for correct mapping back to shapes
         element_id = elem.get("id")
         role = elem.get("role", "content")
 
-        # Get appropriate sample translation based on role
-        if role in ARABIC_SAMPLES:
-            base_text = ARABIC_SAMPLES[role]
-        else:
-            base_text = ARABIC_SAMPLES["content"]
-
         # Create Arabic text with element ID for verification
-        elem["text"] = f"{base_text} (#{element_id})"
+        new_elem = dict(elem)
+        new_elem["text"] = _mock_text(role, element_id)
 
         # Also update paragraphs if present - preserve structure
         if "paragraphs" in elem:
-            for i, para in enumerate(elem["paragraphs"]):
-                para_text = para.get("text", "")
-                # Keep paragraph structure, add Arabic sample
-                para["text"] = f"{base_text} - فقرة {i+1}"
+            base_text = MOCK_ARABIC_SAMPLES.get(role, MOCK_ARABIC_SAMPLES["content"])
+            new_elem["paragraphs"] = [
+                {**para, "text": f"{base_text} - فقرة {i+1}"}
+                for i, para in enumerate(elem["paragraphs"])
+            ]
+
+        elements.append(new_elem)
+
+    if "elements" in content_json:
+        translated["elements"] = elements
 
     return translated
 
 
 def translate_mock_chart(chart_json: Dict[str, Any]) -> Dict[str, Any]:
     """Mock translation for chart text."""
-    translated = json.loads(json.dumps(chart_json))  # Deep copy
+    # Build the output directly (no deep copy): only text fields change
+    translated = dict(chart_json)
 
     if translated.get("chart_title"):
         translated["chart_title"] = "عنوان الرسم البياني"
 
-    for i, series in enumerate(translated.get("series", [])):
-        series["name"] = f"السلسلة {i+1}"
+    if "series" in chart_json:
+        translated["series"] = [
+            {**series, "name": f"السلسلة {i+1}"}
+            for i, series in enumerate(chart_json["series"])
+        ]
 
-    for i, category in enumerate(translated.get("categories", [])):
-        translated["categories"][i] = f"الفئة {i+1}"
+    if "categories" in chart_json:
+        translated["categories"] = [f"الفئة {i+1}" for i in range(len(chart_json["categories"]))]
 
     return translated
 
 
-def translate_with_openai_chart(chart_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
-    """Translate chart text using OpenAI API."""
-    # Create a simple prompt for chart translation
-    translator = TextTranslator(api_key=api_key, model="gpt-5-mini")
+def _chart_to_content(chart_json: Dict[str, Any]) -> tuple:
+    """
+    Convert chart text into the slide content schema used by the LLM translators.
 
+    Returns:
+        Tuple of (content, element_map) where element_map is a list of
+        (type, original_id) tuples in element order, used by _content_to_chart().
+    """
     # Build a simple content structure for translation
     content = {
         "slide_context": "Chart - Professional business presentation",
@@ -188,9 +405,11 @@ def translate_with_openai_chart(chart_json: Dict[str, Any], api_key: Optional[st
         element_map.append(("category", i))
         elem_id += 1
 
-    # Translate
-    translated_content = translator.translate_to_dict(content)
+    return content, element_map
+
 
+def _content_to_chart(translated_content: Dict[str, Any], element_map: list) -> Dict[str, Any]:
+    """Map a translated content payload back to the chart text format."""
     # Extract back to chart format using element_map for ordering
     result = {
         "chart_title": None,
@@ -224,11 +443,132 @@ def translate_with_openai_chart(chart_json: Dict[str, Any], api_key: Optional[st
     return result
 
 
+def translate_with_openai_chart(chart_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
+    """Translate chart text using OpenAI API."""
+    content, element_map = _chart_to_content(chart_json)
+    translated_content = translate_with_openai(content, api_key)
+    return _content_to_chart(translated_content, element_map)
+
+
 def translate_with_anthropic_chart(chart_json: Dict[str, Any], api_key: Optional[str] = None) -> Dict[str, Any]:
     """Translate chart text using Anthropic Claude API."""
-    # For simplicity, use the same approach as OpenAI
-    # In practice, you could create a specialized Anthropic prompt for charts
-    return translate_with_openai_chart(chart_json, api_key)
+    # Same approach as OpenAI: charts are translated in the slide content schema
+    content, element_map = _chart_to_content(chart_json)
+    translated_content = translate_with_anthropic(content, api_key)
+    return _content_to_chart(translated_content, element_map)
+
+
+def _dedupe_payloads(payloads: Dict[str, Dict[str, Any]]) -> tuple:
+    """
+    Group identical payloads so each one is translated only once.
+
+    Returns:
+        Tuple of (representatives, unique): unit name -> name of the first unit
+        with an identical payload, and representative name -> payload.
+    """
+    first_by_key = {}
+    representatives = {}
+    for name, content in payloads.items():
+        key = json_codec.dumps_bytes(content, sort_keys=True)
+        representatives[name] = first_by_key.setdefault(key, name)
+    unique = {name: payloads[name] for name in first_by_key.values()}
+    return representatives, unique
+
+
+# Below this many units in a stage, parsing inline beats shipping XML to workers
+_MIN_PARALLEL_UNITS = 16
+
+# Per-process transform state, set up by _init_transform_worker() for each presentation.xml
+_worker_pres_xml: Optional[bytes] = None
+_worker_engine: Optional[RTLVisualEngine] = None
+_worker_content_processor: Optional[ContentProcessor] = None
+
+
+def _process_pool_context() -> multiprocessing.context.BaseContext:
+    """
+    Start method for worker processes: forkserver where available, else spawn.
+
+    Never the platform default fork: the web app runs the pipeline from a
+    thread, and forking a multi-threaded process can deadlock the children.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def _cache_namespace(translator: str) -> str:
+    """Translation memory namespace of an LLM translator: its model and prompt version."""
+    from translator.text_translator import PROMPT_VERSION
+
+    model = OPENAI_MODEL if translator.startswith("openai") else ANTHROPIC_MODEL
+    return f"{model}:{PROMPT_VERSION}"
+
+
+def _init_transform_worker(pres_xml: bytes) -> None:
+    """
+    Parse presentation.xml once per process and keep a reusable engine.
+
+    Called by _transform_unit_worker() whenever it sees a new presentation.xml,
+    so the same pool can also serve the extraction stages.
+    """
+    global _worker_pres_xml, _worker_engine, _worker_content_processor
+    _worker_pres_xml = pres_xml
+    _worker_engine = RTLVisualEngine(
+        presentation_xml_path=pres_xml,
+        layout_flip_ratio=0.4,
+        flip_connectors=True,
+        verbose=False  # Reduce noise for multi-slide
+    )
+    _worker_content_processor = ContentProcessor(verbose=False)
+
+
+def _transform_unit_worker(
+    pres_xml: bytes,
+    unit_xml: bytes,
+    translated_json: Optional[Dict[str, Any]] = None,
+    debug_prefix: Optional[str] = None,
+    has_text: Optional[bool] = True
+) -> bytes:
+    """
+    Apply RTL transform and inject translated text into one XML part, in memory.
+
+    Module-level so it can run in a ProcessPoolExecutor worker; inputs and
+    output are raw XML bytes so they pickle cheaply.
+
+    Args:
+        pres_xml: presentation.xml bytes (parsed once per worker process)
+        unit_xml: Original XML bytes of the slide/master/layout
+        translated_json: Translated content to inject (None: RTL transform only)
+        debug_prefix: If set, also write "<prefix>_rtl.xml" / "<prefix>_final.xml"
+        has_text: Passed to RTLVisualEngine.transform() (None: detect, and skip
+                  the paragraph-level RTL pass for text-free slides)
+
+    Returns:
+        Serialized final XML.
+    """
+    if pres_xml != _worker_pres_xml:
+        _init_transform_worker(pres_xml)
+    engine = _worker_engine
+    engine.reset_slide(unit_xml)
+    engine.transform(has_text=has_text)
+    if debug_prefix:
+        engine.save(f"{debug_prefix}_rtl.xml")
+
+    # Inject straight into the transformed tree (no serialize/re-parse round-trip);
+    # nothing to inject for units without translatable text
+    if translated_json is not None and translated_json.get("elements"):
+        _worker_content_processor.inject_translated_content(
+            engine.root,
+            translated_json,
+            f"{debug_prefix}_final.xml" if debug_prefix else None
+        )
+
+    final_xml = PPTXRebuilder.serialize_xml(engine.root)
+    engine.close()  # Don't hold this unit's tree until the next one
+    return final_xml
+
+
+# Supported translation engines
+TRANSLATORS = ["openai", "anthropic", "openai-batch", "anthropic-batch", "mock"]
 
 
 # ============================================================================
@@ -244,34 +584,51 @@ class SlideTranslator:
         input_pptx: str,
         output_pptx: str,
         work_dir: Optional[str] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        max_concurrency: int = 8,
+        max_workers: Optional[int] = None,
+        use_cache: bool = True,
+        debug: bool = False
     ):
         self.input_pptx = input_pptx
         self.output_pptx = output_pptx
         self.verbose = verbose
-
-        # Create working directory
-        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.work_dir = work_dir or f"./work_{timestamp}"
-        os.makedirs(self.work_dir, exist_ok=True)
+        self.max_concurrency = max_concurrency
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._pool = None  # Worker processes shared by every stage (see _process_pool)
+
+        # Element-level translation memory shared across runs (LLM translators only)
+        self.translation_memory = TranslationMemory(verbose=verbose) if use_cache else None
+
+        # Everything stays in memory; intermediate files are only written
+        # for debugging (--debug, or an explicit work dir)
+        self.debug = debug or work_dir is not None
+        self.work_dir = None
+        if self.debug:
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            self.work_dir = work_dir or f"./work_{timestamp}"
+            os.makedirs(self.work_dir, exist_ok=True)
 
         # Initialize components
-        self.extractor = PPTXXMLExtractor(input_pptx)
+        self.extractor = PPTXXMLExtractor(input_pptx, verbose=verbose)
         self.content_processor = ContentProcessor(verbose=verbose)
         self.chart_processor = ChartProcessor(verbose=verbose)
-        self.slide_count = self.extractor.get_slide_count()
-        self.master_count = self.extractor.get_slide_master_count()
-        self.layout_count = self.extractor.get_slide_layout_count()
-        self.chart_count = self.extractor.get_chart_count()
+        counts = self.extractor.get_counts()
+        self.slide_count = counts["slides"]
+        self.master_count = counts["slideMasters"]
+        self.layout_count = counts["slideLayouts"]
+        self.chart_count = counts["charts"]
 
-        # Store paths for multi-slide processing
-        self.pres_xml = os.path.join(self.work_dir, "presentation.xml")
+        # Original XML parts for multi-slide processing
+        self.pres_xml = None  # presentation.xml bytes (read in translate_slides)
+        self._unit_xml = {}  # unit name (e.g. "slide3") -> original XML bytes
+        self._prefetched = {}  # internal path -> bytes read ahead in one archive pass
 
         # Track transformed masters/layouts (transform once, reuse)
         self._masters_transformed = False
-        self._transformed_masters = {}  # master_index -> transformed_xml_path
-        self._transformed_layouts = {}  # layout_index -> transformed_xml_path
-        self._transformed_charts = {}  # chart_index -> transformed_xml_path
+        self._transformed_masters = {}  # master_index -> transformed XML bytes
+        self._transformed_layouts = {}  # layout_index -> transformed XML bytes
+        self._transformed_charts = {}  # chart_index -> translated chart root element
 
         if verbose:
             print(f"\n{'='*60}")
@@ -279,97 +636,374 @@ class SlideTranslator:
             print(f"{'='*60}")
             print(f"Input:  {input_pptx}")
             print(f"Output: {output_pptx}")
-            print(f"Work:   {self.work_dir}")
+            if self.debug:
+                print(f"Work:   {self.work_dir}")
             print(f"Slides: {self.slide_count}")
             print(f"Masters: {self.master_count}")
             print(f"Layouts: {self.layout_count}")
             print(f"Charts: {self.chart_count}")
 
-    def _process_single_slide(
-        self,
-        slide_index: int,
-        translator: str,
-        api_key: Optional[str] = None
-    ) -> str:
+    def close(self) -> None:
+        """Close the input PPTX (the extractor keeps the archive open for reads) and stop the workers."""
+        self.extractor.close()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _process_pool(self, unit_count: int) -> Optional[ProcessPoolExecutor]:
+        """
+        Worker pool for a stage of unit_count units, or None to run it inline.
+
+        The pool is started on first use and shared by every later stage, so
+        a run pays the worker start-up cost once.
+        """
+        if self.max_workers <= 1 or unit_count < _MIN_PARALLEL_UNITS:
+            return None
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=_process_pool_context()
+            )
+        return self._pool
+
+    def __enter__(self) -> "SlideTranslator":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    # ========================================================================
+    # EXTRACTION (collect every payload before translating)
+    # ========================================================================
+    def _debug_path(self, filename: str) -> Optional[str]:
+        """Path of an intermediate file in the work dir, or None outside debug mode."""
+        return os.path.join(self.work_dir, filename) if self.debug else None
+
+    def _read_unit(self, name: str, internal_path: str) -> bytes:
         """
-        Process a single slide through the translation pipeline.
+        Read an XML part from the PPTX into memory, keyed by unit name.
+
+        Args:
+            name: Unit name (e.g. "slide3", "slideLayout2", "chart1")
+            internal_path: Path inside the archive
 
         Returns:
-            Path to the final transformed XML for this slide.
+            Raw XML bytes
         """
-        if self.verbose:
-            print(f"\n{'-'*50}")
-            print(f"PROCESSING SLIDE {slide_index}")
-            print(f"{'-'*50}")
+        xml_bytes = self._prefetched.pop(internal_path, None)
+        if xml_bytes is None:
+            xml_bytes = self.extractor.extract_raw(internal_path)
+        self._unit_xml[name] = xml_bytes
+
+        if self.debug:
+            with open(self._debug_path(f"{name}.xml"), "wb") as f:
+                f.write(xml_bytes)
+
+        return xml_bytes
+
+    def _extract_slides(self, slide_indices: list) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract slides' XML and text content (steps 1-2 of the slide pipeline).
 
-        # File paths for this slide
-        slide_xml = os.path.join(self.work_dir, f"slide{slide_index}.xml")
-        content_json_path = os.path.join(self.work_dir, f"slide{slide_index}_content.json")
-        translated_json_path = os.path.join(self.work_dir, f"slide{slide_index}_translated.json")
-        rtl_xml = os.path.join(self.work_dir, f"slide{slide_index}_rtl.xml")
-        final_xml = os.path.join(self.work_dir, f"slide{slide_index}_final.xml")
+        Text extraction of all slides runs in parallel worker processes.
+
+        Returns:
+            Dict mapping unit name (e.g. "slide3") to content JSON for the LLM.
+        """
+        names = [f"slide{slide_index}" for slide_index in slide_indices]
 
         # Step 1: Extract slide XML
         if self.verbose:
+            print(f"\n{'-'*50}")
+            print(f"EXTRACTING {len(names)} SLIDES")
+            print(f"{'-'*50}")
             print(f"  [1/5] Extracting slide XML...")
-        self.extractor.extract_slide_xml(slide_index, slide_xml, prettify=False)
+        slide_xmls = [self._read_unit(name, f"ppt/slides/{name}.xml") for name in names]
 
         # Step 2: Extract content for LLM
         if self.verbose:
             print(f"  [2/5] Extracting text content...")
-        content_json = self.content_processor.extract_content_for_llm(slide_xml)
-        self.content_processor.save_json(content_json, content_json_path)
+        contents = dict(zip(names, ContentProcessor.extract_many(
+            slide_xmls, self._process_pool(len(slide_xmls)), self.max_workers
+        )))
 
-        # Step 3: Translate
-        if self.verbose:
-            print(f"  [3/5] Translating ({translator})...")
-
-        if translator == "openai":
-            translated_json = translate_with_openai(content_json, api_key)
-        elif translator == "anthropic":
-            translated_json = translate_with_anthropic(content_json, api_key)
-        elif translator == "mock":
-            translated_json = translate_mock(content_json)
-        else:
-            raise ValueError(f"Unknown translator: {translator}")
+        for name, content_json in contents.items():
+            if self.verbose:
+                print(f"  {name}: {len(content_json['elements'])} text elements")
+            if self.debug:
+                self.content_processor.save_json(content_json, self._debug_path(f"{name}_content.json"))
 
-        self.content_processor.save_json(translated_json, translated_json_path)
+        return contents
 
-        # Step 4: Visual RTL transformation
-        if self.verbose:
-            print(f"  [4/5] Applying RTL visual transformation...")
+    def _extract_masters_and_layouts(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract all slide masters and layouts and their text content.
+
+        Returns:
+            Dict mapping unit name (e.g. "slideMaster1") to content JSON,
+            only for units that have text to translate.
+        """
+        payloads = {}
+
+        if self._masters_transformed:
+            return payloads
 
-        engine = RTLVisualEngine(
-            presentation_xml_path=self.pres_xml,
-            slide_xml_path=slide_xml,
-            layout_flip_ratio=0.4,
-            flip_connectors=True,
-            verbose=False  # Reduce noise for multi-slide
+        units = [f"slideMasters/slideMaster{i}" for i in range(1, self.master_count + 1)]
+        units += [f"slideLayouts/slideLayout{i}" for i in range(1, self.layout_count + 1)]
+        names = [unit.split("/")[1] for unit in units]
+
+        # Extract XML, then the text content of every unit in parallel
+        unit_xmls = [self._read_unit(name, f"ppt/{unit}.xml") for name, unit in zip(names, units)]
+        unit_contents = ContentProcessor.extract_many(
+            unit_xmls, self._process_pool(len(unit_xmls)), self.max_workers
         )
-        engine.transform()
-        engine.save(rtl_xml)
 
-        # Step 5: Inject translated text
+        for name, unit_content in zip(names, unit_contents):
+            # Only translate if there's text to translate
+            if unit_content.get("elements"):
+                if self.debug:
+                    self.content_processor.save_json(unit_content, self._debug_path(f"{name}_content.json"))
+                payloads[name] = unit_content
+
+        return payloads
+
+    def _extract_all_charts(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Extract the text of every chart in the presentation.
+
+        Returns:
+            Dict mapping unit name (e.g. "chart1") to chart text JSON.
+        """
+        names = [f"chart{i}" for i in range(1, self.chart_count + 1)]
+
+        # Extract chart XML, then the chart text of every chart in parallel
+        chart_xmls = [self._read_unit(name, f"ppt/charts/{name}.xml") for name in names]
+        chart_contents = dict(zip(names, ChartProcessor.extract_many(
+            chart_xmls, self._process_pool(len(chart_xmls)), self.max_workers
+        )))
+
+        if self.debug:
+            for name, chart_content in chart_contents.items():
+                self.chart_processor.save_json(chart_content, self._debug_path(f"{name}_content.json"))
+
+        return chart_contents
+
+    # ========================================================================
+    # TRANSLATION (all payloads of a run at once)
+    # ========================================================================
+    def _translate_payloads(
+        self,
+        contents: Dict[str, Dict[str, Any]],
+        chart_contents: Dict[str, Dict[str, Any]],
+        translator: str,
+        api_key: Optional[str] = None
+    ) -> tuple:
+        """
+        Translate every collected payload of the run.
+
+        The mock translator stays synchronous. LLM translators fire all
+        requests concurrently (bounded by max_concurrency), so the network
+        round-trips overlap instead of running back to back.
+
+        Args:
+            contents: Unit name -> content JSON (slides, masters, layouts)
+            chart_contents: Unit name -> chart text JSON
+            translator: One of TRANSLATORS
+            api_key: Optional API key
+
+        Returns:
+            Tuple of (translations, chart_translations), keyed by unit name.
+        """
+        if translator not in TRANSLATORS:
+            raise ValueError(f"Unknown translator: {translator}")
+
         if self.verbose:
-            print(f"  [5/5] Injecting translated text...")
+            print(f"\n{'-'*50}")
+            print(f"TRANSLATING {len(contents) + len(chart_contents)} PAYLOADS ({translator})")
+            print(f"{'-'*50}")
 
-        self.content_processor.inject_translated_content(
-            rtl_xml,
-            translated_json,
-            final_xml
+        if translator == "mock":
+            translations = {name: translate_mock(c) for name, c in contents.items()}
+            chart_translations = {name: translate_mock_chart(c) for name, c in chart_contents.items()}
+            return translations, chart_translations
+
+        # Charts are translated in the slide content schema, then mapped back
+        chart_payloads = {name: _chart_to_content(c) for name, c in chart_contents.items()}
+        payloads = dict(contents)
+        for name, (chart_content, _) in chart_payloads.items():
+            payloads[name] = chart_content
+
+        # Only send elements missing from the translation memory
+        tm = self.translation_memory
+        if tm is not None:
+            namespace = _cache_namespace(translator)
+            cached = {name: tm.split(c, namespace) for name, c in payloads.items()}
+            requests = {name: request for name, (_, request) in cached.items() if request["elements"]}
+            if self.verbose:
+                print(f"  Translation memory: {tm.hits} cached elements, {tm.misses} to translate")
+        else:
+            requests = payloads
+
+        if not requests:
+            results = {}
+        elif translator in ("openai-batch", "anthropic-batch"):
+            results = self._translate_payloads_batch(requests, translator, api_key)
+        else:
+            results = asyncio.run(self._translate_payloads_async(requests, translator, api_key))
+
+        if tm is not None:
+            results = {
+                name: tm.merge(payloads[name], hits, results.get(name), namespace)
+                for name, (hits, _) in cached.items()
+            }
+            tm.save()
+
+        translations = {name: results[name] for name in contents}
+        chart_translations = {
+            name: _content_to_chart(results[name], element_map)
+            for name, (_, element_map) in chart_payloads.items()
+        }
+        return translations, chart_translations
+
+    async def _translate_payloads_async(
+        self,
+        payloads: Dict[str, Dict[str, Any]],
+        translator: str,
+        api_key: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate payloads concurrently with asyncio.gather.
+
+        Identical payloads (common across layouts) are sent only once, and
+        all unique payloads are packed into deck-level requests (one per
+        token-budget chunk) so the system prompt is sent once per chunk.
+        """
+        client = _create_async_client(
+            translator, api_key, max_connections=self.max_concurrency, verbose=self.verbose
         )
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        representatives, unique = _dedupe_payloads(payloads)
 
-        return final_xml
+        try:
+            if translator == "openai":
+                if self.verbose:
+                    chunks = client.chunk_deck(unique)
+                    print(f"  {len(unique)} unique payloads in {len(chunks)} deck request(s)")
+                results = await client.translate_deck_async(unique, max_concurrency=self.max_concurrency)
+            else:
+                from translator.text_translator import chunk_deck_units, join_split_units
+
+                chunks = chunk_deck_units(unique, ANTHROPIC_MAX_DECK_TOKENS)
+                if self.verbose:
+                    print(f"  {len(unique)} unique payloads in {len(chunks)} deck request(s), "
+                          f"up to {self.max_concurrency} in flight")
+                gathered = await asyncio.gather(
+                    *[_translate_anthropic_deck_async(chunk, client, semaphore, self.verbose) for chunk in chunks],
+                    return_exceptions=True
+                )
+                results = {}
+                for chunk, result in zip(chunks, gathered):
+                    if isinstance(result, BaseException):
+                        if self.verbose:
+                            print(f"  Translation failed for {', '.join(chunk)}: {result}")
+                        raise result
+                    results.update(result)
+                results = join_split_units(results)  # Oversized payloads were sent in parts
+        finally:
+            if translator == "openai":
+                await client.aclose()
+            else:
+                await client.close()
 
-    def _translate_all_charts(
+        return {name: results[first] for name, first in representatives.items()}
+
+    def _translate_payloads_batch(
         self,
+        payloads: Dict[str, Dict[str, Any]],
         translator: str,
         api_key: Optional[str] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Translate payloads with the provider's asynchronous Batch API.
+
+        Each unique payload becomes one batch request whose custom_id is the
+        name of the first unit that produced it (e.g. "slide3").
+        """
+        representatives, unique = _dedupe_payloads(payloads)
+
+        if self.verbose:
+            print(f"  Submitting {len(unique)} requests as one batch (this can take a while)...")
+
+        if translator == "openai-batch":
+            from translator.text_translator import TextTranslator
+            translator_client = TextTranslator(api_key=api_key, model=OPENAI_MODEL, verbose=self.verbose)
+            results = translator_client.translate_batch_api(unique)
+        else:
+            results = translate_with_anthropic_batch(unique, api_key)
+
+        return {name: results[first] for name, first in representatives.items()}
+
+    # ========================================================================
+    # TRANSFORMATION + INJECTION
+    # ========================================================================
+    def _run_transforms(self, tasks: Dict[str, tuple]) -> Dict[str, bytes]:
+        """
+        Run independent transform/inject tasks, in parallel processes when worthwhile.
+
+        Args:
+            tasks: Mapping of unit name to _transform_unit_worker arguments (after pres_xml)
+
+        Returns:
+            Mapping of unit name to final XML bytes
+        """
+        pool = self._process_pool(len(tasks))
+        if pool is None:
+            return {name: _transform_unit_worker(self.pres_xml, *args) for name, args in tasks.items()}
+
+        # Each worker parses presentation.xml once, on its first task
+        futures = {name: pool.submit(_transform_unit_worker, self.pres_xml, *args) for name, args in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+    def _process_slides(
+        self,
+        slide_indices: list,
+        translations: Dict[str, Dict[str, Any]]
+    ) -> Dict[int, bytes]:
+        """
+        Apply RTL transform and inject translated text into extracted slides.
+
+        Slides are independent, so they are processed in parallel worker
+        processes (steps 4-5 of the slide pipeline).
+
+        Returns:
+            Mapping of slide index to the final transformed XML bytes.
+        """
+        tasks = {}
+        for slide_index in slide_indices:
+            name = f"slide{slide_index}"
+            translated_json = translations[name]
+            if self.debug:
+                self.content_processor.save_json(translated_json, self._debug_path(f"{name}_translated.json"))
+            # has_text=None: text-free slides (dividers, image-only) get a mirror-only pass
+            tasks[name] = (self._unit_xml[name], translated_json, self._debug_path(name), None)
+
+        if self.verbose:
+            print(f"\n{'-'*50}")
+            print(f"PROCESSING {len(tasks)} SLIDES")
+            print(f"{'-'*50}")
+            print(f"  [4/5] Applying RTL visual transformation...")
+            print(f"  [5/5] Injecting translated text...")
+
+        results = self._run_transforms(tasks)
+        return {slide_index: results[f"slide{slide_index}"] for slide_index in slide_indices}
+
+    def _translate_all_charts(
+        self,
+        chart_translations: Dict[str, Dict[str, Any]]
     ) -> None:
         """
-        Extract and translate all charts in the presentation.
+        Inject translated text into all extracted charts.
 
-        This should be called once before processing slides.
         Charts are stored as separate XML files and referenced by slides.
         """
         if self.chart_count == 0:
@@ -380,53 +1014,41 @@ class SlideTranslator:
             print(f"TRANSLATING {self.chart_count} CHARTS")
             print(f"{'-'*50}")
 
-        for i in range(1, self.chart_count + 1):
-            chart_xml = os.path.join(self.work_dir, f"chart{i}.xml")
-            chart_content_json = os.path.join(self.work_dir, f"chart{i}_content.json")
-            chart_translated_json = os.path.join(self.work_dir, f"chart{i}_translated.json")
-            chart_final = os.path.join(self.work_dir, f"chart{i}_final.xml")
+        # Charts are disjoint trees, so lxml can inject them from several
+        # threads; parsing and serialization release the GIL
+        with ThreadPoolExecutor(max_workers=min(8, self.chart_count)) as pool:
+            futures = {}
+            for i in range(1, self.chart_count + 1):
+                name = f"chart{i}"
 
-            if self.verbose:
-                print(f"  Translating chart{i}...")
+                if self.verbose:
+                    print(f"  Translating {name}...")
 
-            # Extract chart XML
-            self.extractor.extract_chart_xml(i, chart_xml, prettify=False)
+                translated_chart = chart_translations[name]
+                if self.debug:
+                    self.chart_processor.save_json(translated_chart, self._debug_path(f"{name}_translated.json"))
 
-            # Extract chart text
-            chart_content = self.chart_processor.extract_chart_text(chart_xml)
-            self.chart_processor.save_json(chart_content, chart_content_json)
+                # Inject translated text into chart XML
+                futures[pool.submit(
+                    self.chart_processor.inject_chart_text,
+                    self._unit_xml[name],
+                    translated_chart,
+                    self._debug_path(f"{name}_final.xml")
+                )] = i
 
-            # Translate chart text
-            if translator == "openai":
-                translated_chart = translate_with_openai_chart(chart_content, api_key)
-            elif translator == "anthropic":
-                translated_chart = translate_with_anthropic_chart(chart_content, api_key)
-            elif translator == "mock":
-                translated_chart = translate_mock_chart(chart_content)
-            else:
-                raise ValueError(f"Unknown translator: {translator}")
-
-            self.chart_processor.save_json(translated_chart, chart_translated_json)
-
-            # Inject translated text into chart XML
-            self.chart_processor.inject_chart_text(
-                chart_xml,
-                translated_chart,
-                chart_final
-            )
-
-            self._transformed_charts[i] = chart_final
+            # Collect in chart order so the rebuild stays deterministic
+            for future, i in futures.items():
+                self._transformed_charts[i] = future.result()
 
         if self.verbose:
             print(f"  Translated {self.chart_count} charts")
 
     def _transform_masters_and_layouts(
         self,
-        translator: str = "mock",
-        api_key: Optional[str] = None
+        translations: Dict[str, Dict[str, Any]]
     ) -> None:
         """
-        Transform all slide masters and layouts for RTL and translate their text.
+        Transform all slide masters and layouts for RTL and inject their translated text.
 
         This should be called once before processing slides.
         Masters and layouts contain elements like logos, navigation bars,
@@ -440,117 +1062,42 @@ class SlideTranslator:
             print("TRANSFORMING SLIDE MASTERS AND LAYOUTS")
             print(f"{'-'*50}")
 
-        # Transform all slide masters
-        for i in range(1, self.master_count + 1):
-            master_xml = os.path.join(self.work_dir, f"slideMaster{i}.xml")
-            master_content_json = os.path.join(self.work_dir, f"slideMaster{i}_content.json")
-            master_translated_json = os.path.join(self.work_dir, f"slideMaster{i}_translated.json")
-            master_rtl = os.path.join(self.work_dir, f"slideMaster{i}_rtl.xml")
-            master_final = os.path.join(self.work_dir, f"slideMaster{i}_final.xml")
+        units = [("slideMaster", i, self._transformed_masters) for i in range(1, self.master_count + 1)]
+        units += [("slideLayout", i, self._transformed_layouts) for i in range(1, self.layout_count + 1)]
+
+        tasks = {}
+        same_as = {}  # unit name -> name of an identical unit that is transformed instead
+        seen = {}  # content hash -> first unit name
+        for kind, i, transformed in units:
+            name = f"{kind}{i}"
+
+            # Units without text are only RTL-transformed (translated_unit is None)
+            translated_unit = translations.get(name)
+
+            # Identical XML with identical translation gives identical output:
+            # transform it once and reuse the bytes
+            digest = hashlib.blake2b(self._unit_xml[name], digest_size=16)
+            digest.update(json_codec.dumps_bytes(translated_unit, sort_keys=True))
+            key = digest.digest()
+            if key in seen:
+                same_as[name] = seen[key]
+                if self.verbose:
+                    print(f"  {name} is identical to {seen[key]}, reusing it")
+                continue
+            seen[key] = name
 
             if self.verbose:
-                print(f"  Transforming slideMaster{i}...")
-
-            # Extract master XML
-            self.extractor.extract_slide_master_xml(i, master_xml, prettify=False)
-
-            # Extract text content
-            master_content = self.content_processor.extract_content_for_llm(master_xml)
+                print(f"  Transforming {name}...")
 
-            # Only translate if there's text to translate
-            if master_content.get("elements"):
-                self.content_processor.save_json(master_content, master_content_json)
-
-                # Translate text
-                if translator == "openai":
-                    translated_master = translate_with_openai(master_content, api_key)
-                elif translator == "anthropic":
-                    translated_master = translate_with_anthropic(master_content, api_key)
-                elif translator == "mock":
-                    translated_master = translate_mock(master_content)
-                else:
-                    raise ValueError(f"Unknown translator: {translator}")
-
-                self.content_processor.save_json(translated_master, master_translated_json)
-
-            # Apply RTL visual transformation
-            engine = RTLVisualEngine(
-                presentation_xml_path=self.pres_xml,
-                slide_xml_path=master_xml,
-                layout_flip_ratio=0.4,
-                flip_connectors=True,
-                verbose=False
-            )
-            engine.transform()
-            engine.save(master_rtl)
-
-            # Inject translated text into RTL-transformed XML
-            if master_content.get("elements"):
-                self.content_processor.inject_translated_content(
-                    master_rtl,
-                    translated_master,
-                    master_final
-                )
-                self._transformed_masters[i] = master_final
-            else:
-                # No text to translate, use RTL XML as-is
-                self._transformed_masters[i] = master_rtl
+            if translated_unit is not None and self.debug:
+                self.content_processor.save_json(translated_unit, self._debug_path(f"{name}_translated.json"))
 
-        # Transform all slide layouts
-        for i in range(1, self.layout_count + 1):
-            layout_xml = os.path.join(self.work_dir, f"slideLayout{i}.xml")
-            layout_content_json = os.path.join(self.work_dir, f"slideLayout{i}_content.json")
-            layout_translated_json = os.path.join(self.work_dir, f"slideLayout{i}_translated.json")
-            layout_rtl = os.path.join(self.work_dir, f"slideLayout{i}_rtl.xml")
-            layout_final = os.path.join(self.work_dir, f"slideLayout{i}_final.xml")
+            tasks[name] = (self._unit_xml[name], translated_unit, self._debug_path(name))
 
-            if self.verbose:
-                print(f"  Transforming slideLayout{i}...")
-
-            # Extract layout XML
-            self.extractor.extract_slide_layout_xml(i, layout_xml, prettify=False)
-
-            # Extract text content
-            layout_content = self.content_processor.extract_content_for_llm(layout_xml)
-
-            # Only translate if there's text to translate
-            if layout_content.get("elements"):
-                self.content_processor.save_json(layout_content, layout_content_json)
-
-                # Translate text
-                if translator == "openai":
-                    translated_layout = translate_with_openai(layout_content, api_key)
-                elif translator == "anthropic":
-                    translated_layout = translate_with_anthropic(layout_content, api_key)
-                elif translator == "mock":
-                    translated_layout = translate_mock(layout_content)
-                else:
-                    raise ValueError(f"Unknown translator: {translator}")
-
-                self.content_processor.save_json(translated_layout, layout_translated_json)
-
-            # Apply RTL visual transformation
-            engine = RTLVisualEngine(
-                presentation_xml_path=self.pres_xml,
-                slide_xml_path=layout_xml,
-                layout_flip_ratio=0.4,
-                flip_connectors=True,
-                verbose=False
-            )
-            engine.transform()
-            engine.save(layout_rtl)
-
-            # Inject translated text into RTL-transformed XML
-            if layout_content.get("elements"):
-                self.content_processor.inject_translated_content(
-                    layout_rtl,
-                    translated_layout,
-                    layout_final
-                )
-                self._transformed_layouts[i] = layout_final
-            else:
-                # No text to translate, use RTL XML as-is
-                self._transformed_layouts[i] = layout_rtl
+        results = self._run_transforms(tasks)
+        for kind, i, transformed in units:
+            name = f"{kind}{i}"
+            transformed[i] = results[same_as.get(name, name)]
 
         self._masters_transformed = True
 
@@ -561,64 +1108,105 @@ class SlideTranslator:
         self,
         slide_indices: list,
         translator: str = "mock",
-        api_key: Optional[str] = None
+        api_key: Optional[str] = None,
+        progress_callback: Optional[Callable[[int, int], None]] = None
     ) -> str:
         """
         Translate multiple slides.
 
+        All slide, master, layout and chart payloads are collected first and
+        translated in one concurrent batch before any XML is transformed.
+
         Args:
             slide_indices: List of 1-based slide numbers (e.g., [1, 2])
-            translator: "openai", "anthropic", or "mock"
+            translator: "openai", "anthropic", "openai-batch", "anthropic-batch", or "mock"
             api_key: Optional API key
+            progress_callback: Called as (done, total) after each pipeline stage
+                               (extract, translate, masters/layouts/charts,
+                               slides, rebuild); may run on a worker thread
 
         Returns:
             Path to the output PPTX file
         """
+        total_steps = 5
+
+        def report(done: int) -> None:
+            if progress_callback is not None:
+                progress_callback(done, total_steps)
+
         if self.verbose:
             print(f"\n{'='*60}")
             print(f"TRANSLATING {len(slide_indices)} SLIDES: {slide_indices}")
             print(f"{'='*60}")
 
-        # Extract presentation.xml once (shared across slides)
-        self.extractor.extract_presentation_xml(self.pres_xml, prettify=False)
-
-        # Transform all masters and layouts for RTL and translate their text (once)
-        self._transform_masters_and_layouts(translator, api_key)
-
-        # Translate all charts (once)
-        self._translate_all_charts(translator, api_key)
-
-        # Process each slide and collect the final XMLs
-        final_xmls = {}
+        # Read every part this run needs in a single pass over the archive
+        internal_paths = ["ppt/presentation.xml"]
+        if not self._masters_transformed:
+            internal_paths += [f"ppt/slideMasters/slideMaster{i}.xml" for i in range(1, self.master_count + 1)]
+            internal_paths += [f"ppt/slideLayouts/slideLayout{i}.xml" for i in range(1, self.layout_count + 1)]
+        if not self._transformed_charts:
+            internal_paths += [f"ppt/charts/chart{i}.xml" for i in range(1, self.chart_count + 1)]
+        internal_paths += [
+            f"ppt/slides/slide{i}.xml" for i in slide_indices if 1 <= i <= self.slide_count
+        ]
+        self._prefetched = self.extractor.extract_many(internal_paths)
+
+        # Read presentation.xml once (shared across slides)
+        self.pres_xml = self._read_unit("presentation", "ppt/presentation.xml")
+
+        # Collect masters/layouts (once), charts (once) and slides
+        contents = self._extract_masters_and_layouts()
+        chart_contents = self._extract_all_charts() if not self._transformed_charts else {}
+
+        valid_indices = []
         for slide_index in slide_indices:
             if slide_index < 1 or slide_index > self.slide_count:
                 print(f"WARNING: Slide {slide_index} out of range (1-{self.slide_count}), skipping")
                 continue
-            final_xml = self._process_single_slide(slide_index, translator, api_key)
-            final_xmls[slide_index] = final_xml
+            valid_indices.append(slide_index)
+        contents.update(self._extract_slides(valid_indices))
+        report(1)
+
+        # Translate everything in one go
+        translations, chart_translations = self._translate_payloads(
+            contents, chart_contents, translator, api_key
+        )
+        report(2)
+
+        # Transform all masters and layouts for RTL and inject their text (once)
+        self._transform_masters_and_layouts(translations)
+
+        # Inject translated chart text (once)
+        if chart_translations:
+            self._translate_all_charts(chart_translations)
+        report(3)
+
+        # Process all slides in parallel and collect the final XMLs
+        final_xmls = self._process_slides(valid_indices, translations)
+        report(4)
 
         # Build replacements dict for multi-file injection
         replacements = {}
 
         # Add transformed slides
-        for slide_index, xml_path in final_xmls.items():
+        for slide_index, final_xml in final_xmls.items():
             internal_path = f"ppt/slides/slide{slide_index}.xml"
-            replacements[internal_path] = xml_path
+            replacements[internal_path] = final_xml
 
         # Add transformed masters
-        for master_index, xml_path in self._transformed_masters.items():
+        for master_index, final_xml in self._transformed_masters.items():
             internal_path = f"ppt/slideMasters/slideMaster{master_index}.xml"
-            replacements[internal_path] = xml_path
+            replacements[internal_path] = final_xml
 
         # Add transformed layouts
-        for layout_index, xml_path in self._transformed_layouts.items():
+        for layout_index, final_xml in self._transformed_layouts.items():
             internal_path = f"ppt/slideLayouts/slideLayout{layout_index}.xml"
-            replacements[internal_path] = xml_path
+            replacements[internal_path] = final_xml
 
-        # Add translated charts
-        for chart_index, xml_path in self._transformed_charts.items():
+        # Add translated charts (serialized by the rebuilder)
+        for chart_index, chart_root in self._transformed_charts.items():
             internal_path = f"ppt/charts/chart{chart_index}.xml"
-            replacements[internal_path] = xml_path
+            replacements[internal_path] = chart_root
 
         # Rebuild PPTX with all modified files in one pass
         if self.verbose:
@@ -631,8 +1219,9 @@ class SlideTranslator:
             print(f"  Charts: {len(self._transformed_charts)}")
             print(f"  Total replacements: {len(replacements)}")
 
-        rebuilder = PPTXRebuilder(self.input_pptx)
+        rebuilder = PPTXRebuilder(self.input_pptx, verbose=self.verbose)
         rebuilder.inject_multiple_files(replacements, self.output_pptx)
+        report(5)
 
         if self.verbose:
             print(f"\n{'='*60}")
@@ -690,26 +1279,40 @@ def parse_slides_arg(slides_str: str, max_slides: int) -> list:
     - "1,2" -> [1, 2]
     - "1-3" -> [1, 2, 3]
     - "1,3-5" -> [1, 3, 4, 5]
+
+    Raises:
+        ValueError: If a part is not a number or range, or lies outside 1..max_slides
     """
-    if slides_str.lower() == "all":
+    if slides_str.strip().lower() == "all":
         return list(range(1, max_slides + 1))
 
-    result = []
+    result = set()
     parts = slides_str.split(",")
 
     for part in parts:
         part = part.strip()
-        if "-" in part:
-            # Range: "1-3"
-            start, end = part.split("-", 1)
-            start = int(start.strip())
-            end = int(end.strip())
-            result.extend(range(start, end + 1))
-        else:
-            # Single number
-            result.append(int(part))
+        if not part:
+            continue  # Tolerate "1,,3" and trailing commas
+
+        try:
+            if "-" in part:
+                # Range: "1-3"
+                start, end = part.split("-", 1)
+                start = int(start.strip())
+                end = int(end.strip())
+            else:
+                # Single number
+                start = end = int(part)
+        except ValueError:
+            raise ValueError(f"'{part}' is not a slide number or range (e.g. 3 or 1-5)")
+
+        if start > end:
+            raise ValueError(f"Range '{part}' is reversed (write {end}-{start})")
+        if start < 1 or end > max_slides:
+            raise ValueError(f"'{part}' is outside the presentation's slides (1-{max_slides})")
+        result.update(range(start, end + 1))
 
-    return sorted(set(result))  # Remove duplicates and sort
+    return sorted(result)  # Set already removed duplicates
 
 
 def main():
@@ -726,7 +1329,7 @@ def main():
     )
     parser.add_argument(
         "--translator", "-t",
-        choices=["openai", "anthropic", "mock"],
+        choices=TRANSLATORS,
         default="mock",
         help="Translation engine (default: mock)"
     )
@@ -736,7 +1339,29 @@ def main():
     )
     parser.add_argument(
         "--work-dir", "-w",
-        help="Working directory for intermediate files"
+        help="Working directory for intermediate files (implies --debug)"
+    )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Write intermediate XML/JSON files to a work directory"
+    )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        default=8,
+        help="Maximum number of concurrent LLM requests (default: 8)"
+    )
+    parser.add_argument(
+        "--workers", "-j",
+        type=int,
+        default=None,
+        help="Worker processes for text extraction and XML transforms (default: CPU count)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Disable the translation memory (~/.cache/ppt-translator/tm.json)"
     )
     parser.add_argument(
         "--quiet", "-q",
@@ -752,25 +1377,28 @@ def main():
         sys.exit(1)
 
     try:
-        translator = SlideTranslator(
+        with SlideTranslator(
             input_pptx=args.input,
             output_pptx=args.output,
             work_dir=args.work_dir,
-            verbose=not args.quiet
-        )
-
-        # Parse slides argument
-        slide_indices = parse_slides_arg(args.slides, translator.slide_count)
-
-        if not slide_indices:
-            print(f"ERROR: No valid slides specified")
-            sys.exit(1)
-
-        translator.translate_slides(
-            slide_indices=slide_indices,
-            translator=args.translator,
-            api_key=args.api_key
-        )
+            verbose=not args.quiet,
+            max_concurrency=args.concurrency,
+            max_workers=args.workers,
+            use_cache=not args.no_cache,
+            debug=args.debug
+        ) as translator:
+            # Parse slides argument
+            slide_indices = parse_slides_arg(args.slides, translator.slide_count)
+
+            if not slide_indices:
+                print(f"ERROR: No valid slides specified")
+                sys.exit(1)
+
+            translator.translate_slides(
+                slide_indices=slide_indices,
+                translator=args.translator,
+                api_key=args.api_key
+            )
 
     except Exception as e:
         print(f"\nERROR: {e}")
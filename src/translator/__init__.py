@@ -3,15 +3,30 @@
 
 from .visual_engine import RTLVisualEngine
 from .content_processor import ContentProcessor
-from .text_translator import TextTranslator, TranslatedSlide, TranslationError
-from .llm_prompts import get_translation_messages, get_anthropic_prompt
+from .translation_memory import TranslationMemory
 
 __all__ = [
     "RTLVisualEngine",
     "ContentProcessor",
     "TextTranslator",
     "TranslatedSlide",
+    "TranslatedDeck",
     "TranslationError",
-    "get_translation_messages",
+    "TranslationMemory",
     "get_anthropic_prompt",
+    "merge_with_original",
 ]
+
+# text_translator pulls in pydantic (and dotenv); import it only on first use
+# so mock runs and the XML pipeline start fast.
+_LAZY_EXPORTS = {
+    "TextTranslator", "TranslatedSlide", "TranslatedDeck", "TranslationError",
+    "get_anthropic_prompt", "merge_with_original",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from . import text_translator
+        return getattr(text_translator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -15,11 +15,22 @@ Key features:
 - Preserves formatting and structure during injection
 """
 
-import json
+import io
 import os
-from typing import Dict, List, Optional, Any
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional, Any, Set, Union
 from lxml import etree
 
+try:
+    from . import json_codec
+    from .content_processor import shared_parser, strip_unused_namespaces
+except ImportError:  # Running this module directly as a script
+    import json_codec
+    from content_processor import shared_parser, strip_unused_namespaces
+
+# XML input: a file path, raw XML bytes, or an already parsed element
+XMLSource = Union[str, bytes, etree._Element]
+
 
 # ============================================================================
 # NAMESPACE CONFIGURATION
@@ -43,6 +54,25 @@ def qn(tag: str) -> str:
     return f"{{{NS[prefix]}}}{local}"
 
 
+# Clark-notation tags of the parts chart text extraction streams over
+_TAG_CHART = qn("c:chart")
+_TAG_TITLE = qn("c:title")
+_TAG_SER = qn("c:ser")
+
+# Clark-notation tags for per-series/per-point lookups and created elements
+_TAG_IDX = qn("c:idx")
+_TAG_V = qn("c:v")
+_TAG_BARDIR = qn("c:barDir")
+_TAG_SCALING = qn("c:scaling")
+_TAG_AXID = qn("c:axId")
+_TAG_ORIENTATION = qn("c:orientation")
+
+
+def _first(nodes: List[etree._Element]) -> Optional[etree._Element]:
+    """First node of an XPath result (like find()), or None."""
+    return nodes[0] if nodes else None
+
+
 # ============================================================================
 # CHART PROCESSOR
 # ============================================================================
@@ -56,16 +86,34 @@ class ChartProcessor:
     3. inject_chart_text() -> Updates chart XML with translated text
     """
 
+    # Compiled once (namespaces pre-bound) instead of re-parsing path strings per call
+    _XP_TITLE_T = etree.XPath(".//c:chart/c:title/c:tx/c:rich/a:p/a:r/a:t", namespaces=NS)
+    _XP_TITLE_RPR = etree.XPath(".//c:chart/c:title/c:tx/c:rich/a:p/a:r/a:rPr", namespaces=NS)
+    _XP_TITLE_RUN_T = etree.XPath("./c:tx/c:rich/a:p/a:r/a:t", namespaces=NS)
+    _XP_SER = etree.XPath(".//c:ser", namespaces=NS)
+    _XP_SER_NAME = etree.XPath(".//c:tx/c:strRef/c:strCache/c:pt/c:v", namespaces=NS)
+    _XP_CAT_PT = etree.XPath(".//c:cat/c:strRef/c:strCache/c:pt", namespaces=NS)
+    _XP_BARCHART = etree.XPath(".//c:barChart", namespaces=NS)
+    _XP_VALAX = etree.XPath(".//c:valAx", namespaces=NS)
+
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
-        self.parser = etree.XMLParser(remove_blank_text=False)
+        self._created_dirs: Set[str] = set()  # output dirs already made by _write_xml
+
+    def _parse(self, source: XMLSource) -> etree._ElementTree:
+        """Parse a path or XML bytes; an element is used as-is (edited in place)."""
+        if isinstance(source, etree._Element):
+            return source.getroottree()
+        if isinstance(source, bytes):
+            return etree.ElementTree(etree.fromstring(source, shared_parser()))
+        return etree.parse(source, shared_parser())
 
     # ========================================================================
     # EXTRACTION
     # ========================================================================
-    def extract_chart_text(self, chart_xml_path: str) -> Dict[str, Any]:
+    def extract_chart_text(self, chart_xml: XMLSource) -> Dict[str, Any]:
         """
-        Extract all text content from a chart XML file.
+        Extract all text content from a chart XML (path, bytes or parsed element).
 
         Returns a JSON-serializable structure:
         {
@@ -77,46 +125,46 @@ class ChartProcessor:
             "categories": ["Product A", "Product B", "Product C"]
         }
         """
-        tree = etree.parse(chart_xml_path, self.parser)
-        root = tree.getroot()
-
         result = {
             "chart_title": None,
             "series": [],
             "categories": []
         }
 
-        # Extract chart title
-        title_elem = root.find(".//c:chart/c:title/c:tx/c:rich/a:p/a:r/a:t", NS)
-        if title_elem is not None and title_elem.text:
-            result["chart_title"] = title_elem.text
+        series_count = 0
+        for part in self._iter_chart_parts(chart_xml):
+            if part.tag == _TAG_TITLE:
+                # Extract chart title (axis titles live under c:valAx/c:catAx)
+                if result["chart_title"] is None and part.getparent().tag == _TAG_CHART:
+                    title_elem = _first(self._XP_TITLE_RUN_T(part))
+                    if title_elem is not None and title_elem.text:
+                        result["chart_title"] = title_elem.text
+                continue
 
-        # Extract series names (legend labels)
-        series_elements = root.findall(".//c:ser", NS)
-        for idx, ser in enumerate(series_elements):
-            ser_idx = ser.find("c:idx", NS)
-            ser_order = ser.find("c:order", NS)
+            # Extract series names (legend labels)
+            ser = part
+            ser_idx = ser.find(_TAG_IDX)
 
             # Get series ID
-            series_id = ser_idx.get("val") if ser_idx is not None else str(idx)
+            series_id = ser_idx.get("val") if ser_idx is not None else str(series_count)
 
             # Get series name
-            ser_name_elem = ser.find(".//c:tx/c:strRef/c:strCache/c:pt/c:v", NS)
+            ser_name_elem = _first(self._XP_SER_NAME(ser))
             if ser_name_elem is not None and ser_name_elem.text:
                 result["series"].append({
                     "id": series_id,
                     "name": ser_name_elem.text
                 })
 
-        # Extract categories (X-axis labels)
-        # Categories are usually in the first series' <c:cat> element
-        first_series = root.find(".//c:ser", NS)
-        if first_series is not None:
-            cat_elements = first_series.findall(".//c:cat/c:strRef/c:strCache/c:pt", NS)
-            for cat_pt in cat_elements:
-                cat_v = cat_pt.find("c:v", NS)
-                if cat_v is not None and cat_v.text:
-                    result["categories"].append(cat_v.text)
+            # Extract categories (X-axis labels)
+            # Categories are usually in the first series' <c:cat> element
+            if series_count == 0:
+                for cat_pt in self._XP_CAT_PT(ser):
+                    cat_v = cat_pt.find(_TAG_V)
+                    if cat_v is not None and cat_v.text:
+                        result["categories"].append(cat_v.text)
+
+            series_count += 1
 
         if self.verbose:
             print(f"[ChartProcessor] Extracted chart text:")
@@ -126,98 +174,154 @@ class ChartProcessor:
 
         return result
 
+    @classmethod
+    def extract_many(
+        cls,
+        chart_xmls: List[Union[str, bytes]],
+        executor: Optional[Executor] = None,
+        max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract chart text from many XMLs, in the given process pool if any.
+
+        Each unit is an independent parse -> dict, so this scales with cores.
+        The pool is owned by the caller (SlideTranslator shares one across
+        pipeline stages); without one, everything runs inline.
+
+        Args:
+            chart_xmls: Paths or raw XML bytes (parsed elements can't be sent
+                   to other processes)
+            executor: Process pool to run in (None: inline)
+            max_workers: Worker count of the pool, used to size chunks
+
+        Returns:
+            Extracted JSON per input, in input order
+        """
+        if executor is None:
+            return [_extract_chart_worker(xml) for xml in chart_xmls]
+
+        chunksize = max(1, len(chart_xmls) // (4 * max(1, max_workers)))
+        return list(executor.map(_extract_chart_worker, chart_xmls, chunksize=chunksize))
+
+    def _iter_chart_parts(self, chart_xml: XMLSource) -> Iterator[etree._Element]:
+        """
+        Yield every c:title and c:ser element in document order.
+
+        Paths and bytes are streamed with iterparse: each part is yielded once
+        its subtree is complete, then cleared (along with already processed
+        siblings), so the rest of the chart (data caches, formatting) is never
+        kept around.
+        """
+        if isinstance(chart_xml, etree._Element):
+            yield from list(chart_xml.iter(_TAG_TITLE, _TAG_SER))
+            return
+
+        source = io.BytesIO(chart_xml) if isinstance(chart_xml, bytes) else chart_xml
+        parts = etree.iterparse(
+            source, events=("end",), tag=(_TAG_TITLE, _TAG_SER), collect_ids=False,
+            resolve_entities=False
+        )
+        for _, part in parts:
+            yield part
+            part.clear(keep_tail=True)
+            parent = part.getparent()
+            while part.getprevious() is not None:
+                del parent[0]
+
     # ========================================================================
     # INJECTION
     # ========================================================================
     def inject_chart_text(
         self,
-        chart_xml_path: str,
+        chart_xml: XMLSource,
         translated_json: Dict[str, Any],
-        output_path: str
-    ) -> None:
+        output_path: Optional[str] = None
+    ) -> etree._Element:
         """
         Inject translated text back into the chart XML.
 
         Args:
-            chart_xml_path: Path to the original chart XML
+            chart_xml: The original chart XML: a path, bytes, or a parsed
+                       root element (updated in place)
             translated_json: JSON with translated chart text
-            output_path: Path to save the modified chart XML
+            output_path: Optional path to also save the modified chart XML
+
+        Returns:
+            The updated root element
         """
-        tree = etree.parse(chart_xml_path, self.parser)
+        tree = self._parse(chart_xml)
         root = tree.getroot()
 
         updated_count = 0
 
         # Update chart title
         if "chart_title" in translated_json and translated_json["chart_title"]:
-            title_elem = root.find(".//c:chart/c:title/c:tx/c:rich/a:p/a:r/a:t", NS)
+            title_elem = _first(self._XP_TITLE_T(root))
             if title_elem is not None:
                 title_elem.text = translated_json["chart_title"]
                 updated_count += 1
 
                 # Update language attribute for title
-                r_pr = root.find(".//c:chart/c:title/c:tx/c:rich/a:p/a:r/a:rPr", NS)
+                r_pr = _first(self._XP_TITLE_RPR(root))
                 if r_pr is not None:
                     r_pr.set("lang", "ar-SA")
 
-        # Update series names
-        if "series" in translated_json:
-            series_map = {s["id"]: s["name"] for s in translated_json["series"]}
-
-            series_elements = root.findall(".//c:ser", NS)
-            for ser in series_elements:
-                ser_idx = ser.find("c:idx", NS)
-                if ser_idx is not None:
-                    series_id = ser_idx.get("val")
-                    if series_id in series_map:
-                        # Update series name
-                        ser_name_elem = ser.find(".//c:tx/c:strRef/c:strCache/c:pt/c:v", NS)
-                        if ser_name_elem is not None:
-                            ser_name_elem.text = series_map[series_id]
-                            updated_count += 1
-
-        # Update categories
-        if "categories" in translated_json and translated_json["categories"]:
+        # Series names and categories both live under c:ser: walk the series once
+        series_map = {s["id"]: s["name"] for s in translated_json.get("series", ())}
+        categories = translated_json.get("categories") or []
+
+        series_elements = self._XP_SER(root) if series_map or categories else []
+        for ser_i, ser in enumerate(series_elements):
+            # Update series name
+            ser_idx = ser.find(_TAG_IDX)
+            if ser_idx is not None:
+                name = series_map.get(ser_idx.get("val"))
+                if name is not None:
+                    ser_name_elem = _first(self._XP_SER_NAME(ser))
+                    if ser_name_elem is not None:
+                        ser_name_elem.text = name
+                        updated_count += 1
+
             # Update categories in all series (they should all have the same categories)
-            series_elements = root.findall(".//c:ser", NS)
-            for ser in series_elements:
-                cat_elements = ser.findall(".//c:cat/c:strRef/c:strCache/c:pt", NS)
-                for i, cat_pt in enumerate(cat_elements):
-                    if i < len(translated_json["categories"]):
-                        cat_v = cat_pt.find("c:v", NS)
-                        if cat_v is not None:
-                            cat_v.text = translated_json["categories"][i]
-                            # Only count once (not for each series)
-                            if ser == series_elements[0]:
-                                updated_count += 1
+            if categories:
+                cats_updated = 0
+                for cat_pt, category in zip(self._XP_CAT_PT(ser), categories):
+                    cat_v = cat_pt.find(_TAG_V)
+                    if cat_v is not None:
+                        cat_v.text = category
+                        cats_updated += 1
+
+                # Only count once (not for each series)
+                if ser_i == 0:
+                    updated_count += cats_updated
 
         # RTL Bar Chart Adjustment: Flip horizontal bar charts
         # For horizontal bar charts (barDir="bar"), reverse the value axis orientation
         # so bars grow from right to left instead of left to right
-        bar_chart = root.find(".//c:barChart", NS)
+        bar_chart = _first(self._XP_BARCHART(root))
         if bar_chart is not None:
-            bar_dir = bar_chart.find("c:barDir", NS)
+            bar_dir = bar_chart.find(_TAG_BARDIR)
             # barDir="bar" means horizontal bars (as opposed to "col" for vertical columns)
             if bar_dir is not None and bar_dir.get("val") == "bar":
                 # Find the value axis (the horizontal axis for bar charts)
-                val_ax = root.find(".//c:valAx", NS)
+                val_ax = _first(self._XP_VALAX(root))
                 if val_ax is not None:
                     # Find or create the scaling element
-                    scaling = val_ax.find("c:scaling", NS)
+                    scaling = val_ax.find(_TAG_SCALING)
                     if scaling is None:
                         # Insert scaling before axId
-                        ax_id = val_ax.find("c:axId", NS)
+                        ax_id = val_ax.find(_TAG_AXID)
                         if ax_id is not None:
                             idx = list(val_ax).index(ax_id)
-                            scaling = etree.Element(f"{{{NS['c']}}}scaling")
+                            scaling = etree.Element(_TAG_SCALING)
                             val_ax.insert(idx, scaling)
                         else:
-                            scaling = etree.SubElement(val_ax, f"{{{NS['c']}}}scaling")
+                            scaling = etree.SubElement(val_ax, _TAG_SCALING)
 
                     # Find or create orientation element
-                    orientation = scaling.find("c:orientation", NS)
+                    orientation = scaling.find(_TAG_ORIENTATION)
                     if orientation is None:
-                        orientation = etree.SubElement(scaling, f"{{{NS['c']}}}orientation")
+                        orientation = etree.SubElement(scaling, _TAG_ORIENTATION)
 
                     # Set orientation to maxMin to reverse bar direction (RTL)
                     orientation.set("val", "maxMin")
@@ -226,28 +330,46 @@ class ChartProcessor:
                     if self.verbose:
                         print(f"[ChartProcessor] Flipped horizontal bar chart to RTL")
 
+        strip_unused_namespaces(root)
+
         # Save output
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        tree.write(output_path, encoding="UTF-8", xml_declaration=True)
+        if output_path:
+            self._write_xml(tree, output_path)
 
         if self.verbose:
             print(f"[ChartProcessor] Updated {updated_count} text elements")
-            print(f"[ChartProcessor] Saved to: {output_path}")
+            if output_path:
+                print(f"[ChartProcessor] Saved to: {output_path}")
+
+        return root
 
     # ========================================================================
     # UTILITIES
     # ========================================================================
+    def _write_xml(self, tree: etree._ElementTree, output_path: str) -> None:
+        """Write XML through a 1 MiB buffer, creating each output dir only once."""
+        out_dir = os.path.dirname(output_path) or "."
+        if out_dir not in self._created_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            self._created_dirs.add(out_dir)
+
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            tree.write(f, encoding="UTF-8", xml_declaration=True)
+
     def save_json(self, content: Dict[str, Any], output_path: str) -> None:
         """Save extracted chart content to a JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
+        json_codec.dump_file(content, output_path)
         if self.verbose:
             print(f"[ChartProcessor] JSON saved to: {output_path}")
 
     def load_json(self, input_path: str) -> Dict[str, Any]:
         """Load chart content from a JSON file."""
-        with open(input_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_codec.load_file(input_path)
+
+
+def _extract_chart_worker(xml: Union[str, bytes]) -> Dict[str, Any]:
+    """Process-pool entry point for ChartProcessor.extract_many (one quiet processor per call)."""
+    return ChartProcessor(verbose=False).extract_chart_text(xml)
 
 
 # ============================================================================
@@ -279,7 +401,7 @@ if __name__ == "__main__":
     processor.save_json(chart_content, OUTPUT_JSON)
 
     print("\nExtracted chart content:")
-    print(json.dumps(chart_content, ensure_ascii=False, indent=2))
+    print(json_codec.dumps(chart_content, indent=True))
 
     # 2. Simulate translation
     print(f"\n{'='*50}")
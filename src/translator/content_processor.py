@@ -12,12 +12,23 @@ Key features:
 - Maintains paragraph/run structure for complex text
 """
 
-import json
+import io
 import os
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import Executor
+from typing import Dict, Iterator, List, Optional, Any, Set, Union
 from dataclasses import dataclass
+from operator import attrgetter
 from lxml import etree
 
+try:
+    from . import json_codec
+except ImportError:  # Running this module directly as a script
+    import json_codec
+
+# XML input: a file path, raw XML bytes, or an already parsed element
+XMLSource = Union[str, bytes, etree._Element]
+
 
 # ============================================================================
 # NAMESPACE CONFIGURATION
@@ -41,6 +52,76 @@ def qn(tag: str) -> str:
     return f"{{{NS[prefix]}}}{local}"
 
 
+# Clark-notation tags: find()/iter() with a plain tag skips ElementPath prefix
+# resolution and stays in lxml's C layer
+_TAG_SP = qn("p:sp")
+_TAG_NVSPPR = qn("p:nvSpPr")
+_TAG_CNVPR = qn("p:cNvPr")
+_TAG_NVPR = qn("p:nvPr")
+_TAG_PH = qn("p:ph")
+_TAG_TXBODY = qn("p:txBody")
+_TAG_SPPR = qn("p:spPr")
+_TAG_P = qn("a:p")
+_TAG_PPR = qn("a:pPr")
+_TAG_R = qn("a:r")
+_TAG_RPR = qn("a:rPr")
+_TAG_T = qn("a:t")
+_PATH_CNVPR = f"{_TAG_NVSPPR}/{_TAG_CNVPR}"  # direct grandchild, no descendant scan
+
+# Per-shape/paragraph lookups evaluated in libxml2 instead of Python loops
+_XP_RUN_TEXT = etree.XPath("a:r/a:t/text()", namespaces=NS, smart_strings=False)
+_XP_FIELD_TEXT = etree.XPath("a:fld/a:t/text()", namespaces=NS, smart_strings=False)
+_XP_Y = etree.XPath("string(a:xfrm/a:off/@y)", namespaces=NS)
+_XP_ANY_BOLD = etree.XPath("boolean(a:r/a:rPr[@b='1' or @b='true'])", namespaces=NS)
+
+
+# Markup-compatibility attributes name namespace prefixes inside their values
+# (e.g. <mc:Choice xmlns:v="..." Requires="v">), which cleanup_namespaces can't see
+MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+_XP_MC_PREFIX_VALUES = etree.XPath(
+    "//@mc:Ignorable | //@mc:ProcessContent | //@mc:MustUnderstand | //mc:Choice/@Requires",
+    namespaces={"mc": MC_NS}
+)
+
+
+def strip_unused_namespaces(root: etree._Element) -> None:
+    """
+    Remove xmlns declarations no element or attribute uses (one C-level pass).
+
+    Prefixes referenced by markup-compatibility attribute values are kept;
+    dropping them makes PowerPoint reject the part.
+    """
+    keep = {
+        token.split(":", 1)[0]
+        for value in _XP_MC_PREFIX_VALUES(root)
+        for token in value.split()
+    }
+    etree.cleanup_namespaces(root, keep_ns_prefixes=sorted(keep))
+
+
+_parser_local = threading.local()
+
+
+def shared_parser() -> etree.XMLParser:
+    """
+    Return this thread's reusable OOXML parser.
+
+    One parser per thread rather than per processor instance: lxml locks a
+    parser while it is in use, so chart threads sharing one would serialize.
+    OOXML has no xml:id attributes or external entities, so the ID table and
+    entity/network resolution are switched off.
+    """
+    parser = getattr(_parser_local, "parser", None)
+    if parser is None:
+        parser = _parser_local.parser = etree.XMLParser(
+            remove_blank_text=False,
+            collect_ids=False,
+            resolve_entities=False,
+            no_network=True
+        )
+    return parser
+
+
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
@@ -83,14 +164,22 @@ class ContentProcessor:
 
     def __init__(self, verbose: bool = True):
         self.verbose = verbose
-        self.parser = etree.XMLParser(remove_blank_text=False)
+        self._created_dirs: Set[str] = set()  # output dirs already made by _write_xml
+
+    def _parse(self, source: XMLSource) -> etree._ElementTree:
+        """Parse a path or XML bytes; an element is used as-is (edited in place)."""
+        if isinstance(source, etree._Element):
+            return source.getroottree()
+        if isinstance(source, bytes):
+            return etree.ElementTree(etree.fromstring(source, shared_parser()))
+        return etree.parse(source, shared_parser())
 
     # ========================================================================
     # EXTRACTION
     # ========================================================================
-    def extract_content_for_llm(self, slide_xml_path: str) -> Dict[str, Any]:
+    def extract_content_for_llm(self, slide_xml: XMLSource) -> Dict[str, Any]:
         """
-        Extract text content from a slide XML file.
+        Extract text content from a slide XML (path, bytes or parsed element).
 
         Returns a JSON-serializable structure suitable for LLM translation:
         {
@@ -108,21 +197,16 @@ class ContentProcessor:
             ]
         }
         """
-        tree = etree.parse(slide_xml_path, self.parser)
-        root = tree.getroot()
-
         extracted_elements: List[TextElement] = []
 
         # Find all shapes with text bodies
-        shapes = root.findall(".//p:sp", NS)
-
-        for shape in shapes:
+        for shape in self._iter_shapes(slide_xml):
             element = self._extract_shape_content(shape)
             if element and element.original_text.strip():
                 extracted_elements.append(element)
 
         # Sort by Y position (top to bottom reading order)
-        extracted_elements.sort(key=lambda e: e.y_position)
+        extracted_elements.sort(key=attrgetter("y_position"))
 
         # Build output JSON
         output = {
@@ -146,14 +230,74 @@ class ContentProcessor:
 
         return output
 
+    @classmethod
+    def extract_many(
+        cls,
+        slide_xmls: List[Union[str, bytes]],
+        executor: Optional[Executor] = None,
+        max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract slide content from many XMLs, in the given process pool if any.
+
+        Each unit is an independent parse -> dict, so this scales with cores.
+        The pool is owned by the caller (SlideTranslator shares one across
+        pipeline stages); without one, everything runs inline.
+
+        Args:
+            slide_xmls: Paths or raw XML bytes (parsed elements can't be sent
+                   to other processes)
+            executor: Process pool to run in (None: inline)
+            max_workers: Worker count of the pool, used to size chunks
+
+        Returns:
+            Extracted JSON per input, in input order
+        """
+        if executor is None:
+            return [_extract_content_worker(xml) for xml in slide_xmls]
+
+        chunksize = max(1, len(slide_xmls) // (4 * max(1, max_workers)))
+        return list(executor.map(_extract_content_worker, slide_xmls, chunksize=chunksize))
+
+    def _iter_shapes(self, slide_xml: XMLSource) -> Iterator[etree._Element]:
+        """
+        Yield every p:sp shape in document order.
+
+        Paths and bytes are streamed with iterparse: each shape is yielded once
+        its subtree is complete, then cleared (along with already processed
+        siblings) so peak memory stays bounded on large slides.
+        """
+        if isinstance(slide_xml, etree._Element):
+            yield from list(slide_xml.iter(_TAG_SP))
+            return
+
+        source = io.BytesIO(slide_xml) if isinstance(slide_xml, bytes) else slide_xml
+        for _, shape in etree.iterparse(source, events=("end",), tag=_TAG_SP, collect_ids=False,
+                                         resolve_entities=False):
+            yield shape
+            shape.clear()
+            parent = shape.getparent()
+            while shape.getprevious() is not None:
+                del parent[0]
+
     def _extract_shape_content(self, shape: etree._Element) -> Optional[TextElement]:
         """Extract content from a single shape."""
+        # One pass over the shape's direct children (first of each tag wins, like find())
+        nv_sp_pr = tx_body = sp_pr = None
+        for child in shape:
+            tag = child.tag
+            if tag == _TAG_NVSPPR:
+                nv_sp_pr = child if nv_sp_pr is None else nv_sp_pr
+            elif tag == _TAG_TXBODY:
+                tx_body = child if tx_body is None else tx_body
+            elif tag == _TAG_SPPR:
+                sp_pr = child if sp_pr is None else sp_pr
+
         # Get shape ID and name
-        nv_sp_pr = shape.find("p:nvSpPr", NS)
         if nv_sp_pr is None:
             return None
 
-        c_nv_pr = nv_sp_pr.find("p:cNvPr", NS)
+        c_nv_pr = nv_sp_pr.find(_TAG_CNVPR)
         if c_nv_pr is None:
             return None
 
@@ -161,7 +305,6 @@ class ContentProcessor:
         shape_name = c_nv_pr.get("name", "")
 
         # Get text body
-        tx_body = shape.find("p:txBody", NS)
         if tx_body is None:
             return None
 
@@ -169,7 +312,7 @@ class ContentProcessor:
         role = self._determine_role(nv_sp_pr)
 
         # Get Y position for sorting
-        y_pos = self._get_y_position(shape)
+        y_pos = self._get_y_position(sp_pr)
 
         # Extract paragraphs with hierarchy info
         paragraphs = self._extract_paragraphs(tx_body)
@@ -196,9 +339,9 @@ class ContentProcessor:
     def _determine_role(self, nv_sp_pr: etree._Element) -> str:
         """Determine the semantic role of a shape."""
         # Check for placeholder type
-        nv_pr = nv_sp_pr.find("p:nvPr", NS)
+        nv_pr = nv_sp_pr.find(_TAG_NVPR)
         if nv_pr is not None:
-            ph = nv_pr.find("p:ph", NS)
+            ph = nv_pr.find(_TAG_PH)
             if ph is not None:
                 ph_type = ph.get("type", "")
                 if ph_type in self.TITLE_TYPES:
@@ -210,27 +353,18 @@ class ContentProcessor:
 
         return "content"
 
-    def _get_y_position(self, shape: etree._Element) -> int:
-        """Get the Y coordinate of a shape for sorting."""
-        sp_pr = shape.find("p:spPr", NS)
+    def _get_y_position(self, sp_pr: Optional[etree._Element]) -> int:
+        """Get the Y coordinate of a shape (from its p:spPr) for sorting."""
         if sp_pr is None:
             return 999999
 
-        xfrm = sp_pr.find("a:xfrm", NS)
-        if xfrm is None:
-            return 999999
-
-        off = xfrm.find("a:off", NS)
-        if off is None:
-            return 999999
-
-        return int(off.get("y", "999999"))
+        return int(_XP_Y(sp_pr) or 999999)
 
     def _extract_paragraphs(self, tx_body: etree._Element) -> List[Dict[str, Any]]:
         """Extract all paragraphs with formatting info."""
         paragraphs = []
 
-        for p in tx_body.findall("a:p", NS):
+        for p in tx_body.iterchildren(_TAG_P):
             para_info = self._extract_paragraph(p)
             if para_info:
                 paragraphs.append(para_info)
@@ -240,35 +374,13 @@ class ContentProcessor:
     def _extract_paragraph(self, p: etree._Element) -> Optional[Dict[str, Any]]:
         """Extract a single paragraph's content and formatting."""
         # Get paragraph properties
-        p_pr = p.find("a:pPr", NS)
+        p_pr = p.find(_TAG_PPR)
         level = 0
         if p_pr is not None:
             level = int(p_pr.get("lvl", "0"))
 
-        # Extract text from all runs
-        text_parts = []
-        is_bold = False
-
-        for r in p.findall("a:r", NS):
-            # Check run properties for bold
-            r_pr = r.find("a:rPr", NS)
-            if r_pr is not None:
-                b = r_pr.get("b")
-                if b == "1" or b == "true":
-                    is_bold = True
-
-            # Get text content
-            t = r.find("a:t", NS)
-            if t is not None and t.text:
-                text_parts.append(t.text)
-
-        # Also check for text fields (a:fld)
-        for fld in p.findall("a:fld", NS):
-            t = fld.find("a:t", NS)
-            if t is not None and t.text:
-                text_parts.append(t.text)
-
-        text = "".join(text_parts)
+        # Extract text from all runs, then text fields (a:fld)
+        text = "".join(_XP_RUN_TEXT(p)) + "".join(_XP_FIELD_TEXT(p))
 
         if not text.strip():
             return None
@@ -276,7 +388,7 @@ class ContentProcessor:
         return {
             "text": text,
             "level": level,
-            "is_bold": is_bold
+            "is_bold": _XP_ANY_BOLD(p)  # Any bold run
         }
 
     # ========================================================================
@@ -284,10 +396,10 @@ class ContentProcessor:
     # ========================================================================
     def inject_translated_content(
         self,
-        slide_xml_path: str,
+        slide_xml: XMLSource,
         translated_json: Dict[str, Any],
-        output_path: str
-    ) -> None:
+        output_path: Optional[str] = None
+    ) -> etree._Element:
         """
         Inject translated text back into the slide XML.
 
@@ -295,11 +407,15 @@ class ContentProcessor:
         the slide, so RTL flags are already set. This method preserves those flags.
 
         Args:
-            slide_xml_path: Path to the (already RTL-transformed) slide XML
+            slide_xml: The (already RTL-transformed) slide XML: a path, bytes,
+                       or a parsed root element (updated in place)
             translated_json: JSON with translated elements
-            output_path: Path to save the final XML
+            output_path: Optional path to also save the final XML
+
+        Returns:
+            The updated root element
         """
-        tree = etree.parse(slide_xml_path, self.parser)
+        tree = self._parse(slide_xml)
         root = tree.getroot()
 
         # Build translation lookup map
@@ -309,28 +425,30 @@ class ContentProcessor:
         }
 
         # Find and update each shape
-        shapes = root.findall(".//p:sp", NS)
         updated_count = 0
 
-        for shape in shapes:
-            c_nv_pr = shape.find(".//p:cNvPr", NS)
+        for shape in list(root.iter(_TAG_SP)):
+            c_nv_pr = shape.find(_PATH_CNVPR)
             if c_nv_pr is None:
                 continue
 
-            shape_id = c_nv_pr.get("id", "")
-
-            if shape_id in translation_map:
-                translated = translation_map[shape_id]
+            translated = translation_map.get(c_nv_pr.get("id", ""))
+            if translated is not None:
                 self._update_shape_text(shape, translated)
                 updated_count += 1
 
+        strip_unused_namespaces(root)
+
         # Save output
-        os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
-        tree.write(output_path, encoding="UTF-8", xml_declaration=True)
+        if output_path:
+            self._write_xml(tree, output_path)
 
         if self.verbose:
             print(f"[ContentProcessor] Updated {updated_count} shapes")
-            print(f"[ContentProcessor] Saved to: {output_path}")
+            if output_path:
+                print(f"[ContentProcessor] Saved to: {output_path}")
+
+        return root
 
     def _update_shape_text(
         self,
@@ -346,7 +464,7 @@ class ContentProcessor:
         - If only 'text' is provided, split by newlines and create paragraphs
         - Preserve existing paragraph properties (alignment, RTL, etc.)
         """
-        tx_body = shape.find("p:txBody", NS)
+        tx_body = shape.find(_TAG_TXBODY)
         if tx_body is None:
             return
 
@@ -359,7 +477,7 @@ class ContentProcessor:
             new_paragraphs = [{"text": line} for line in text.split("\n")]
 
         # Get existing paragraphs
-        existing_paras = tx_body.findall("a:p", NS)
+        existing_paras = [c for c in tx_body if c.tag == _TAG_P]
 
         # Strategy: Update existing paragraphs where possible, add new ones if needed
         for i, new_para in enumerate(new_paragraphs):
@@ -390,21 +508,21 @@ class ContentProcessor:
         - First run's formatting (rPr) - font, size, color
         """
         # Find existing runs
-        runs = paragraph.findall("a:r", NS)
+        runs = [c for c in paragraph if c.tag == _TAG_R]
 
         if runs:
             # Update first run's text, remove others
             first_run = runs[0]
-            t = first_run.find("a:t", NS)
+            t = first_run.find(_TAG_T)
             if t is not None:
                 t.text = new_text
             else:
                 # Create text element
-                t = etree.SubElement(first_run, qn("a:t"))
+                t = etree.SubElement(first_run, _TAG_T)
                 t.text = new_text
 
             # Ensure run has Arabic language set
-            r_pr = first_run.find("a:rPr", NS)
+            r_pr = first_run.find(_TAG_RPR)
             if r_pr is not None:
                 r_pr.set("lang", "ar-SA")
 
@@ -421,10 +539,10 @@ class ContentProcessor:
         text: str
     ) -> etree._Element:
         """Create a new paragraph with RTL properties."""
-        p = etree.SubElement(tx_body, qn("a:p"))
+        p = etree.SubElement(tx_body, _TAG_P)
 
         # Add paragraph properties with RTL
-        p_pr = etree.SubElement(p, qn("a:pPr"))
+        p_pr = etree.SubElement(p, _TAG_PPR)
         p_pr.set("rtl", "1")
         p_pr.set("algn", "r")
 
@@ -439,15 +557,15 @@ class ContentProcessor:
         text: str
     ) -> etree._Element:
         """Create a new text run with Arabic language."""
-        r = etree.SubElement(paragraph, qn("a:r"))
+        r = etree.SubElement(paragraph, _TAG_R)
 
         # Run properties
-        r_pr = etree.SubElement(r, qn("a:rPr"))
+        r_pr = etree.SubElement(r, _TAG_RPR)
         r_pr.set("lang", "ar-SA")
         r_pr.set("dirty", "0")
 
         # Text content
-        t = etree.SubElement(r, qn("a:t"))
+        t = etree.SubElement(r, _TAG_T)
         t.text = text
 
         return r
@@ -455,50 +573,57 @@ class ContentProcessor:
     # ========================================================================
     # UTILITIES
     # ========================================================================
+    def _write_xml(self, tree: etree._ElementTree, output_path: str) -> None:
+        """Write XML through a 1 MiB buffer, creating each output dir only once."""
+        out_dir = os.path.dirname(output_path) or "."
+        if out_dir not in self._created_dirs:
+            os.makedirs(out_dir, exist_ok=True)
+            self._created_dirs.add(out_dir)
+
+        with open(output_path, "wb", buffering=1 << 20) as f:
+            tree.write(f, encoding="UTF-8", xml_declaration=True)
+
     def save_json(self, content: Dict[str, Any], output_path: str) -> None:
         """Save extracted content to a JSON file."""
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
+        json_codec.dump_file(content, output_path)
         if self.verbose:
             print(f"[ContentProcessor] JSON saved to: {output_path}")
 
     def load_json(self, input_path: str) -> Dict[str, Any]:
         """Load content from a JSON file."""
-        with open(input_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return json_codec.load_file(input_path)
+
+
+def _extract_content_worker(xml: Union[str, bytes]) -> Dict[str, Any]:
+    """Process-pool entry point for ContentProcessor.extract_many (one quiet processor per call)."""
+    return ContentProcessor(verbose=False).extract_content_for_llm(xml)
 
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 if __name__ == "__main__":
-    import glob
     import datetime
+    try:
+        from .harness import latest_matching
+    except ImportError:  # Running this module directly as a script
+        from harness import latest_matching
 
     processor = ContentProcessor(verbose=True)
 
     # Timestamp for output files
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Find the latest source XML file (pattern: slide*_structure*.xml or slide*.xml)
-    source_patterns = [
-        "output_xmls/slide*_structure*.xml",
-        "output_xmls/slide*.xml",
-        "slide*_structure*.xml",
-        "slide*.xml",
-    ]
-
-    source_files = []
-    for pattern in source_patterns:
-        source_files.extend(glob.glob(pattern))
+    # Find the latest source XML file (slide*.xml, including slide*_structure*.xml)
+    source_dirs = ["output_xmls", "."]
+    source_patterns = ["slide*.xml"]
 
-    if not source_files:
+    SOURCE_XML = latest_matching(source_dirs, source_patterns)
+    if SOURCE_XML is None:
         print("ERROR: No slide XML files found. Run the extractor first.")
-        print(f"Searched patterns: {source_patterns}")
+        print(f"Searched patterns: {source_patterns} in {source_dirs}")
         exit(1)
 
-    # Pick the latest file by modification time
-    SOURCE_XML = max(source_files, key=os.path.getmtime)
     OUTPUT_JSON = f"output_xmls/slide_content_{timestamp}.json"
 
     print(f"\n{'='*50}")
@@ -515,7 +640,7 @@ if __name__ == "__main__":
     processor.save_json(content, OUTPUT_JSON)
 
     print("\nExtracted content structure:")
-    print(json.dumps(content, ensure_ascii=False, indent=2)[:1000] + "...")
+    print(json_codec.dumps(content, indent=True)[:1000] + "...")
 
     # 2. Simulate translation (for testing)
     print(f"\n{'='*50}")
@@ -532,17 +657,10 @@ if __name__ == "__main__":
 
     # 3. Test injection (if RTL XML exists)
     # Find most recent RTL file
-    rtl_patterns = [
-        "output_xmls/slide*_RTL*.xml",
-        "output_xmls/*_rtl*.xml",
-    ]
-
-    rtl_files = []
-    for pattern in rtl_patterns:
-        rtl_files.extend(glob.glob(pattern))
+    rtl_patterns = ["slide*_RTL*.xml", "*_rtl*.xml"]
+    RTL_XML = latest_matching(["output_xmls"], rtl_patterns)
 
-    if rtl_files:
-        RTL_XML = max(rtl_files, key=os.path.getmtime)
+    if RTL_XML is not None:
         FINAL_XML = f"output_xmls/slide_Final_{timestamp}.xml"
 
         print(f"\nUsing RTL file: {RTL_XML}")
@@ -552,5 +670,5 @@ if __name__ == "__main__":
         print(f"Final output: {FINAL_XML}")
     else:
         print(f"\nNo RTL XML found. Run the Visual Engine first.")
-        print(f"Searched patterns: {rtl_patterns}")
+        print(f"Searched patterns: {rtl_patterns} in output_xmls")
         print("Skipping injection test.")
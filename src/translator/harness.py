@@ -0,0 +1,48 @@
+# src/translator/harness.py
+"""
+Helpers shared by the modules' __main__ test harnesses.
+
+Not used by the pipeline itself; the harnesses import it to pick up the
+latest files written by the previous step (extractor, processor, engine).
+"""
+
+import fnmatch
+import os
+from typing import List, Optional, Tuple
+
+
+def latest_matching(
+    dirs: List[str],
+    patterns: List[str],
+    exclude: Tuple[str, ...] = ()
+) -> Optional[str]:
+    """
+    Most recently modified file in dirs whose name matches any pattern.
+
+    One os.scandir pass per directory (instead of one glob per pattern);
+    names containing an exclude substring (compared lowercased) are
+    skipped, and only the remaining matches are stat()ed.
+
+    Args:
+        dirs: Directories to search (missing ones are ignored)
+        patterns: fnmatch patterns, matched case-sensitively
+        exclude: Lowercase substrings that disqualify a name
+
+    Returns:
+        Path of the newest matching file, or None if there is none
+    """
+    latest, latest_mtime = None, -1
+    for d in dirs:
+        if not os.path.isdir(d):
+            continue
+        with os.scandir(d) as it:
+            for entry in it:
+                name = entry.name
+                if not any(fnmatch.fnmatchcase(name, pat) for pat in patterns):
+                    continue
+                if any(x in name.lower() for x in exclude):
+                    continue
+                mtime = entry.stat().st_mtime_ns
+                if mtime > latest_mtime and entry.is_file():
+                    latest, latest_mtime = os.path.join(d, name), mtime
+    return latest
@@ -0,0 +1,61 @@
+# src/translator/http_pool.py
+"""
+Pooled HTTP Client for Slide Translator
+
+Builds one keep-alive httpx.AsyncClient per run for the async OpenAI and
+Anthropic SDK clients, so every slide/master/layout/chart request reuses
+the same TCP+TLS connections instead of paying the handshake again.
+
+Key features:
+- Connection pool sized to the run's concurrency
+- HTTP/2 (request multiplexing) when the h2 package is installed
+- Falls back to the SDK's default client if httpx is unavailable
+- Shared retry budget: the SDKs retry 429/5xx with exponential backoff
+  (honouring Retry-After), which concurrent bursts rely on
+
+Optional: pip install "httpx[http2]"
+"""
+
+import importlib.util
+from typing import Any, Optional
+
+
+DEFAULT_MAX_CONNECTIONS = 50
+DEFAULT_MAX_KEEPALIVE = 20
+DEFAULT_MAX_RETRIES = 5  # SDK default is 2, too few when many requests are in flight
+
+
+def create_async_http_client(
+    sdk: Any,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE
+) -> Optional[Any]:
+    """
+    Create a pooled async HTTP client for an LLM SDK.
+
+    Args:
+        sdk: The imported SDK module (openai or anthropic); its
+             DefaultAsyncHttpxClient keeps the SDK's timeouts and redirects
+        max_connections: Upper bound on open connections
+        max_keepalive_connections: Idle connections kept open for reuse
+
+    Returns:
+        An httpx.AsyncClient to pass as http_client=..., or None to let the
+        SDK create its own (httpx missing or SDK too old)
+    """
+    client_cls = getattr(sdk, "DefaultAsyncHttpxClient", None)
+    if client_cls is None:
+        return None
+
+    try:
+        import httpx
+    except ImportError:
+        return None
+
+    return client_cls(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_keepalive_connections, max_connections)
+        )
+    )
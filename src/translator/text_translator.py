@@ -13,14 +13,24 @@ Requires: pip install openai pydantic python-dotenv
 """
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
+import time
 from typing import Any, Optional
 from enum import Enum
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from dotenv import load_dotenv
 
+try:
+    from . import json_codec
+    from .http_pool import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_RETRIES, create_async_http_client
+except ImportError:  # Running this module directly as a script
+    import json_codec
+    from http_pool import DEFAULT_MAX_CONNECTIONS, DEFAULT_MAX_RETRIES, create_async_http_client
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -85,113 +95,119 @@ class TranslatedSlide(BaseModel):
     elements: list[TranslatedElement] = Field(description="List of translated text elements")
 
 
-# ============================================================================
-# CONSULTING-STYLE TRANSLATION PROMPT
-# ============================================================================
-SYSTEM_PROMPT = """You are an expert translator specializing in professional consulting presentations for McKinsey, BCG, and Bain-style strategy decks.
-
-## YOUR TASK
-Translate slide content from English to Modern Standard Arabic (فصحى) while maintaining the authoritative, strategic tone of top-tier consulting firms.
+class TranslatedUnit(TranslatedSlide):
+    """A translated slide, master, layout or chart inside a deck request."""
+    unit_id: str = Field(description="Unit identifier (e.g. slide3, slideLayout2) - MUST be preserved exactly")
 
-## CONTEXT-AWARE TRANSLATION (CRITICAL)
 
-You are NOT translating isolated text fragments. Each element exists within a slide context:
+class TranslatedDeck(BaseModel):
+    """Complete translated deck content (many units in one request)."""
+    slides: list[TranslatedUnit] = Field(default_factory=list, description="Translated slides")
+    masters: list[TranslatedUnit] = Field(default_factory=list, description="Translated slide masters")
+    layouts: list[TranslatedUnit] = Field(default_factory=list, description="Translated slide layouts")
+    charts: list[TranslatedUnit] = Field(default_factory=list, description="Translated charts")
 
-1. **UNDERSTAND THE SLIDE FIRST**: Read the "slide_context" field to understand what this slide is about before translating any element.
 
-2. **ELEMENT RELATIONSHIPS**: Elements on the same slide are related. A title introduces the topic, bullets expand on it. Translate with this relationship in mind.
+# ============================================================================
+# LLM RESPONSE SCHEMAS (strict structured outputs)
+# ============================================================================
+# Only what the model actually writes (see _project_for_llm); metadata is
+# restored by _merge_with_original(). extra="forbid" and no defaults make
+# the generated JSON schema valid for OpenAI's strict json_schema mode.
+class LLMParagraph(BaseModel):
+    """A translated paragraph as written by the model."""
+    model_config = ConfigDict(extra="forbid")
+    text: str = Field(description="Translated Arabic text of the paragraph")
+    lvl: int = Field(description="Bullet level, copied from the input")
+
+
+class LLMElement(BaseModel):
+    """A translated element as written by the model."""
+    model_config = ConfigDict(extra="forbid")
+    id: str = Field(description="Element ID, copied exactly from the input")
+    role: str = Field(description="Semantic role, copied from the input")
+    paragraphs: list[LLMParagraph] = Field(description="Translated paragraphs, in input order")
+
+
+class LLMSlide(BaseModel):
+    """A translated slide payload as written by the model."""
+    model_config = ConfigDict(extra="forbid")
+    slide_context: str = Field(description="Brief Arabic description of the slide context")
+    elements: list[LLMElement] = Field(description="Translated elements, in input order")
 
-3. **WORD PLACEMENT MATTERS**: The same English word should be translated differently based on where it appears:
-   - "Overview" as a title → "نظرة شاملة" (comprehensive view)
-   - "Overview" as a nav item → "نظرة عامة" (general overview)
-   - "Impact" as a title → "الأثر الاستراتيجي" (strategic impact)
-   - "Impact" in a bullet → "التأثير" (the effect)
 
-4. **VISUAL HIERARCHY = TRANSLATION TONE**:
-   - Elements at the TOP of slide (low Y coordinate) are usually more prominent
-   - LARGER elements (bigger bbox) deserve more impactful translation
-   - Title-positioned text should sound authoritative
-   - Footer/nav text should be concise
+class LLMUnit(LLMSlide):
+    """A translated unit inside a deck response."""
+    unit_id: str = Field(description="Unit identifier, copied exactly from the input")
 
-## CRITICAL RULES FOR JSON STRUCTURE
 
-1. **PRESERVE ALL IDs EXACTLY**: Each element has an "id" field that maps translated text back to the correct shape position. NEVER change, omit, or reorder IDs.
+class LLMDeck(BaseModel):
+    """A translated deck payload as written by the model."""
+    model_config = ConfigDict(extra="forbid")
+    slides: list[LLMUnit]
+    masters: list[LLMUnit]
+    layouts: list[LLMUnit]
+    charts: list[LLMUnit]
 
-2. **MAINTAIN ELEMENT ORDER**: The elements array order reflects the visual hierarchy on the slide. Do not reorder elements.
 
-3. **KEEP ALL METADATA**: Preserve bbox, role, name, lvl, bold, alignment, bullet values exactly as received.
+def _json_schema_format(name: str, model: type[BaseModel]) -> dict[str, Any]:
+    """response_format that constrains the completion to a model's JSON schema."""
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": model.model_json_schema()},
+    }
 
-## TRANSLATION HIERARCHY BY ROLE
 
-The "role" field tells you the semantic importance of each element:
+SLIDE_RESPONSE_FORMAT = _json_schema_format("translated_slide", LLMSlide)
+DECK_RESPONSE_FORMAT = _json_schema_format("translated_deck", LLMDeck)
 
-| Role | Translation Style | Example |
-|------|-------------------|---------|
-| title | Bold, commanding headlines. Use impactful verbs. Short and punchy. | "التحول الاستراتيجي نحو التميز" |
-| subtitle | Supporting context, explanatory. Provides additional detail. | "نظرة شاملة على محفظة الأعمال" |
-| header | Section headers, clear and direct. Labels for content below. | "النتائج الرئيسية" |
-| body/content | Bullet points, parallel structure, action-oriented. The meat of the slide. | "تحسين الكفاءة التشغيلية بنسبة 25%" |
-| footer | Navigation, page numbers, disclaimers. Keep very concise. | "التحليل" |
 
-## BULLET LEVEL AWARENESS
+# Deck section for each unit name prefix (longest prefixes first: "slideMaster" before "slide")
+DECK_SECTIONS: list[tuple[str, str]] = [
+    ("slideMaster", "masters"),
+    ("slideLayout", "layouts"),
+    ("chart", "charts"),
+    ("slide", "slides"),
+]
 
-The "lvl" field (0-5) indicates bullet nesting - translate accordingly:
-- lvl=0: **Main points** - Most important, decisive language, can stand alone
-- lvl=1: **Supporting details** - Explanatory, elaborates on lvl=0
-- lvl=2+: **Sub-bullets** - Specific data points, examples, evidence
 
-Example: If lvl=0 says "Improve efficiency" and lvl=1 says "Reduce costs by 25%", the lvl=1 translation should feel like it supports/explains the lvl=0 point.
+# ============================================================================
+# CONSULTING-STYLE TRANSLATION PROMPT
+# ============================================================================
+# The system prompts are sent first and byte-identical on every request so
+# the API's prompt cache can reuse them. Never .format() per-call data into
+# them - slide content goes in the user message, and nothing static may
+# follow it: the user templates end with {json_content}.
+SYSTEM_PROMPT = """You are an expert translator of McKinsey/BCG/Bain-style strategy decks.
 
-## ARABIC CONSULTING LANGUAGE GUIDELINES
+## YOUR TASK
+Translate slide content from English to Modern Standard Arabic (فصحى) in the authoritative, strategic tone of top-tier consulting firms.
 
-1. **Tone**: Authoritative, strategic, forward-looking
-   - Use active voice: "نُعزّز" (we enhance) not "يتم تعزيز" (is enhanced)
-   - Be decisive: "يجب" (must) over "من الممكن" (it's possible)
+## CONTEXT-AWARE TRANSLATION
+- Read "slide_context" first; elements on a slide are related (the title introduces the topic, bullets expand on it).
+- Translate by placement, not in isolation: "Overview" as a title → "نظرة شاملة", as a nav item → "نظرة عامة"; "Impact" as a title → "الأثر الاستراتيجي", in a bullet → "التأثير".
+- Elements are listed in reading order (top to bottom); earlier elements are usually more prominent.
 
-2. **Vocabulary**: Use established Arabic business terminology
-   - Strategy = الاستراتيجية (not الخطة)
-   - ROI = العائد على الاستثمار (keep "ROI" in parentheses first time)
-   - KPIs = مؤشرات الأداء الرئيسية
+## STYLE BY ROLE
+- title: commanding, short headline with impactful verbs
+- subtitle: supporting, explanatory context
+- header: clear, direct section label
+- body/content: action-oriented bullets with parallel structure
+- footer: navigation/page labels/disclaimers, very concise
 
-3. **Formatting Preservation**:
-   - Keep English acronyms: ROI, KPI, EBITDA, M&A
-   - Keep brand names in English: McKinsey, Statkraft, BLOOM
-   - Preserve numbers and percentages: 25%, $1.5M
-   - Keep currency symbols and units
+## BULLET LEVELS ("lvl" 0-5)
+lvl=0 main points (decisive, standalone); lvl=1 supports/explains its lvl=0 parent; lvl=2+ specific data points and evidence.
 
-4. **Parallel Structure**: Bullets at the same level should have consistent grammatical structure
-   - "زيادة الإيرادات", "تقليص التكاليف", "تحسين الكفاءة" (all verbal nouns)
+## ARABIC CONSULTING LANGUAGE
+- Active, decisive voice: "نُعزّز" not "يتم تعزيز"; "يجب" over "من الممكن"
+- Established terminology: Strategy = الاستراتيجية (not الخطة), ROI = العائد على الاستثمار (keep "ROI" in parentheses the first time), KPIs = مؤشرات الأداء الرئيسية
+- Keep English acronyms (ROI, KPI, EBITDA, M&A), brand names (McKinsey, Statkraft, BLOOM), numbers, percentages, currency symbols and units as-is
+- Bullets at the same level share one grammatical form, e.g. verbal nouns: "زيادة الإيرادات", "تقليص التكاليف"
 
 ## OUTPUT FORMAT
-Return ONLY valid JSON matching the TranslatedSlide schema. No markdown, no explanations, no code blocks.
-
-## EXAMPLE
-
-Input:
-{
-  "slide_context": "Strategy overview",
-  "elements": [
-    {"id": "5", "role": "title", "name": "Title 1", "bbox": {"x": 0, "y": 0, "width": 9144000, "height": 1000000}, "paragraphs": [{"text": "Digital Transformation Roadmap", "lvl": 0, "bold": true, "alignment": "ctr", "bullet": false}]},
-    {"id": "8", "role": "content", "name": "Content", "bbox": {"x": 500000, "y": 1500000, "width": 8000000, "height": 3000000}, "paragraphs": [{"text": "Increase operational efficiency by 25%", "lvl": 0, "bold": false, "alignment": "l", "bullet": true}]}
-  ]
-}
-
-Output:
-{
-  "slide_context": "نظرة عامة على الاستراتيجية",
-  "elements": [
-    {"id": "5", "role": "title", "name": "Title 1", "bbox": {"x": 0, "y": 0, "width": 9144000, "height": 1000000}, "paragraphs": [{"text": "خارطة طريق التحول الرقمي", "lvl": 0, "bold": true, "alignment": "ctr", "bullet": false}]},
-    {"id": "8", "role": "content", "name": "Content", "bbox": {"x": 500000, "y": 1500000, "width": 8000000, "height": 3000000}, "paragraphs": [{"text": "رفع الكفاءة التشغيلية بنسبة 25%", "lvl": 0, "bold": false, "alignment": "r", "bullet": true}]}
-  ]
-}
-
-NOTICE:
-- ID "5" and "8" are preserved exactly
-- bbox values unchanged
-- alignment changed from "l" to "r" for RTL
-- Bold and bullet preserved
-- Numbers preserved (25%)
-- Consulting vocabulary used (الكفاءة التشغيلية)"""
+Return ONLY valid JSON with the same shape as the input - no markdown, explanations or code blocks.
+- Keep every element "id" exactly, in the original order; never omit or add elements
+- Keep the paragraphs of each element in order; translate only "slide_context" and each paragraph "text" value"""
 
 
 USER_PROMPT_TEMPLATE = """Translate the following consulting slide content from English to Arabic.
@@ -203,9 +219,50 @@ IMPORTANT REMINDERS:
 4. Return ONLY valid JSON
 
 Slide Content:
-{json_content}
+{json_content}"""
+
+
+DECK_SYSTEM_PROMPT = SYSTEM_PROMPT + """
+
+## DECK REQUESTS (MANY UNITS AT ONCE)
+
+Some requests contain several slides instead of one. The input then has the
+top-level keys "slides", "masters", "layouts" and "charts", each a list of
+units. Every unit has a "unit_id" plus its own "slide_context" and "elements".
+
+1. Translate every unit exactly as you would translate a single slide
+2. PRESERVE every "unit_id" exactly and keep each unit in its original list
+3. Element IDs are only unique within their unit - never mix elements between units
+4. Use consistent terminology for the same English term across all units
 
-Translate now (JSON only):"""
+Return ONLY valid JSON with the same top-level keys, matching the TranslatedDeck schema."""
+
+
+DECK_USER_PROMPT_TEMPLATE = """Translate the following consulting deck content from English to Arabic.
+
+IMPORTANT REMINDERS:
+1. Preserve ALL "unit_id" and "id" values exactly - they are critical for mapping text to shapes
+2. Use professional Arabic consulting terminology, consistent across the deck
+3. Keep brand names, acronyms, numbers, and percentages in their original form
+4. Return ONLY valid JSON
+
+Deck Content:
+{json_content}"""
+
+# Changes whenever the prompts change (DECK_SYSTEM_PROMPT contains
+# SYSTEM_PROMPT), so the translation memory never serves translations
+# made with an older prompt
+PROMPT_VERSION = hashlib.sha1(DECK_SYSTEM_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+# Default input-token budget for one deck request; larger decks are split
+DEFAULT_MAX_DECK_TOKENS = 16000
+
+# Default token budget for one slide's content; the reply is about as long
+# again, so oversized slides are split by elements and translated in parts
+DEFAULT_MAX_SLIDE_TOKENS = 12000
+
+# Separates a unit name from its part number when a unit is split ("slide3#part1")
+_PART_SEPARATOR = "#part"
 
 
 # ============================================================================
@@ -227,7 +284,12 @@ class TextTranslator:
         self,
         api_key: Optional[str] = None,
         model: str = "gpt-5-mini",
-        temperature: float = 0.2,
+        temperature: float = 0.0,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_slide_tokens: int = DEFAULT_MAX_SLIDE_TOKENS,
+        stream: bool = False,
+        verbose: bool = False,
     ):
         """
         Initialize the translator.
@@ -235,7 +297,14 @@ class TextTranslator:
         Args:
             api_key: OpenAI API key. If not provided, reads from OPENAI_API_KEY env var.
             model: Model to use (default: gpt-4o)
-            temperature: Sampling temperature (lower = more consistent)
+            temperature: Sampling temperature (0 = deterministic, best for caching)
+            max_connections: Connection pool size of the async client
+            max_retries: Retries (exponential backoff) on rate limits and server errors
+            max_slide_tokens: Content-token budget per slide request; larger
+                              slides are split into several requests
+            stream: Stream completions (tokens arrive as they are generated, so
+                    long deck responses never sit on an idle connection)
+            verbose: Print warnings (e.g. elements the model left untranslated)
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
         if not self.api_key:
@@ -245,15 +314,29 @@ class TextTranslator:
 
         self.model = model
         self.temperature = temperature
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self.max_slide_tokens = max_slide_tokens
+        self.stream = stream
+        self.verbose = verbose
 
         # Lazy import to avoid dependency issues if not using OpenAI
         try:
             from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key)
+            self.client = OpenAI(api_key=self.api_key, max_retries=self.max_retries)
         except ImportError:
             raise ImportError(
                 "OpenAI library required. Install with: pip install openai"
             )
+        self._async_client = None
+
+        # Static request parts, built once: only the user message varies per call
+        self._system_message = {"role": "system", "content": SYSTEM_PROMPT}
+        self._deck_system_message = {"role": "system", "content": DECK_SYSTEM_PROMPT}
+        self._base_api_params: dict[str, Any] = {"model": self.model}
+        # gpt-5-mini only supports the default temperature (1.0), so don't pass it
+        if self.model != "gpt-5-mini":
+            self._base_api_params["temperature"] = self.temperature
 
     def translate(self, content: dict[str, Any]) -> TranslatedSlide:
         """
@@ -268,50 +351,311 @@ class TextTranslator:
         Raises:
             TranslationError: If translation fails
         """
-        # Prepare the user message with content
-        user_message = USER_PROMPT_TEMPLATE.format(
-            json_content=json.dumps(content, ensure_ascii=False, indent=2)
-        )
+        return self._validate(self.translate_to_dict(content))
+
+    async def translate_async(self, content: dict[str, Any]) -> TranslatedSlide:
+        """
+        Translate slide content using the async OpenAI client.
+
+        Same contract as translate(), but the HTTP round-trip is awaited so
+        many slides can be in flight at once (see asyncio.gather in main.py).
+        """
+        return self._validate(await self.translate_to_dict_async(content))
+
+    def translate_batch_api(
+        self,
+        contents: dict[str, dict[str, Any]],
+        poll_interval: float = 5.0,
+        max_poll_interval: float = 300.0,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Translate many slides through the OpenAI Batch API.
+
+        All requests are uploaded as one JSONL file and processed offline
+        (completion window 24h, at half the realtime price). Intended for
+        non-interactive whole-deck runs.
+
+        Args:
+            contents: Mapping of custom_id (e.g. "slide3") to slide content
+            poll_interval: Initial seconds between status polls
+            max_poll_interval: Upper bound for the exponential poll backoff
+
+        Returns:
+            Mapping of custom_id to translated content dict
+
+        Raises:
+            TranslationError: If the batch fails or a request has no result
+        """
+        # Oversized slides become several requests, joined again below
+        contents = split_units(contents, self.max_slide_tokens, self.model)
+        lines = [
+            json_codec.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": self._build_api_params(content),
+            })
+            for custom_id, content in contents.items()
+        ]
+        batch_input = ("\n".join(lines) + "\n").encode("utf-8")
 
         try:
-            # Note: gpt-5-mini only supports default temperature (1.0)
-            # Don't pass temperature parameter for this model
-            api_params = {
-                "model": self.model,
-                "messages": [
-                    {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": user_message}
-                ],
-                "response_format": {"type": "json_object"}
-            }
+            input_file = self.client.files.create(
+                file=("translation_batch.jsonl", batch_input),
+                purpose="batch",
+            )
+            batch = self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h",
+            )
+
+            # Poll with exponential backoff until the batch reaches a final state
+            delay = poll_interval
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
+                batch = self.client.batches.retrieve(batch.id)
+
+            if batch.status != "completed" or not batch.output_file_id:
+                raise TranslationError(f"Batch {batch.id} ended with status '{batch.status}'")
+
+            output = self.client.files.content(batch.output_file_id).text
+
+        except TranslationError:
+            raise
+        except Exception as e:
+            raise TranslationError(f"Batch translation failed: {e}")
+
+        results = {}
+        for line in output.splitlines():
+            if not line.strip():
+                continue
+            record = json_codec.loads(line)
+            custom_id = record.get("custom_id")
+            response = record.get("response") or {}
+            if custom_id not in contents or record.get("error") or response.get("status_code") != 200:
+                raise TranslationError(f"Batch request '{custom_id}' failed: {record.get('error')}")
+
+            response_text = response["body"]["choices"][0]["message"]["content"]
+            results[custom_id] = self._parse_response(contents[custom_id], response_text)
+
+        missing = set(contents) - set(results)
+        if missing:
+            raise TranslationError(f"Batch returned no result for: {sorted(missing)}")
+
+        return join_split_units(results)
+
+    # ========================================================================
+    # DECK-LEVEL TRANSLATION (many units per request)
+    # ========================================================================
+    def translate_deck(
+        self,
+        units: dict[str, dict[str, Any]],
+        max_tokens: int = DEFAULT_MAX_DECK_TOKENS,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Translate many units (slides, masters, layouts, charts) in as few requests as possible.
+
+        All units are packed into one deck-shaped request, split into chunks
+        only when the prompt would exceed max_tokens. Units larger than
+        max_slide_tokens are sent in parts and joined again.
+
+        Args:
+            units: Mapping of unit name (e.g. "slide3", "chart1") to slide content
+            max_tokens: Input-token budget per request
+
+        Returns:
+            Mapping of unit name to translated content dict
+        """
+        results = {}
+        for chunk in self.chunk_deck(units, max_tokens):
+            results.update(self._translate_deck_chunk(chunk))
+        return join_split_units(results)
+
+    async def translate_deck_async(
+        self,
+        units: dict[str, dict[str, Any]],
+        max_tokens: int = DEFAULT_MAX_DECK_TOKENS,
+        max_concurrency: int = 8,
+    ) -> dict[str, dict[str, Any]]:
+        """Async counterpart of translate_deck(); chunks are sent concurrently."""
+        import asyncio
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        results = {}
+        for chunk_result in await asyncio.gather(
+            *[self._translate_deck_chunk_async(chunk, semaphore) for chunk in self.chunk_deck(units, max_tokens)]
+        ):
+            results.update(chunk_result)
+        return join_split_units(results)
+
+    def chunk_deck(
+        self,
+        units: dict[str, dict[str, Any]],
+        max_tokens: int = DEFAULT_MAX_DECK_TOKENS,
+    ) -> list[dict[str, dict[str, Any]]]:
+        """Pack units into deck requests for this model (see chunk_deck_units())."""
+        return chunk_deck_units(units, max_tokens, self.model, self.max_slide_tokens)
+
+    def count_tokens(self, text: str) -> int:
+        """Count prompt tokens with tiktoken, or estimate (~4 chars/token) without it."""
+        return count_tokens(text, self.model)
+
+    def split_content(self, content: dict[str, Any]) -> list[dict[str, Any]]:
+        """Split a slide whose content exceeds max_slide_tokens (see split_content())."""
+        return split_content(content, self.max_slide_tokens, self.model)
+
+    def _translate_deck_chunk(self, units: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Translate one chunk of units with a single chat completion."""
+        try:
+            response_text = self._complete(self._build_deck_api_params(units))
+            return self._parse_deck_response(units, response_text)
+
+        except TranslationError:
+            raise
+        except Exception as e:
+            raise TranslationError(f"Deck translation failed: {e}")
 
-            # Only add temperature for models that support it (not gpt-5-mini)
-            if self.model != "gpt-5-mini":
-                api_params["temperature"] = self.temperature
+    async def _translate_deck_chunk_async(
+        self,
+        units: dict[str, dict[str, Any]],
+        semaphore: Optional[Any] = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Async counterpart of _translate_deck_chunk().
 
+        A chunk whose reply cannot be mapped back (invalid JSON, lost units)
+        is retried as two halves, down to single units. The semaphore (an
+        asyncio.Semaphore bounding requests in flight) is held per request,
+        so retries stay within the limit too.
+        """
+        try:
+            api_params = self._build_deck_api_params(units)
+            if semaphore is None:
+                response_text = await self._complete_async(api_params)
+            else:
+                async with semaphore:
+                    response_text = await self._complete_async(api_params)
+            return self._parse_deck_response(units, response_text)
+
+        except TranslationError as e:
+            if len(units) < 2:
+                raise
+            import asyncio
+
+            if self.verbose:
+                print(f"[TextTranslator] Deck request of {len(units)} units failed ({e}), retrying in halves")
+            results = {}
+            for half in await asyncio.gather(
+                *[self._translate_deck_chunk_async(half, semaphore) for half in _halve(units)]
+            ):
+                results.update(half)
+            return results
+        except Exception as e:
+            raise TranslationError(f"Deck translation failed: {e}")
+
+    def _complete(self, api_params: dict[str, Any]) -> Optional[str]:
+        """Run one chat completion and return the response text (streamed if enabled)."""
+        if not self.stream:
             response = self.client.chat.completions.create(**api_params)
+            return response.choices[0].message.content
+
+        parts = []
+        for chunk in self.client.chat.completions.create(**api_params, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    async def _complete_async(self, api_params: dict[str, Any]) -> Optional[str]:
+        """Async counterpart of _complete()."""
+        if not self.stream:
+            response = await self.async_client.chat.completions.create(**api_params)
+            return response.choices[0].message.content
+
+        parts = []
+        async for chunk in await self.async_client.chat.completions.create(**api_params, stream=True):
+            if chunk.choices and chunk.choices[0].delta.content:
+                parts.append(chunk.choices[0].delta.content)
+        return "".join(parts)
+
+    def _build_deck_api_params(self, units: dict[str, dict[str, Any]]) -> dict[str, Any]:
+        """Build the chat completion request parameters for a chunk of units."""
+        user_message = DECK_USER_PROMPT_TEMPLATE.format(
+            json_content=json_codec.dumps(_deck_content(units))
+        )
+        return {
+            **self._base_api_params,
+            "messages": [self._deck_system_message, {"role": "user", "content": user_message}],
+            "response_format": DECK_RESPONSE_FORMAT
+        }
+
+    def _parse_deck_response(
+        self,
+        units: dict[str, dict[str, Any]],
+        response_text: Optional[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Split a deck response back into per-unit translations (see split_deck_response())."""
+        return split_deck_response(units, response_text, self.verbose)
+
+    @property
+    def async_client(self):
+        """
+        Lazily created AsyncOpenAI client (only needed for concurrent runs).
+
+        All requests share one pooled keep-alive (HTTP/2 if available) connection pool.
+        """
+        if self._async_client is None:
+            import openai
+            self._async_client = openai.AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=self.max_retries,
+                http_client=create_async_http_client(openai, self.max_connections)
+            )
+        return self._async_client
+
+    async def aclose(self) -> None:
+        """Close the async client (if one was created)."""
+        if self._async_client is not None:
+            await self._async_client.close()
+            self._async_client = None
+
+    def _build_api_params(self, content: dict[str, Any]) -> dict[str, Any]:
+        """Build the chat completion request parameters for one slide."""
+        # Prepare the user message with content (compact: indentation only costs tokens)
+        user_message = USER_PROMPT_TEMPLATE.format(
+            json_content=json_codec.dumps(_project_for_llm(content))
+        )
+
+        return {
+            **self._base_api_params,
+            "messages": [self._system_message, {"role": "user", "content": user_message}],
+            "response_format": SLIDE_RESPONSE_FORMAT
+        }
+
+    def _parse_response(self, content: dict[str, Any], response_text: Optional[str]) -> dict[str, Any]:
+        """
+        Parse the raw LLM response text for one slide and merge it with the original.
 
-            # Extract response content
-            response_text = response.choices[0].message.content
-            if not response_text:
-                raise TranslationError("Empty response from OpenAI")
+        The merged dict is built from the original content, so it already has
+        the TranslatedSlide shape; Pydantic validation is left to the typed
+        API (translate()).
+        """
+        if not response_text:
+            raise TranslationError("Empty response from OpenAI")
 
+        try:
             # Parse LLM response
-            response_data = json.loads(response_text)
+            response_data = json_codec.loads(response_text)
 
             # Merge LLM translations with original metadata
             # LLM only provides: id, role, paragraphs (with text)
             # We preserve from original: name, bbox, and any missing paragraph metadata
-            merged_data = self._merge_with_original(content, response_data)
-
-            # Validate merged data with Pydantic
-            translated = TranslatedSlide.model_validate(merged_data)
-
-            # Verify IDs were preserved
-            self._verify_ids(content, translated)
-
-            return translated
+            return self._merge_with_original(content, response_data)
 
+        except TranslationError:
+            raise
         except json.JSONDecodeError as e:
             raise TranslationError(f"Invalid JSON in response: {e}")
         except Exception as e:
@@ -325,82 +669,412 @@ class TextTranslator:
             content: Dictionary with slide_context and elements
 
         Returns:
-            Dictionary with translated content
-        """
-        translated = self.translate(content)
-        return translated.model_dump()
+            Dictionary with translated content (same shape as TranslatedSlide.model_dump())
 
-    def _merge_with_original(self, original: dict, llm_response: dict) -> dict:
+        Raises:
+            TranslationError: If translation fails
         """
-        Merge LLM translations with original metadata.
+        parts = self.split_content(content)
+        if len(parts) > 1:
+            if self.verbose:
+                print(f"[TextTranslator] Slide over {self.max_slide_tokens} tokens, sending {len(parts)} parts")
+            return _join_parts([self.translate_to_dict(part) for part in parts])
 
-        The LLM should only translate text - we preserve all structural metadata
-        (name, bbox, lvl, bold, alignment, bullet) from the original content.
-        """
-        # Build lookup from original elements by ID
-        original_by_id = {
-            elem.get("id"): elem
-            for elem in original.get("elements", [])
-        }
+        try:
+            response_text = self._complete(self._build_api_params(content))
+            return self._parse_response(content, response_text)
 
-        merged = {
-            "slide_context": llm_response.get("slide_context", original.get("slide_context", "")),
-            "elements": []
-        }
+        except TranslationError:
+            raise
+        except Exception as e:
+            raise TranslationError(f"Translation failed: {e}")
 
-        for llm_elem in llm_response.get("elements", []):
-            elem_id = llm_elem.get("id")
-            orig_elem = original_by_id.get(elem_id, {})
-
-            # Start with original element and update with translations
-            merged_elem = {
-                "id": elem_id,
-                "role": llm_elem.get("role", orig_elem.get("role", "content")),
-                "name": orig_elem.get("name", ""),
-                "bbox": orig_elem.get("bbox", {"x": 0, "y": 0, "width": 0, "height": 0}),
-                "paragraphs": []
-            }
+    async def translate_to_dict_async(self, content: dict[str, Any]) -> dict[str, Any]:
+        """Async counterpart of translate_to_dict(); the parts of a split slide are sent concurrently."""
+        parts = self.split_content(content)
+        if len(parts) > 1:
+            import asyncio
 
-            # Merge paragraphs - preserve metadata, update text
-            orig_paragraphs = orig_elem.get("paragraphs", [])
-            llm_paragraphs = llm_elem.get("paragraphs", [])
+            if self.verbose:
+                print(f"[TextTranslator] Slide over {self.max_slide_tokens} tokens, sending {len(parts)} parts")
+            results = await asyncio.gather(*[self.translate_to_dict_async(part) for part in parts])
+            return _join_parts(list(results))
 
-            for i, llm_para in enumerate(llm_paragraphs):
-                orig_para = orig_paragraphs[i] if i < len(orig_paragraphs) else {}
+        try:
+            response_text = await self._complete_async(self._build_api_params(content))
+            return self._parse_response(content, response_text)
 
-                merged_para = {
-                    "text": llm_para.get("text", ""),
-                    "lvl": llm_para.get("lvl", orig_para.get("lvl", 0)),
-                    "bold": llm_para.get("bold", orig_para.get("bold", False)),
-                    "alignment": llm_para.get("alignment", orig_para.get("alignment", "r")),
-                    "bullet": llm_para.get("bullet", orig_para.get("bullet", False))
-                }
-                merged_elem["paragraphs"].append(merged_para)
+        except TranslationError:
+            raise
+        except Exception as e:
+            raise TranslationError(f"Translation failed: {e}")
 
-            merged["elements"].append(merged_elem)
+    @staticmethod
+    def _validate(data: dict[str, Any]) -> TranslatedSlide:
+        """Validate a merged translation into a TranslatedSlide model."""
+        try:
+            return TranslatedSlide.model_validate(data)
+        except Exception as e:
+            raise TranslationError(f"Translation failed: {e}")
+
+    def _merge_with_original(self, original: dict, llm_response: dict) -> dict:
+        """Merge an LLM response with the original content (see merge_with_original())."""
+        return merge_with_original(original, llm_response, self.verbose)
+
+
+# ============================================================================
+# CONVENIENCE FUNCTIONS
+# ============================================================================
+def merge_with_original(original: dict, llm_response: dict, verbose: bool = False) -> dict:
+    """
+    Merge LLM translations with original metadata.
+
+    The LLM should only translate text - we preserve all structural metadata
+    (name, bbox, lvl, bold, alignment, bullet) from the original content.
+    Elements follow the original order whatever order the LLM used, and
+    an element the LLM left out keeps its original text.
 
-        return merged
+    Args:
+        original: Content payload that was translated (full, not projected)
+        llm_response: Parsed model reply for _project_for_llm(original)
+        verbose: Print the IDs of elements the model omitted
 
-    def _verify_ids(self, original: dict, translated: TranslatedSlide) -> None:
-        """Verify that all original IDs are preserved in translation."""
-        original_ids = {elem.get("id") for elem in original.get("elements", [])}
-        translated_ids = {elem.id for elem in translated.elements}
+    Raises:
+        TranslationError: If the response contains none of the elements
+    """
+    llm_by_id = {
+        elem.get("id"): elem
+        for elem in llm_response.get("elements", [])
+    }
+
+    # Repeated elements were sent once; copies take the representative's translation
+    llm_by_key = {}
+    for orig_elem in original.get("elements", []):
+        key = _duplicate_key(orig_elem)
+        llm_elem = llm_by_id.get(orig_elem.get("id"))
+        if key is not None and llm_elem is not None:
+            llm_by_key.setdefault(key, llm_elem)
+
+    merged = {
+        "slide_context": llm_response.get("slide_context", original.get("slide_context", "")),
+        "elements": []
+    }
+
+    missing_ids = []
+    for orig_elem in original.get("elements", []):
+        elem_id = orig_elem.get("id")
+        orig_paragraphs = orig_elem.get("paragraphs", [])
+
+        llm_elem = llm_by_id.get(elem_id) or llm_by_key.get(_duplicate_key(orig_elem))
+        if llm_elem is None:
+            missing_ids.append(elem_id)
+            llm_elem = {"paragraphs": [{"text": para.get("text", "")} for para in orig_paragraphs]}
+
+        # Start with original element and update with translations
+        merged_elem = {
+            "id": elem_id,
+            "role": llm_elem.get("role", orig_elem.get("role", "content")),
+            "name": orig_elem.get("name", ""),
+            "bbox": orig_elem.get("bbox", {"x": 0, "y": 0, "width": 0, "height": 0}),
+            "paragraphs": []
+        }
+
+        # Merge paragraphs - preserve metadata, update text
+        for i, llm_para in enumerate(llm_elem.get("paragraphs", [])):
+            orig_para = orig_paragraphs[i] if i < len(orig_paragraphs) else {}
+
+            text = llm_para.get("text")
+            merged_para = {
+                "text": text if isinstance(text, str) else ("" if text is None else str(text)),
+                "lvl": llm_para.get("lvl", orig_para.get("lvl", 0)),
+                "bold": llm_para.get("bold", orig_para.get("bold", False)),
+                "alignment": llm_para.get("alignment", orig_para.get("alignment", "r")),
+                "bullet": llm_para.get("bullet", orig_para.get("bullet", False))
+            }
+            merged_elem["paragraphs"].append(merged_para)
+
+        merged["elements"].append(merged_elem)
 
-        missing_ids = original_ids - translated_ids
-        if missing_ids:
+    if missing_ids:
+        if len(missing_ids) == len(merged["elements"]):
             raise TranslationError(
-                f"Translation lost element IDs: {missing_ids}. "
+                f"Translation returned none of the element IDs: {missing_ids}. "
                 "IDs must be preserved for correct text positioning."
             )
+        if verbose:
+            print(f"[TextTranslator] Kept original text for omitted element IDs: {missing_ids}")
+
+    return merged
+
+
+def get_anthropic_prompt(content: dict[str, Any]) -> tuple[str, str]:
+    """
+    System prompt and user message for translating one payload with Anthropic Claude.
+
+    Same prompts and lean payload as the OpenAI requests; pass the parsed
+    reply through merge_with_original().
+    """
+    return SYSTEM_PROMPT, USER_PROMPT_TEMPLATE.format(
+        json_content=json_codec.dumps(_project_for_llm(content))
+    )
+
+
+def get_anthropic_deck_prompt(units: dict[str, dict[str, Any]]) -> tuple[str, str]:
+    """
+    System prompt and user message for translating many units in one Anthropic request.
+
+    Same deck prompts as TextTranslator.translate_deck(); pass the reply
+    through split_deck_response().
+    """
+    return DECK_SYSTEM_PROMPT, DECK_USER_PROMPT_TEMPLATE.format(
+        json_content=json_codec.dumps(_deck_content(units))
+    )
+
+
+def chunk_deck_units(
+    units: dict[str, dict[str, Any]],
+    max_tokens: int = DEFAULT_MAX_DECK_TOKENS,
+    model: str = "gpt-5-mini",
+    max_unit_tokens: int = DEFAULT_MAX_SLIDE_TOKENS,
+) -> list[dict[str, dict[str, Any]]]:
+    """
+    Greedily pack units (in order) into chunks whose deck prompts fit max_tokens.
+
+    Units over max_unit_tokens (or too large for a deck request on their
+    own) are first split into parts (see split_units()); pass the merged
+    results through join_split_units(). A part that still exceeds the
+    budget (a single huge element) gets a chunk of its own.
+    """
+    overhead = count_tokens(DECK_SYSTEM_PROMPT, model) + count_tokens(DECK_USER_PROMPT_TEMPLATE, model)
+    units = split_units(units, min(max_unit_tokens, max_tokens - overhead), model)
+
+    chunks: list[dict[str, dict[str, Any]]] = []
+    current: dict[str, dict[str, Any]] = {}
+    used = overhead
+    for name, content in units.items():
+        size = count_tokens(json_codec.dumps(_project_for_llm(content)), model)
+        if current and used + size > max_tokens:
+            chunks.append(current)
+            current, used = {}, overhead
+        current[name] = content
+        used += size
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def split_deck_response(
+    units: dict[str, dict[str, Any]],
+    response_text: Optional[str],
+    verbose: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """
+    Split a deck reply back into per-unit translations (merged like single slides).
+
+    Raises:
+        TranslationError: If the reply is empty, not JSON, or lost a unit
+    """
+    if not response_text:
+        raise TranslationError("Empty response")
+
+    try:
+        response_data = json_codec.loads(response_text)
+    except json.JSONDecodeError as e:
+        raise TranslationError(f"Invalid JSON in response: {e}")
+
+    results = {}
+    try:
+        for section in TranslatedDeck.model_fields:
+            for unit in response_data.get(section) or []:
+                name = unit.get("unit_id")
+                if name not in units:
+                    continue
+                results[name] = merge_with_original(units[name], unit, verbose)
+
+    except TranslationError:
+        raise
+    except Exception as e:
+        raise TranslationError(f"Deck translation failed: {e}")
+
+    missing = set(units) - set(results)
+    if missing:
+        raise TranslationError(f"Deck translation lost units: {sorted(missing)}")
+
+    return results
+
+
+def split_content(
+    content: dict[str, Any],
+    max_tokens: int = DEFAULT_MAX_SLIDE_TOKENS,
+    model: str = "gpt-5-mini",
+) -> list[dict[str, Any]]:
+    """
+    Split a payload whose LLM content exceeds max_tokens into smaller payloads.
+
+    Elements are halved (in order) until every part fits; a single element
+    is never split. Each part keeps the slide_context.
+    """
+    elements = content.get("elements", [])
+    size = count_tokens(json_codec.dumps(_project_for_llm(content)), model)
+    if size <= max_tokens or len(elements) < 2:
+        return [content]
+
+    middle = len(elements) // 2
+    return (
+        split_content({**content, "elements": elements[:middle]}, max_tokens, model)
+        + split_content({**content, "elements": elements[middle:]}, max_tokens, model)
+    )
+
+
+def split_units(
+    units: dict[str, dict[str, Any]],
+    max_tokens: int = DEFAULT_MAX_SLIDE_TOKENS,
+    model: str = "gpt-5-mini",
+) -> dict[str, dict[str, Any]]:
+    """
+    Replace every unit over max_tokens by its parts, named "<unit>#part<i>".
+
+    Units that fit keep their name; join_split_units() reverses the split
+    on the translated results.
+    """
+    split = {}
+    for name, content in units.items():
+        parts = split_content(content, max_tokens, model)
+        if len(parts) == 1:
+            split[name] = content
+        else:
+            for i, part in enumerate(parts):
+                split[f"{name}{_PART_SEPARATOR}{i}"] = part
+    return split
+
+
+def join_split_units(results: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Join the translated parts of units split by split_units() back into one result each."""
+    joined: dict[str, dict[str, Any]] = {}
+    parts: dict[str, dict[int, dict[str, Any]]] = {}
+    for name, result in results.items():
+        unit, sep, index = name.rpartition(_PART_SEPARATOR)
+        if sep:
+            parts.setdefault(unit, {})[int(index)] = result
+        else:
+            joined[name] = result
+
+    for unit, unit_parts in parts.items():
+        joined[unit] = _join_parts([unit_parts[i] for i in sorted(unit_parts)])
+    return joined
+
+
+def count_tokens(text: str, model: str = "gpt-5-mini") -> int:
+    """Count prompt tokens with tiktoken, or estimate (~4 chars/token) without it."""
+    encoding = _get_encoding(model)
+    if encoding is None:
+        return len(text) // 4 + 1
+    return len(encoding.encode(text))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Any:
+    """tiktoken encoding for a model (built once per process), or None without tiktoken."""
+    try:
+        import tiktoken
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception:
+        # tiktoken not installed (or its encoding could not be loaded)
+        return None
+
+
+def _join_parts(parts: list[dict[str, Any]]) -> dict[str, Any]:
+    """Concatenate the translations of a split slide (see TextTranslator.split_content())."""
+    joined = dict(parts[0])
+    joined["elements"] = [elem for part in parts for elem in part.get("elements", [])]
+    return joined
+
+
+def _halve(units: dict[str, dict[str, Any]]) -> list[dict[str, dict[str, Any]]]:
+    """Split a chunk of units into two halves (in order) for a retry."""
+    names = list(units)
+    middle = len(names) // 2
+    return [
+        {name: units[name] for name in names[:middle]},
+        {name: units[name] for name in names[middle:]},
+    ]
+
+
+def _deck_content(units: dict[str, dict[str, Any]]) -> dict[str, list[dict[str, Any]]]:
+    """Deck-shaped LLM payload: units grouped by section, each tagged with its unit_id."""
+    deck_content: dict[str, list[dict[str, Any]]] = {}
+    for name, content in units.items():
+        deck_content.setdefault(_deck_section(name), []).append(
+            {"unit_id": name, **_project_for_llm(content)}
+        )
+    return deck_content
+
+
+def _deck_section(unit_name: str) -> str:
+    """Deck section ("slides", "masters", "layouts", "charts") for a unit name."""
+    for prefix, section in DECK_SECTIONS:
+        if unit_name.startswith(prefix):
+            return section
+    return "slides"
+
+
+def _project_for_llm(content: dict[str, Any]) -> dict[str, Any]:
+    """
+    Reduce a content payload to the fields the LLM needs to translate it.
+
+    Shape names, the combined element text and bold flags are not sent:
+    _merge_with_original() restores metadata from the original content, so
+    the model neither reads nor echoes them. Paragraph levels are kept as
+    "lvl" because they steer the translation tone.
+
+    Repeated elements (same role and paragraphs, e.g. "Confidential" or a
+    source line) are sent once; _merge_with_original() copies the
+    translation to the other occurrences.
+    """
+    elements = []
+    seen = set()
+    for elem in content.get("elements", []):
+        key = _duplicate_key(elem)
+        if key is not None:
+            if key in seen:
+                continue
+            seen.add(key)
+
+        elements.append({
+            "id": elem.get("id"),
+            "role": elem.get("role", "content"),
+            "paragraphs": [
+                {"text": para.get("text", ""), "lvl": para.get("level", para.get("lvl", 0))}
+                for para in elem.get("paragraphs", [])
+            ],
+        })
+
+    return {"slide_context": content.get("slide_context", ""), "elements": elements}
+
+
+def _duplicate_key(elem: dict[str, Any]) -> Optional[tuple]:
+    """
+    Key under which identical elements of one payload share a translation.
+
+    Titles return None (never deduplicated): the same words are translated
+    differently depending on where they head the slide.
+    """
+    role = elem.get("role", "content")
+    if role == "title":
+        return None
+    return role, tuple(
+        (para.get("text", ""), para.get("level", para.get("lvl", 0)))
+        for para in elem.get("paragraphs", [])
+    )
 
 
-# ============================================================================
-# CONVENIENCE FUNCTIONS
-# ============================================================================
 def load_content_json(path: str) -> dict[str, Any]:
     """Load slide content from a JSON file."""
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return json_codec.load_file(path)
 
 
 def save_translated_json(translated: TranslatedSlide | dict, path: str) -> None:
@@ -410,8 +1084,7 @@ def save_translated_json(translated: TranslatedSlide | dict, path: str) -> None:
     else:
         data = translated
 
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    json_codec.dump_file(data, path)
 
 
 # ============================================================================
@@ -419,7 +1092,10 @@ def save_translated_json(translated: TranslatedSlide | dict, path: str) -> None:
 # ============================================================================
 if __name__ == "__main__":
     import argparse
-    import glob
+    try:
+        from .harness import latest_matching
+    except ImportError:  # Running this module directly as a script
+        from harness import latest_matching
 
     parser = argparse.ArgumentParser(description="Translate slide content JSON")
     parser.add_argument(
@@ -442,21 +1118,18 @@ if __name__ == "__main__":
     if args.input:
         input_path = args.input
     else:
-        patterns = [
-            "output_xmls/slide*_content*.json",
-            "work_*/slide*_content*.json",
-        ]
-        json_files = []
-        for pattern in patterns:
-            json_files.extend(glob.glob(pattern))
+        # output_xmls/ plus every work_*/ directory of a debug run
+        search_dirs = ["output_xmls"] + sorted(
+            entry.name for entry in os.scandir(".")
+            if entry.name.startswith("work_") and entry.is_dir()
+        )
+        input_path = latest_matching(search_dirs, ["slide*_content*.json"])
 
-        if not json_files:
+        if input_path is None:
             print("ERROR: No content JSON files found.")
             print("Run the content processor first to extract text.")
             exit(1)
 
-        input_path = max(json_files, key=os.path.getmtime)
-
     # Determine output path
     if args.output:
         output_path = args.output
@@ -0,0 +1,249 @@
+# src/translator/translation_memory.py
+"""
+Translation Memory for Slide Translator
+
+Caches element-level translations so boilerplate repeated across slide
+masters, layouts, charts and decks ("Confidential", page labels, logo
+captions) is sent to the LLM only once.
+
+Key features:
+- Entries keyed on sha1 of the element role + source text/paragraphs,
+  namespaced by model and prompt version so engines never share entries
+- Payloads are split into cached hits and a smaller request of misses
+- Elements with nothing to translate (blank, numbers, percentages,
+  currency amounts) never reach the LLM
+- Persisted as JSON (~/.cache/ppt-translator/tm.json) with a TTL
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    from . import json_codec
+except ImportError:  # Running this module directly as a script
+    import json_codec
+
+
+DEFAULT_TM_PATH = os.path.join(os.path.expanduser("~"), ".cache", "ppt-translator", "tm.json")
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600  # 30 days
+
+# Paragraph text with no letters to translate: digits, separators, signs,
+# currency and percent (the prompts keep these as-is anyway)
+_NO_WORDS_RE = re.compile(r"[\d\s.,:;%$€£¥+\-–—()/#×]*")
+
+
+class TranslationMemory:
+    """
+    Persistent element-level translation cache.
+
+    Usage:
+        tm = TranslationMemory()
+        hits, request = tm.split(content_json, namespace)
+        translated = llm(request) if request["elements"] else None
+        result = tm.merge(content_json, hits, translated, namespace)
+        tm.save()
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = DEFAULT_TM_PATH,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        verbose: bool = False
+    ):
+        """
+        Initialize the translation memory.
+
+        Args:
+            path: JSON file to load from / save to (None keeps it in memory only)
+            ttl_seconds: Entries older than this are ignored and dropped on save
+            verbose: Print cache statistics
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.verbose = verbose
+        self._tm_cache: Dict[str, Dict[str, Any]] = {}
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if path and os.path.exists(path):
+            self._load()
+
+    # ========================================================================
+    # PERSISTENCE
+    # ========================================================================
+    def _load(self) -> None:
+        """Load non-expired entries from disk, ignoring unreadable files."""
+        try:
+            entries = json_codec.load_file(self.path)
+        except (OSError, ValueError) as e:
+            if self.verbose:
+                print(f"[TranslationMemory] Ignoring unreadable cache {self.path}: {e}")
+            return
+
+        cutoff = time.time() - self.ttl_seconds
+        self._tm_cache = {
+            key: entry for key, entry in entries.items()
+            if entry.get("ts", 0) >= cutoff
+        }
+
+        if self.verbose:
+            print(f"[TranslationMemory] Loaded {len(self._tm_cache)} entries from {self.path}")
+
+    def save(self) -> None:
+        """Write the cache to disk if it changed (atomic replace)."""
+        if not self.path or not self._dirty:
+            return
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        json_codec.dump_file(self._tm_cache, tmp_path, indent=False)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+        if self.verbose:
+            print(f"[TranslationMemory] Saved {len(self._tm_cache)} entries to {self.path}")
+
+    def clear(self) -> None:
+        """Forget every entry and delete the cache file."""
+        self._tm_cache = {}
+        self._dirty = False
+        if self.path and os.path.exists(self.path):
+            os.remove(self.path)
+
+        if self.verbose:
+            print(f"[TranslationMemory] Cleared {self.path}")
+
+    # ========================================================================
+    # LOOKUP
+    # ========================================================================
+    @staticmethod
+    def element_key(element: Dict[str, Any], namespace: str = "") -> str:
+        """
+        Hash an element's role and source text (including paragraph layout).
+
+        Uses stdlib json so keys stay stable whether or not orjson is installed.
+
+        Args:
+            element: Source element
+            namespace: Who translates it (model and prompt version, see
+                       main._cache_namespace()); other namespaces never match
+        """
+        paragraphs = [
+            [p.get("text", ""), p.get("level", 0), p.get("is_bold", False)]
+            for p in element.get("paragraphs", [])
+        ]
+        source = json.dumps(
+            [namespace, element.get("role", ""), element.get("text", ""), paragraphs],
+            ensure_ascii=False
+        )
+        return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+    def split(
+        self,
+        content_json: Dict[str, Any],
+        namespace: str = ""
+    ) -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """
+        Split a payload into cached translations and a request for the misses.
+
+        Elements without translatable text are returned as hits of
+        themselves (and not counted), so they are never sent either.
+
+        Args:
+            content_json: The full payload
+            namespace: Cache namespace of the translator (see element_key())
+
+        Returns:
+            Tuple of (hits, request): element id -> translated element for cache
+            hits, and a copy of content_json containing only uncached elements.
+        """
+        cutoff = time.time() - self.ttl_seconds
+        hits = {}
+        misses: List[Dict[str, Any]] = []
+        passthrough = 0
+
+        for elem in content_json.get("elements", []):
+            if not _has_words(elem):
+                hits[elem["id"]] = elem
+                passthrough += 1
+                continue
+
+            entry = self._tm_cache.get(self.element_key(elem, namespace))
+            if entry is not None and entry.get("ts", 0) >= cutoff:
+                paragraphs = entry["paragraphs"]
+                hits[elem["id"]] = {
+                    **elem,
+                    "text": "\n".join(p.get("text", "") for p in paragraphs),
+                    "paragraphs": paragraphs,
+                }
+            else:
+                misses.append(elem)
+
+        self.hits += len(hits) - passthrough
+        self.misses += len(misses)
+
+        request = {**content_json, "elements": misses}
+        return hits, request
+
+    def merge(
+        self,
+        content_json: Dict[str, Any],
+        hits: Dict[str, Dict[str, Any]],
+        translated: Optional[Dict[str, Any]] = None,
+        namespace: str = ""
+    ) -> Dict[str, Any]:
+        """
+        Splice cached and freshly translated elements back into original order.
+
+        Newly translated elements are added to the cache, except ones that
+        came back unchanged (the translator keeps the source text of elements
+        the LLM omitted; those must be retried, not remembered).
+
+        Args:
+            content_json: The original (full) payload
+            hits: Cached translations returned by split()
+            translated: LLM response for the request of misses, if one was sent
+            namespace: Cache namespace passed to split()
+
+        Returns:
+            Translated payload covering every element of content_json
+        """
+        fresh = {}
+        if translated is not None:
+            fresh = {elem["id"]: elem for elem in translated.get("elements", [])}
+
+        now = time.time()
+        elements = []
+        for elem in content_json.get("elements", []):
+            elem_id = elem["id"]
+            if elem_id in hits:
+                elements.append(hits[elem_id])
+            elif elem_id in fresh:
+                result = fresh[elem_id]
+                if _paragraph_texts(result) != _paragraph_texts(elem):
+                    self._tm_cache[self.element_key(elem, namespace)] = {
+                        "paragraphs": result.get("paragraphs", []),
+                        "ts": now,
+                    }
+                    self._dirty = True
+                elements.append(result)
+
+        merged = dict(translated) if translated is not None else dict(content_json)
+        merged["elements"] = elements
+        return merged
+
+
+def _has_words(element: Dict[str, Any]) -> bool:
+    """Whether any paragraph (or the element text) has something to translate."""
+    texts = _paragraph_texts(element) or [element.get("text", "")]
+    return not all(_NO_WORDS_RE.fullmatch(text) for text in texts)
+
+
+def _paragraph_texts(element: Dict[str, Any]) -> List[str]:
+    """Paragraph texts of an element (to spot translations equal to the source)."""
+    return [p.get("text", "") for p in element.get("paragraphs", [])]
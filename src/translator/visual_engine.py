@@ -15,11 +15,17 @@ Key improvements over basic ElementTree approach:
 - Smart logo detection to avoid flipping brand assets
 """
 
+import copy
+import functools
 import os
-from typing import Dict, Optional, Set
-from dataclasses import dataclass
+import re
+from typing import Dict, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass, field
 from lxml import etree
 
+# XML input: a file path, raw XML bytes, or an already parsed element
+XMLSource = Union[str, bytes, etree._Element]
+
 # ============================================================================
 # NAMESPACE CONFIGURATION
 # ============================================================================
@@ -35,38 +41,182 @@ NAMESPACES: Dict[str, str] = {
     "p15": "http://schemas.microsoft.com/office/powerpoint/2012/main",
 }
 
-# Shorthand for xpath queries
-NS = NAMESPACES
-
 
 def qn(tag: str) -> str:
     """Convert prefixed tag to Clark notation: 'a:off' -> '{uri}off'"""
     if ":" not in tag:
         return tag
     prefix, local = tag.split(":", 1)
-    if prefix not in NS:
+    if prefix not in NAMESPACES:
         raise ValueError(f"Unknown namespace prefix: {prefix}")
-    return f"{{{NS[prefix]}}}{local}"
+    return f"{{{NAMESPACES[prefix]}}}{local}"
+
+
+# Clark-notation tags: find()/findall() with a plain tag skips ElementPath
+# prefix resolution, and SubElement() gets the final name without qn()
+_TAG_SP = qn("p:sp")
+_TAG_PIC = qn("p:pic")
+_TAG_CXNSP = qn("p:cxnSp")
+_TAG_GRPSP = qn("p:grpSp")
+_TAG_GRAPHICFRAME = qn("p:graphicFrame")
+_TAG_TXBODY = qn("p:txBody")
+_TAG_OFF = qn("a:off")
+_TAG_EXT = qn("a:ext")
+_TAG_CHOFF = qn("a:chOff")
+_TAG_CHEXT = qn("a:chExt")
+_TAG_TBLGRID = qn("a:tblGrid")
+_TAG_GRIDCOL = qn("a:gridCol")
+_TAG_TR = qn("a:tr")
+_TAG_TC = qn("a:tc")
+_TAG_A_TXBODY = qn("a:txBody")
+_TAG_BODYPR = qn("a:bodyPr")
+_TAG_P = qn("a:p")
+_TAG_PPR = qn("a:pPr")
+_TAG_R = qn("a:r")
+_TAG_RPR = qn("a:rPr")
+_TAG_DEFRPR = qn("a:defRPr")
+_TAG_LATIN = qn("a:latin")
+_TAG_CS = qn("a:cs")
+_TAG_T = qn("a:t")
+
+# flipH value after toggling (xsd:boolean; unset or false -> "1")
+_FLIP_TOGGLE = {"1": "0", "true": "0"}
+
+# One parser for every engine in the process (OOXML has no xml:id attributes
+# or external entities, so skip the ID table and entity resolution)
+_PARSER = etree.XMLParser(
+    remove_blank_text=False,
+    strip_cdata=False,
+    collect_ids=False,
+    resolve_entities=False,
+    no_network=True
+)
+
+# XPath compiled once at import instead of on every call. Multi-step and
+# descendant lookups run as one libxml2 query (~2-3x faster than find());
+# single-child lookups stay find(_TAG_*).
+_XP_HAS_TEXT = etree.XPath("boolean(.//a:t[normalize-space()])", namespaces=NAMESPACES)
+_XP_SPTREE = etree.XPath(".//p:cSld/p:spTree", namespaces=NAMESPACES)
+_XP_SLDSZ = etree.XPath(".//p:sldSz", namespaces=NAMESPACES)
+_XP_SPPR_XFRM = etree.XPath("p:spPr/a:xfrm", namespaces=NAMESPACES)
+_XP_SPPR_OFF = etree.XPath("p:spPr/a:xfrm/a:off", namespaces=NAMESPACES)
+# Document order, so a complete transform yields [off, ext]
+_XP_SPPR_OFF_EXT = etree.XPath("p:spPr/a:xfrm/a:off | p:spPr/a:xfrm/a:ext", namespaces=NAMESPACES)
+_XP_GRP_XFRM = etree.XPath("p:grpSpPr/a:xfrm", namespaces=NAMESPACES)
+_XP_FRAME_XFRM = etree.XPath(".//p:xfrm", namespaces=NAMESPACES)
+_XP_GRAPHIC_DATA = etree.XPath("(.//a:graphic)[1]/a:graphicData", namespaces=NAMESPACES)
+_XP_TBL = etree.XPath(".//a:tbl", namespaces=NAMESPACES)
+_XP_PRSTGEOM = etree.XPath(".//a:prstGeom", namespaces=NAMESPACES)
+# nvSpPr/nvPicPr come first in a shape, so the first cNvPr in document
+# order is the shape's own (or, for other elements, the first nested one)
+_XP_CNVPR = etree.XPath(
+    "(p:nvSpPr/p:cNvPr | p:nvPicPr/p:cNvPr | .//p:cNvPr)[1]", namespaces=NAMESPACES
+)
+
+# Run properties given to runs that have none: Arabic language plus the
+# Simplified Arabic / Arial font pair. Copied in as one subtree per run.
+_RPR_TEMPLATE = etree.fromstring(
+    f'<a:rPr xmlns:a="{NAMESPACES["a"]}" lang="ar-SA">'
+    '<a:cs typeface="Simplified Arabic" pitchFamily="34" charset="178"/>'
+    '<a:latin typeface="Arial" pitchFamily="34" charset="0"/>'
+    '</a:rPr>'
+)
+
+# Statistics counters: slots in a per-engine list (a subscript per update
+# instead of a string-keyed dict lookup). The first _BASE_STATS are always
+# reported; the rest only once they are non-zero.
+(
+    _S_SHAPES_MIRRORED,
+    _S_PICTURES_MIRRORED,
+    _S_GROUPS_MIRRORED,
+    _S_CONNECTORS_MIRRORED,
+    _S_TEXT_BODIES_PROCESSED,
+    _S_SHAPES_FLIPPED,
+    _S_LOGOS_PRESERVED,
+    _S_ERRORS,
+    _S_CHARTS_MIRRORED,
+    _S_TABLES_MIRRORED,
+    _S_SMARTART_MIRRORED,
+    _S_OTHER_GRAPHICS_MIRRORED,
+    _S_TABLE_CELLS_PROCESSED,
+) = range(13)
+_STAT_KEYS = (
+    "shapes_mirrored",
+    "pictures_mirrored",
+    "groups_mirrored",
+    "connectors_mirrored",
+    "text_bodies_processed",
+    "shapes_flipped",
+    "logos_preserved",
+    "errors",
+    "charts_mirrored",
+    "tables_mirrored",
+    "smartart_mirrored",
+    "other_graphics_mirrored",
+    "table_cells_processed",
+)
+_BASE_STATS = 7
+
+
+def _first(nodes: list) -> Optional[etree._Element]:
+    """First result of a compiled XPath node-set query, or None."""
+    return nodes[0] if nodes else None
+
+
+def _slide_width_of(pres_root: etree._Element) -> Optional[int]:
+    """Slide width (p:sldSz cx) of a parsed presentation.xml, or None."""
+    sld_sz = _first(_XP_SLDSZ(pres_root))
+    cx = sld_sz.get("cx") if sld_sz is not None else None
+    return int(cx) if cx else None
+
+
+@functools.lru_cache(maxsize=8)
+def _read_slide_width(source: Union[str, bytes], mtime_ns: int = 0) -> Optional[int]:
+    """
+    Parse presentation.xml (path or bytes) for its slide width, once per deck.
+
+    Every engine built for the same deck (one per slide, or one per worker
+    process) shares the result instead of re-parsing the file.
+    """
+    if isinstance(source, bytes):
+        return _slide_width_of(etree.fromstring(source, _PARSER))
+    return _slide_width_of(etree.parse(source, _PARSER).getroot())
+
+
+def _reverse_in_place(parent: etree._Element, children: List[etree._Element]) -> None:
+    """
+    Reverse a contiguous run of parent's children with one slice assignment.
+
+    Siblings outside the run (e.g. a trailing a:extLst) keep their position.
+    """
+    start = parent.index(children[0])
+    parent[start:start + len(children)] = children[::-1]
 
 
 # ============================================================================
 # GEOMETRY HELPERS
 # ============================================================================
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BoundingBox:
-    """Represents a shape's position and size in EMUs."""
+    """
+    Represents a shape's position and size in EMUs (immutable, no per-instance __dict__).
+
+    right_edge and aspect_ratio are derived once at construction, since the
+    flip/logo heuristics read them several times per shape.
+    """
     x: int
     y: int
     width: int
     height: int
-
-    @property
-    def right_edge(self) -> int:
-        return self.x + self.width
-
-    @property
-    def aspect_ratio(self) -> float:
-        return self.width / self.height if self.height > 0 else 0
+    right_edge: int = field(init=False)
+    aspect_ratio: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Frozen: assign the derived fields through object.__setattr__
+        object.__setattr__(self, "right_edge", self.x + self.width)
+        object.__setattr__(
+            self, "aspect_ratio", self.width / self.height if self.height > 0 else 0
+        )
 
 
 def mirror_x(x: int, width: int, space_width: int, space_offset: int = 0) -> int:
@@ -76,10 +226,10 @@ def mirror_x(x: int, width: int, space_width: int, space_offset: int = 0) -> int
     Formula: new_x = space_offset + (space_width - ((x - space_offset) + width))
 
     This places the RIGHT edge of the shape where the LEFT edge was (mirrored).
+    Evaluated as one expression (no temporaries); memoizing would cost more
+    than the arithmetic it saves.
     """
-    relative_x = x - space_offset
-    new_relative_x = space_width - (relative_x + width)
-    return space_offset + new_relative_x
+    return 2 * space_offset + space_width - x - width
 
 
 # ============================================================================
@@ -109,14 +259,16 @@ class RTLVisualEngine:
         "logo", "watermark", "brand", "trademark", "icon",
         "emblem", "badge", "seal", "copyright"
     }
+    # All keywords as one pattern: a single scan of the name per shape
+    _LOGO_RE = re.compile("|".join(map(re.escape, sorted(LOGO_KEYWORDS))))
 
     # Default slide width in EMUs (12192000 = 16:9 widescreen at 96 DPI)
     DEFAULT_SLIDE_WIDTH: int = 12192000
 
     def __init__(
         self,
-        presentation_xml_path: str,
-        slide_xml_path: str,
+        presentation_xml_path: XMLSource,
+        slide_xml_path: Optional[XMLSource] = None,
         layout_flip_ratio: float = 0.4,
         flip_connectors: bool = True,
         verbose: bool = True
@@ -125,55 +277,110 @@ class RTLVisualEngine:
         Initialize the RTL Visual Engine.
 
         Args:
-            presentation_xml_path: Path to presentation.xml (for slide dimensions)
-            slide_xml_path: Path to the slide XML to transform
+            presentation_xml_path: presentation.xml (for slide dimensions) as a
+                                   path, bytes, or parsed root element (read only)
+            slide_xml_path: Slide XML to transform as a path, bytes, or parsed
+                            element (transformed in place). May be omitted and
+                            set later with reset_slide().
             layout_flip_ratio: Shapes wider than this ratio of slide width get flipH
             flip_connectors: Whether to mirror connector shapes (lines)
             verbose: Print transformation details
         """
         self.presentation_xml_path = presentation_xml_path
-        self.slide_xml_path = slide_xml_path
         self.layout_flip_ratio = layout_flip_ratio
         self.flip_connectors = flip_connectors
         self.verbose = verbose
-
-        # Statistics for reporting
-        self.stats = {
-            "shapes_mirrored": 0,
-            "pictures_mirrored": 0,
-            "groups_mirrored": 0,
-            "connectors_mirrored": 0,
-            "text_bodies_processed": 0,
-            "shapes_flipped": 0,
-            "logos_preserved": 0,
+        self.process_text = True  # Set per transform() call
+
+        # Child tag -> (handler, label for warnings), used by _process_container
+        self._handlers = {
+            _TAG_SP: (self._process_shape, "shape"),
+            _TAG_PIC: (self._process_picture, "picture"),
+            _TAG_GRPSP: (self._process_group, "group"),
+            _TAG_GRAPHICFRAME: (self._process_graphicFrame, "graphicFrame"),
         }
+        if flip_connectors:
+            # Lines and arrows between shapes
+            self._handlers[_TAG_CXNSP] = (self._process_connector, "connector")
 
         # Parse the slide XML using lxml (preserves namespace prefixes!)
-        self.parser = etree.XMLParser(remove_blank_text=False, strip_cdata=False)
-        self.tree = etree.parse(slide_xml_path, self.parser)
-        self.root = self.tree.getroot()
+        self.parser = _PARSER
 
-        # Extract slide dimensions from presentation.xml
+        # Extract slide dimensions from presentation.xml (once per engine)
         self.slide_width = self._extract_slide_width()
         self.flip_threshold = int(self.slide_width * layout_flip_ratio)
 
+        self.slide_xml_path = None
+        self.tree = None
+        self.root = None
+        if slide_xml_path is not None:
+            self.reset_slide(slide_xml_path)
+
         if self.verbose:
             print(f"[RTLVisualEngine] Initialized")
             print(f"  Slide width: {self.slide_width} EMUs ({self.slide_width / 914400:.1f} inches)")
             print(f"  Flip threshold: {self.flip_threshold} EMUs ({layout_flip_ratio*100:.0f}% of width)")
 
+    def reset_slide(self, slide_xml_path: XMLSource) -> None:
+        """
+        Point the engine at another slide (or master/layout) tree.
+
+        Presentation state (slide width, flip threshold) is kept, so one
+        engine can transform many slides without re-reading presentation.xml.
+        """
+        self.slide_xml_path = slide_xml_path
+        self.tree = self._parse(slide_xml_path)
+        self.root = self.tree.getroot()
+
+        # Statistics for reporting (indexed by the _S_* constants)
+        self._counts = [0] * len(_STAT_KEYS)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Transformation statistics (optional counters only once non-zero)."""
+        return {
+            key: count
+            for i, (key, count) in enumerate(zip(_STAT_KEYS, self._counts))
+            if i < _BASE_STATS or count
+        }
+
+    def close(self) -> None:
+        """
+        Drop the current slide tree so libxml2 can free it.
+
+        The engine stays usable: reset_slide() loads the next slide. Also
+        called on leaving a `with RTLVisualEngine(...) as engine:` block.
+        """
+        self.tree = None
+        self.root = None
+
+    def __enter__(self) -> "RTLVisualEngine":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _parse(self, source: XMLSource) -> etree._ElementTree:
+        """Parse a path or XML bytes; an element is used as-is."""
+        if isinstance(source, etree._Element):
+            return source.getroottree()
+        if isinstance(source, bytes):
+            return etree.ElementTree(etree.fromstring(source, self.parser))
+        return etree.parse(source, self.parser)
+
     def _extract_slide_width(self) -> int:
         """Extract slide width from presentation.xml."""
+        source = self.presentation_xml_path
         try:
-            pres_tree = etree.parse(self.presentation_xml_path, self.parser)
-            pres_root = pres_tree.getroot()
-
-            # Try different possible paths for sldSz
-            sld_sz = pres_root.find(".//p:sldSz", NS)
-            if sld_sz is not None:
-                cx = sld_sz.get("cx")
-                if cx:
-                    return int(cx)
+            if isinstance(source, etree._Element):
+                width = _slide_width_of(source.getroottree().getroot())
+            elif isinstance(source, bytes):
+                width = _read_slide_width(source)
+            else:
+                # mtime in the key: an edited file is read again
+                width = _read_slide_width(source, os.stat(source).st_mtime_ns)
+            if width:
+                return width
         except Exception as e:
             if self.verbose:
                 print(f"  Warning: Could not read slide width: {e}")
@@ -183,10 +390,16 @@ class RTLVisualEngine:
     # ========================================================================
     # MAIN TRANSFORMATION ENTRY POINT
     # ========================================================================
-    def transform(self) -> Dict[str, int]:
+    def transform(self, has_text: Optional[bool] = True) -> Dict[str, int]:
         """
         Execute the full RTL transformation on the slide.
 
+        Args:
+            has_text: Whether the slide contains any text. When False (divider
+                      or image-only slides) only geometry is mirrored and the
+                      paragraph/run level RTL pass is skipped entirely. None
+                      detects it from the XML (any non-blank a:t).
+
         Returns:
             Dictionary of transformation statistics
         """
@@ -194,19 +407,26 @@ class RTLVisualEngine:
             print(f"\n[RTLVisualEngine] Starting transformation...")
 
         # Find the shape tree (p:spTree) which contains all slide content
-        sp_tree = self.root.find(".//p:cSld/p:spTree", NS)
+        sp_tree = _first(_XP_SPTREE(self.root))
         if sp_tree is None:
             raise ValueError("Could not find p:spTree in slide XML")
 
+        if has_text is None:
+            has_text = _XP_HAS_TEXT(sp_tree)
+        self.process_text = has_text
+        if self.verbose and not has_text:
+            print(f"  No text on slide: mirroring geometry only")
+
         # Process the entire tree with slide-level coordinate space
         self._process_container(sp_tree, self.slide_width, 0)
+        stats = self.stats
 
         if self.verbose:
             print(f"\n[RTLVisualEngine] Transformation complete:")
-            for key, value in self.stats.items():
+            for key, value in stats.items():
                 print(f"  {key}: {value}")
 
-        return self.stats
+        return stats
 
     def save(self, output_path: str) -> None:
         """
@@ -229,7 +449,7 @@ class RTLVisualEngine:
             print(f"\n[RTLVisualEngine] Saved to: {output_path}")
 
     # ========================================================================
-    # CONTAINER PROCESSING (Recursive)
+    # CONTAINER PROCESSING
     # ========================================================================
     def _process_container(
         self,
@@ -238,66 +458,41 @@ class RTLVisualEngine:
         space_offset: int
     ) -> None:
         """
-        Process all child elements within a container (spTree or grpSp).
+        Process all child elements within a container (spTree) and its groups.
+
+        Each container's children are walked once and dispatched on their
+        tag. Groups push their child coordinate space onto an explicit stack
+        instead of recursing, so deeply nested groups cannot hit the
+        recursion limit.
 
         Args:
             container: The parent element containing shapes
             space_width: Width of the coordinate space (slide or group)
             space_offset: X offset of the coordinate space
         """
-        # Process regular shapes (p:sp)
-        for sp in container.findall("p:sp", NS):
-            try:
-                self._process_shape(sp, space_width, space_offset)
-            except Exception as e:
-                if self.verbose:
-                    name = self._get_element_name(sp)
-                    print(f"  Warning: Failed to process shape '{name}': {e}")
-                self.stats.setdefault("errors", 0)
-                self.stats["errors"] += 1
-
-        # Process pictures (p:pic)
-        for pic in container.findall("p:pic", NS):
-            try:
-                self._process_picture(pic, space_width, space_offset)
-            except Exception as e:
-                if self.verbose:
-                    name = self._get_element_name(pic)
-                    print(f"  Warning: Failed to process picture '{name}': {e}")
-                self.stats.setdefault("errors", 0)
-                self.stats["errors"] += 1
-
-        # Process connector shapes (p:cxnSp) - lines, arrows between shapes
-        if self.flip_connectors:
-            for cxn in container.findall("p:cxnSp", NS):
+        # Bound methods as locals: the loop body runs once per child element
+        get_handler = self._handlers.get
+        stack = [(container, space_width, space_offset)]
+        push = stack.append
+        while stack:
+            parent, width, offset = stack.pop()
+            for child in parent:
+                entry = get_handler(child.tag)
+                if entry is None:
+                    continue
+                handler, kind = entry
                 try:
-                    self._process_connector(cxn, space_width, space_offset)
+                    child_space = handler(child, width, offset)
                 except Exception as e:
                     if self.verbose:
-                        print(f"  Warning: Failed to process connector: {e}")
-                    self.stats.setdefault("errors", 0)
-                    self.stats["errors"] += 1
-
-        # Process groups (p:grpSp) - recursively!
-        for grp in container.findall("p:grpSp", NS):
-            try:
-                self._process_group(grp, space_width, space_offset)
-            except Exception as e:
-                if self.verbose:
-                    print(f"  Warning: Failed to process group: {e}")
-                self.stats.setdefault("errors", 0)
-                self.stats["errors"] += 1
-
-        # Process graphicFrames (charts, tables, SmartArt)
-        for gfx in container.findall("p:graphicFrame", NS):
-            try:
-                self._process_graphicFrame(gfx, space_width, space_offset)
-            except Exception as e:
-                if self.verbose:
-                    name = self._get_element_name(gfx)
-                    print(f"  Warning: Failed to process graphicFrame '{name}': {e}")
-                self.stats.setdefault("errors", 0)
-                self.stats["errors"] += 1
+                        name = self._get_element_name(child)
+                        print(f"  Warning: Failed to process {kind} '{name}': {e}")
+                    self._counts[_S_ERRORS] += 1
+                    continue
+
+                # Groups return their child coordinate space
+                if child_space is not None:
+                    push((child, *child_space))
 
     # ========================================================================
     # SHAPE PROCESSING
@@ -309,25 +504,26 @@ class RTLVisualEngine:
         space_offset: int
     ) -> None:
         """Process a regular shape (p:sp)."""
-        bbox = self._get_bounding_box(element, "p:spPr")
-        if bbox is None:
+        located = self._get_bbox_and_off(element)
+        if located is None:
             return
+        bbox, off = located
 
         name = self._get_element_name(element)
 
         # Mirror the X coordinate
         new_x = mirror_x(bbox.x, bbox.width, space_width, space_offset)
-        self._set_offset_x(element, "p:spPr", new_x)
-        self.stats["shapes_mirrored"] += 1
+        off.set("x", str(new_x))
+        self._counts[_S_SHAPES_MIRRORED] += 1
 
         # Check if shape should be horizontally flipped
         if self._should_flip_shape(element, bbox, name):
-            self._set_flip_h(element, "p:spPr")
-            self.stats["shapes_flipped"] += 1
+            self._set_flip_h(element)
+            self._counts[_S_SHAPES_FLIPPED] += 1
 
         # Process text content
-        tx_body = element.find("p:txBody", NS)
-        if tx_body is not None:
+        tx_body = element.find(_TAG_TXBODY)
+        if tx_body is not None and self.process_text:
             self._process_text_body(tx_body)
 
     def _process_picture(
@@ -337,19 +533,20 @@ class RTLVisualEngine:
         space_offset: int
     ) -> None:
         """Process a picture (p:pic)."""
-        bbox = self._get_bounding_box(element, "p:spPr")
-        if bbox is None:
+        located = self._get_bbox_and_off(element)
+        if located is None:
             return
+        bbox, off = located
 
         # Mirror the X coordinate
         new_x = mirror_x(bbox.x, bbox.width, space_width, space_offset)
-        self._set_offset_x(element, "p:spPr", new_x)
-        self.stats["pictures_mirrored"] += 1
+        off.set("x", str(new_x))
+        self._counts[_S_PICTURES_MIRRORED] += 1
 
         # NEVER flip images - they are decorative elements (icons, logos, photos)
         # Only their position is mirrored, not their visual content
         # This prevents icons and decorative elements from being flipped incorrectly
-        self.stats["logos_preserved"] += 1
+        self._counts[_S_LOGOS_PRESERVED] += 1
 
     def _process_connector(
         self,
@@ -358,44 +555,44 @@ class RTLVisualEngine:
         space_offset: int
     ) -> None:
         """Process a connector shape (p:cxnSp) - lines."""
-        bbox = self._get_bounding_box(element, "p:spPr")
-        if bbox is None:
+        located = self._get_bbox_and_off(element)
+        if located is None:
             return
+        bbox, off = located
 
         # Mirror the X coordinate
         new_x = mirror_x(bbox.x, bbox.width, space_width, space_offset)
-        self._set_offset_x(element, "p:spPr", new_x)
-        self.stats["connectors_mirrored"] += 1
+        off.set("x", str(new_x))
+        self._counts[_S_CONNECTORS_MIRRORED] += 1
 
         # Flip the connector itself if it's directional
         # This ensures arrows point the correct direction in RTL
-        xfrm = element.find("p:spPr/a:xfrm", NS)
-        if xfrm is not None:
-            # Flip horizontal orientation
-            current_flip = xfrm.get("flipH", "0")
-            new_flip = "0" if current_flip == "1" else "1"
-            xfrm.set("flipH", new_flip)
+        # Flip horizontal orientation (a:off's parent is the a:xfrm)
+        xfrm = off.getparent()
+        xfrm.set("flipH", _FLIP_TOGGLE.get(xfrm.get("flipH"), "1"))
 
     def _process_group(
         self,
         element: etree._Element,
         space_width: int,
         space_offset: int
-    ) -> None:
-        """Process a group (p:grpSp) and its children."""
-        # Get the group's position in parent coordinate space
-        grp_sp_pr = element.find("p:grpSpPr", NS)
-        if grp_sp_pr is None:
-            return
+    ) -> Optional[Tuple[int, int]]:
+        """
+        Mirror a group (p:grpSp).
 
-        xfrm = grp_sp_pr.find("a:xfrm", NS)
+        Returns:
+            (width, offset) of the group's child coordinate space, in which
+            _process_container then processes the children
+        """
+        # Get the group's position in parent coordinate space
+        xfrm = _first(_XP_GRP_XFRM(element))
         if xfrm is None:
-            return
+            return None
 
-        off = xfrm.find("a:off", NS)
-        ext = xfrm.find("a:ext", NS)
+        off = xfrm.find(_TAG_OFF)
+        ext = xfrm.find(_TAG_EXT)
         if off is None or ext is None:
-            return
+            return None
 
         # Get group's bounding box in parent space
         group_x = int(off.get("x", "0"))
@@ -404,11 +601,11 @@ class RTLVisualEngine:
         # Mirror the group's position
         new_x = mirror_x(group_x, group_width, space_width, space_offset)
         off.set("x", str(new_x))
-        self.stats["groups_mirrored"] += 1
+        self._counts[_S_GROUPS_MIRRORED] += 1
 
         # Get the child coordinate space (chOff/chExt)
-        ch_off = xfrm.find("a:chOff", NS)
-        ch_ext = xfrm.find("a:chExt", NS)
+        ch_off = xfrm.find(_TAG_CHOFF)
+        ch_ext = xfrm.find(_TAG_CHEXT)
 
         if ch_off is not None and ch_ext is not None:
             child_offset = int(ch_off.get("x", "0"))
@@ -418,8 +615,7 @@ class RTLVisualEngine:
             child_offset = 0
             child_width = group_width
 
-        # Recursively process children in the group's coordinate space
-        self._process_container(element, child_width, child_offset)
+        return child_width, child_offset
 
     def _process_graphicFrame(
         self,
@@ -437,12 +633,12 @@ class RTLVisualEngine:
         """
         try:
             # Get bounding box from xfrm
-            xfrm = element.find(".//p:xfrm", NS)
+            xfrm = _first(_XP_FRAME_XFRM(element))
             if xfrm is None:
                 return
 
-            off = xfrm.find("a:off", NS)
-            ext = xfrm.find("a:ext", NS)
+            off = xfrm.find(_TAG_OFF)
+            ext = xfrm.find(_TAG_EXT)
             if off is None or ext is None:
                 return
 
@@ -454,11 +650,7 @@ class RTLVisualEngine:
             off.set("x", str(new_x))
 
             # Determine type of graphic (chart, table, SmartArt, etc.)
-            graphic = element.find(".//a:graphic", NS)
-            if graphic is None:
-                return
-
-            graphic_data = graphic.find("a:graphicData", NS)
+            graphic_data = _first(_XP_GRAPHIC_DATA(element))
             if graphic_data is None:
                 return
 
@@ -468,37 +660,32 @@ class RTLVisualEngine:
             if "chart" in uri:
                 # Chart: position mirrored, but chart internals are complex
                 # Note: Full chart mirroring would require parsing chart XML files
-                self.stats.setdefault("charts_mirrored", 0)
-                self.stats["charts_mirrored"] += 1
+                self._counts[_S_CHARTS_MIRRORED] += 1
                 if self.verbose:
                     print(f"    [Chart] Mirrored position (internal chart layout not modified)")
 
             elif "table" in uri:
                 # Table: mirror position and process table structure
-                table = graphic_data.find(".//a:tbl", NS)
+                table = _first(_XP_TBL(graphic_data))
                 if table is not None:
                     self._process_table(table)
-                self.stats.setdefault("tables_mirrored", 0)
-                self.stats["tables_mirrored"] += 1
+                self._counts[_S_TABLES_MIRRORED] += 1
 
             elif "smartArt" in uri or "diagram" in uri:
                 # SmartArt/Diagram: mirror position only
-                self.stats.setdefault("smartart_mirrored", 0)
-                self.stats["smartart_mirrored"] += 1
+                self._counts[_S_SMARTART_MIRRORED] += 1
                 if self.verbose:
                     print(f"    [SmartArt] Mirrored position")
 
             else:
                 # Other graphic types (OLE objects, etc.)
-                self.stats.setdefault("other_graphics_mirrored", 0)
-                self.stats["other_graphics_mirrored"] += 1
+                self._counts[_S_OTHER_GRAPHICS_MIRRORED] += 1
 
         except Exception as e:
             # Robust error handling: log but continue processing
             if self.verbose:
                 print(f"    Warning: Error processing graphicFrame: {e}")
-            self.stats.setdefault("errors", 0)
-            self.stats["errors"] += 1
+            self._counts[_S_ERRORS] += 1
 
     def _process_table(self, table: etree._Element) -> None:
         """
@@ -513,58 +700,43 @@ class RTLVisualEngine:
         """
         try:
             # Get table grid (column definitions)
-            tbl_grid = table.find("a:tblGrid", NS)
+            tbl_grid = table.find(_TAG_TBLGRID)
 
-            # Reverse column order in all rows
-            for tr in table.findall(".//a:tr", NS):
+            # Reverse column order in all rows (counted here, not re-scanned after)
+            row_count = 0
+            cell_count = 0
+            for tr in table.findall(f".//{_TAG_TR}"):
                 # Get all cells in this row
-                cells = tr.findall("a:tc", NS)
+                cells = tr.findall(_TAG_TC)
+                row_count += 1
+                cell_count += len(cells)
+
+                # Reverse cell order for multi-column rows
+                if len(cells) > 1:
+                    _reverse_in_place(tr, cells)
 
-                if len(cells) <= 1:
-                    # Single column or empty row, just process text
+                # Process text in each cell
+                if self.process_text:
                     for tc in cells:
-                        tx_body = tc.find("a:txBody", NS)
+                        tx_body = tc.find(_TAG_A_TXBODY)
                         if tx_body is not None:
                             self._process_text_body(tx_body)
-                    continue
-
-                # Reverse cell order for multi-column rows
-                # Remove all cells from row
-                for tc in cells:
-                    tr.remove(tc)
-
-                # Re-add cells in reversed order
-                for tc in reversed(cells):
-                    tr.append(tc)
-
-                    # Process text in each cell
-                    tx_body = tc.find("a:txBody", NS)
-                    if tx_body is not None:
-                        self._process_text_body(tx_body)
 
             # Reverse column grid definitions if present
             if tbl_grid is not None:
-                grid_cols = tbl_grid.findall("a:gridCol", NS)
+                grid_cols = tbl_grid.findall(_TAG_GRIDCOL)
                 if len(grid_cols) > 1:
-                    # Remove all columns
-                    for col in grid_cols:
-                        tbl_grid.remove(col)
+                    _reverse_in_place(tbl_grid, grid_cols)
 
-                    # Re-add in reversed order
-                    for col in reversed(grid_cols):
-                        tbl_grid.append(col)
-
-            self.stats.setdefault("table_cells_processed", 0)
-            self.stats["table_cells_processed"] += len(table.findall(".//a:tc", NS))
+            self._counts[_S_TABLE_CELLS_PROCESSED] += cell_count
 
             if self.verbose:
-                print(f"    [Table] Reversed {len(table.findall('.//a:tr', NS))} rows")
+                print(f"    [Table] Reversed {row_count} rows")
 
         except Exception as e:
             if self.verbose:
                 print(f"    Warning: Error processing table: {e}")
-            self.stats.setdefault("errors", 0)
-            self.stats["errors"] += 1
+            self._counts[_S_ERRORS] += 1
 
     # ========================================================================
     # TEXT BODY PROCESSING
@@ -579,26 +751,26 @@ class RTLVisualEngine:
         - Paragraph RTL flag
         - Run-level RTL and language
         """
-        self.stats["text_bodies_processed"] += 1
+        self._counts[_S_TEXT_BODIES_PROCESSED] += 1
 
         # 1. Set body-level RTL (a:bodyPr)
-        body_pr = tx_body.find("a:bodyPr", NS)
+        body_pr = tx_body.find(_TAG_BODYPR)
         if body_pr is None:
-            body_pr = etree.SubElement(tx_body, qn("a:bodyPr"))
+            body_pr = etree.SubElement(tx_body, _TAG_BODYPR)
         # Note: rtlCol="1" is the correct attribute for body-level RTL
         body_pr.set("rtlCol", "1")
 
         # 2. Process each paragraph
-        for p in tx_body.findall("a:p", NS):
+        for p in tx_body.iterchildren(_TAG_P):
             self._process_paragraph(p)
 
     def _process_paragraph(self, paragraph: etree._Element) -> None:
         """Process a single paragraph for RTL."""
         # Get or create paragraph properties
-        p_pr = paragraph.find("a:pPr", NS)
+        p_pr = paragraph.find(_TAG_PPR)
         if p_pr is None:
             # Insert pPr at the beginning of the paragraph
-            p_pr = etree.Element(qn("a:pPr"))
+            p_pr = etree.Element(_TAG_PPR)
             paragraph.insert(0, p_pr)
 
         # Flip alignment: l <-> r, keep center/justified
@@ -613,13 +785,13 @@ class RTLVisualEngine:
         p_pr.set("rtl", "1")
 
         # Process runs
-        for r in paragraph.findall("a:r", NS):
+        for r in paragraph.iterchildren(_TAG_R):
             self._process_run(r)
 
         # Also set default run properties for any new runs
-        def_r_pr = p_pr.find("a:defRPr", NS)
+        def_r_pr = p_pr.find(_TAG_DEFRPR)
         if def_r_pr is None:
-            def_r_pr = etree.SubElement(p_pr, qn("a:defRPr"))
+            def_r_pr = etree.SubElement(p_pr, _TAG_DEFRPR)
         def_r_pr.set("lang", "ar-SA")
 
     def _process_run(self, run: etree._Element) -> None:
@@ -631,38 +803,39 @@ class RTLVisualEngine:
         - Arabic font if not already specified
         - Font fallback for complex script support
         """
-        r_pr = run.find("a:rPr", NS)
+        r_pr = run.find(_TAG_RPR)
         if r_pr is None:
-            # Insert rPr at the beginning of the run
-            r_pr = etree.Element(qn("a:rPr"))
-            run.insert(0, r_pr)
+            # No properties yet: insert the complete Arabic rPr at the
+            # beginning of the run (one subtree copy instead of building it)
+            run.insert(0, copy.deepcopy(_RPR_TEMPLATE))
+            return
 
         # Set language to Arabic (affects font fallback and text shaping)
         r_pr.set("lang", "ar-SA")
 
         # Add Arabic font fallback
         # Check if there's already a latin or complex script font defined
-        latin_font = r_pr.find("a:latin", NS)
-        cs_font = r_pr.find("a:cs", NS)  # Complex Script font
+        latin_font = r_pr.find(_TAG_LATIN)
+        cs_font = r_pr.find(_TAG_CS)  # Complex Script font
 
         # If no fonts are defined, add Arabic font
         if latin_font is None and cs_font is None:
             # Add Simplified Arabic as default for Arabic text
             # This is a safe, widely-available Arabic font
-            cs_font = etree.SubElement(r_pr, qn("a:cs"))
+            cs_font = etree.SubElement(r_pr, _TAG_CS)
             cs_font.set("typeface", "Simplified Arabic")
             cs_font.set("pitchFamily", "34")
             cs_font.set("charset", "178")  # Arabic charset
 
             # Also set latin font to match (for mixed content)
-            latin_font = etree.SubElement(r_pr, qn("a:latin"))
+            latin_font = etree.SubElement(r_pr, _TAG_LATIN)
             latin_font.set("typeface", "Arial")
             latin_font.set("pitchFamily", "34")
             latin_font.set("charset", "0")
 
         elif cs_font is None and latin_font is not None:
             # Latin font exists but no CS font - add Arabic CS font
-            cs_font = etree.SubElement(r_pr, qn("a:cs"))
+            cs_font = etree.SubElement(r_pr, _TAG_CS)
             cs_font.set("typeface", "Simplified Arabic")
             cs_font.set("pitchFamily", "34")
             cs_font.set("charset", "178")
@@ -681,69 +854,45 @@ class RTLVisualEngine:
     # ========================================================================
     # GEOMETRY HELPERS
     # ========================================================================
-    def _get_bounding_box(
+    def _get_bbox_and_off(
         self,
-        element: etree._Element,
-        sp_pr_tag: str
-    ) -> Optional[BoundingBox]:
-        """Extract bounding box from an element's shape properties."""
-        sp_pr = element.find(sp_pr_tag, NS)
-        if sp_pr is None:
-            return None
-
-        xfrm = sp_pr.find("a:xfrm", NS)
-        if xfrm is None:
-            return None
+        element: etree._Element
+    ) -> Optional[Tuple[BoundingBox, etree._Element]]:
+        """
+        Extract bounding box from an element's shape properties (p:spPr).
 
-        off = xfrm.find("a:off", NS)
-        ext = xfrm.find("a:ext", NS)
-        if off is None or ext is None:
+        Also returns the a:off element, so callers can write the mirrored X
+        without walking spPr/xfrm/off a second time.
+        """
+        nodes = _XP_SPPR_OFF_EXT(element)
+        if len(nodes) != 2:
             return None
+        off, ext = nodes
 
-        return BoundingBox(
+        bbox = BoundingBox(
             x=int(off.get("x", "0")),
             y=int(off.get("y", "0")),
             width=int(ext.get("cx", "0")),
             height=int(ext.get("cy", "0"))
         )
+        return bbox, off
 
-    def _set_offset_x(
-        self,
-        element: etree._Element,
-        sp_pr_tag: str,
-        new_x: int
-    ) -> None:
+    def _set_offset_x(self, element: etree._Element, new_x: int) -> None:
         """Set the X offset of an element."""
-        sp_pr = element.find(sp_pr_tag, NS)
-        if sp_pr is None:
-            return
-
-        xfrm = sp_pr.find("a:xfrm", NS)
-        if xfrm is None:
-            return
-
-        off = xfrm.find("a:off", NS)
+        off = _first(_XP_SPPR_OFF(element))
         if off is not None:
             off.set("x", str(new_x))
 
-    def _set_flip_h(self, element: etree._Element, sp_pr_tag: str) -> None:
+    def _set_flip_h(self, element: etree._Element) -> None:
         """Set horizontal flip on an element's transform."""
-        sp_pr = element.find(sp_pr_tag, NS)
-        if sp_pr is None:
-            return
-
-        xfrm = sp_pr.find("a:xfrm", NS)
+        xfrm = _first(_XP_SPPR_XFRM(element))
         if xfrm is not None:
             xfrm.set("flipH", "1")
 
     def _get_element_name(self, element: etree._Element) -> str:
         """Get the name of an element from cNvPr."""
-        # Try different paths for cNvPr
-        for path in ["p:nvSpPr/p:cNvPr", "p:nvPicPr/p:cNvPr", ".//p:cNvPr"]:
-            c_nv_pr = element.find(path, NS)
-            if c_nv_pr is not None:
-                return c_nv_pr.get("name", "")
-        return ""
+        c_nv_pr = _first(_XP_CNVPR(element))
+        return c_nv_pr.get("name", "") if c_nv_pr is not None else ""
 
     # ========================================================================
     # SMART DETECTION LOGIC
@@ -768,23 +917,21 @@ class RTLVisualEngine:
         """
         # CRITICAL: Never flip shapes that contain text!
         # flipH on a text-containing shape causes characters to appear mirrored
-        tx_body = element.find("p:txBody", NS)
+        tx_body = element.find(_TAG_TXBODY)
         if tx_body is not None:
-            # Check if there's actual text content (not just empty body)
-            has_text = any(
-                t.text and t.text.strip()
-                for t in tx_body.findall(".//a:t", NS)
-            )
-            if has_text:
-                return False
+            # Check if there's actual text content (not just empty body);
+            # iter() stops at the first non-blank run instead of collecting all
+            for t in tx_body.iter(_TAG_T):
+                if t.text and t.text.strip():
+                    return False
 
         # Don't flip if it's a logo
         if self._is_likely_logo(element, name, bbox):
-            self.stats["logos_preserved"] += 1
+            self._counts[_S_LOGOS_PRESERVED] += 1
             return False
 
         # Check for arrow-like geometry (only flip if no text)
-        prst_geom = element.find(".//a:prstGeom", NS)
+        prst_geom = _first(_XP_PRSTGEOM(element))
         if prst_geom is not None:
             geom_type = prst_geom.get("prst", "")
             if geom_type in self.ARROW_GEOMETRIES:
@@ -811,14 +958,12 @@ class RTLVisualEngine:
         - Are positioned in corners
         - Are roughly square
         """
-        name_lower = name.lower()
-
         # Check name for logo keywords
-        if any(keyword in name_lower for keyword in self.LOGO_KEYWORDS):
+        if self._LOGO_RE.search(name.lower()):
             return True
 
         # Check if it's a picture (pictures in corners are often logos)
-        is_picture = element.tag.endswith("}pic")
+        is_picture = element.tag == _TAG_PIC
 
         # Size heuristic: logos are usually small (< 15% of slide width)
         is_small = bbox.width < self.slide_width * 0.15
@@ -845,50 +990,33 @@ class RTLVisualEngine:
 # ============================================================================
 if __name__ == "__main__":
     import datetime
-    import glob
+    try:
+        from .harness import latest_matching
+    except ImportError:  # Running this module directly as a script
+        from harness import latest_matching
 
     OUTPUT_DIR = "./output_xmls"
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Find the latest slide XML file
-    slide_patterns = [
-        "output_xmls/slide*_structure*.xml",
-        "output_xmls/slide[0-9]*.xml",
-        "slide*_structure*.xml",
-        "slide[0-9]*.xml",
-    ]
-
-    slide_files = []
-    for pattern in slide_patterns:
-        # Exclude RTL and Final files
-        for f in glob.glob(pattern):
-            if "_RTL" not in f and "_Final" not in f:
-                slide_files.append(f)
-
-    if not slide_files:
+    # Find the latest slide XML file (excluding RTL and Final outputs)
+    search_dirs = ["output_xmls", "."]
+    slide_patterns = ["slide*_structure*.xml", "slide[0-9]*.xml"]
+
+    INPUT_SLIDE_XML = latest_matching(search_dirs, slide_patterns, exclude=("_rtl", "_final"))
+    if INPUT_SLIDE_XML is None:
         print("ERROR: No slide XML files found. Run the extractor first.")
-        print(f"Searched patterns: {slide_patterns}")
+        print(f"Searched patterns: {slide_patterns} in {search_dirs}")
         exit(1)
 
-    INPUT_SLIDE_XML = max(slide_files, key=os.path.getmtime)
-
     # Find the latest presentation XML file
-    pres_patterns = [
-        "output_xmls/presentation*.xml",
-        "presentation*.xml",
-    ]
-
-    pres_files = []
-    for pattern in pres_patterns:
-        pres_files.extend(glob.glob(pattern))
+    pres_patterns = ["presentation*.xml"]
 
-    if not pres_files:
+    INPUT_PRES_XML = latest_matching(search_dirs, pres_patterns)
+    if INPUT_PRES_XML is None:
         print("ERROR: No presentation XML files found. Run the extractor first.")
-        print(f"Searched patterns: {pres_patterns}")
+        print(f"Searched patterns: {pres_patterns} in {search_dirs}")
         exit(1)
 
-    INPUT_PRES_XML = max(pres_files, key=os.path.getmtime)
-
     OUTPUT_FILENAME = f"slide_RTL_{timestamp}.xml"
 
     print(f"\n{'='*50}")
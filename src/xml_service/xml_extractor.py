@@ -10,12 +10,38 @@ Key features:
 - Option to prettify for human inspection (separate from processing)
 """
 
+import functools
+import threading
 import zipfile
 import os
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Tuple, Union
 from lxml import etree
 
 
+# Part folder under ppt/ -> file name prefix of the parts counted in it
+_PART_PREFIXES = {
+    "slides": "slide",
+    "slideMasters": "slideMaster",
+    "slideLayouts": "slideLayout",
+    "charts": "chart",
+}
+
+# O_BINARY only exists (and matters) on Windows, where fds default to text mode
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write a buffer to a file with raw fd calls (no buffered file object)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
 class PPTXXMLExtractor:
     """
     Extracts internal XML files from a PowerPoint (.pptx) archive.
@@ -27,30 +53,64 @@ class PPTXXMLExtractor:
     - Relationships between files
     """
 
-    def __init__(self, pptx_path: str):
+    def __init__(self, pptx_path: Union[str, BinaryIO], verbose: bool = True):
         """
-        Initialize the extractor with the path to a .pptx file.
+        Initialize the extractor with a .pptx file.
 
         Args:
-            pptx_path: Path to the source .pptx file.
+            pptx_path: Path to the source .pptx file, or a seekable binary
+                       file object holding it (e.g. io.BytesIO of an upload)
+            verbose: Print a line per extracted file
 
         Raises:
             FileNotFoundError: If the file doesn't exist.
             zipfile.BadZipFile: If the file is not a valid ZIP/PPTX.
         """
         self.pptx_path = pptx_path
+        self.verbose = verbose
 
-        if not os.path.exists(self.pptx_path):
+        if isinstance(pptx_path, (str, os.PathLike)) and not os.path.exists(pptx_path):
             raise FileNotFoundError(f"File not found: '{self.pptx_path}'")
 
-        # Validate it's a valid ZIP file
-        if not zipfile.is_zipfile(self.pptx_path):
-            raise zipfile.BadZipFile(f"Not a valid PPTX/ZIP file: '{self.pptx_path}'")
+        # Open the archive once and parse its central directory a single
+        # time; ZipFile raises BadZipFile itself for non-ZIP input
+        self._zf = zipfile.ZipFile(self.pptx_path, 'r')
+        self._infos = {info.filename: info for info in self._zf.infolist()}
+        self._names = frozenset(self._infos)
+
+        # Prettify parsers, one per thread (lxml locks a parser while it is
+        # in use, so extract_all_* worker threads sharing one would serialize)
+        self._local = threading.local()
+
+    def close(self) -> None:
+        """Close the underlying archive handle."""
+        self._zf.close()
+
+    def __enter__(self) -> "PPTXXMLExtractor":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
 
     def list_contents(self) -> List[str]:
         """List all files inside the PPTX archive."""
-        with zipfile.ZipFile(self.pptx_path, 'r') as archive:
-            return archive.namelist()
+        return list(self._infos)
+
+    @functools.cached_property
+    def _parts(self) -> Dict[str, List[str]]:
+        """Sorted slide, master, layout and chart paths, categorized in one pass."""
+        parts = {kind: [] for kind in _PART_PREFIXES}
+        for name in self._names:
+            segments = name.split('/', 2)
+            if len(segments) != 3 or segments[0] != 'ppt' or not name.endswith('.xml'):
+                continue
+            prefix = _PART_PREFIXES.get(segments[1])
+            if prefix is not None and segments[2].startswith(prefix):
+                parts[segments[1]].append(name)
+
+        for names in parts.values():
+            names.sort()
+        return parts
 
     def extract_raw(self, internal_path: str) -> bytes:
         """
@@ -65,10 +125,25 @@ class PPTXXMLExtractor:
         Raises:
             KeyError: If the file doesn't exist in the archive.
         """
-        with zipfile.ZipFile(self.pptx_path, 'r') as archive:
-            if internal_path not in archive.namelist():
-                raise KeyError(f"File not found in archive: '{internal_path}'")
-            return archive.read(internal_path)
+        info = self._infos.get(internal_path)
+        if info is None:
+            raise KeyError(f"File not found in archive: '{internal_path}'")
+        return self._zf.read(info)
+
+    def extract_many(self, internal_paths: Iterable[str]) -> Dict[str, bytes]:
+        """
+        Extract raw bytes of several files from the open archive.
+
+        Args:
+            internal_paths: Paths inside the archive
+
+        Returns:
+            Dict mapping each internal path to its raw bytes.
+
+        Raises:
+            KeyError: If any of the files doesn't exist in the archive.
+        """
+        return {internal_path: self.extract_raw(internal_path) for internal_path in internal_paths}
 
     def extract_slide_xml(
         self,
@@ -92,24 +167,10 @@ class PPTXXMLExtractor:
         try:
             xml_bytes = self.extract_raw(internal_path)
 
-            if prettify:
-                # Parse and re-serialize with indentation (for human reading only)
-                tree = etree.fromstring(xml_bytes)
-                xml_content = etree.tostring(
-                    tree,
-                    encoding='UTF-8',
-                    pretty_print=True,
-                    xml_declaration=True
-                )
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_content)
-            else:
-                # Write raw bytes exactly as they are in the PPTX
-                # This preserves namespace prefixes and structure
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_bytes)
-
-            print(f"[Extractor] Slide {slide_index} -> {output_filename}")
+            self._write_xml(xml_bytes, output_filename, prettify)
+
+            if self.verbose:
+                print(f"[Extractor] Slide {slide_index} -> {output_filename}")
 
         except KeyError as e:
             print(f"ERROR: {e}")
@@ -133,21 +194,10 @@ class PPTXXMLExtractor:
         try:
             xml_bytes = self.extract_raw(internal_path)
 
-            if prettify:
-                tree = etree.fromstring(xml_bytes)
-                xml_content = etree.tostring(
-                    tree,
-                    encoding='UTF-8',
-                    pretty_print=True,
-                    xml_declaration=True
-                )
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_content)
-            else:
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_bytes)
-
-            print(f"[Extractor] presentation.xml -> {output_filename}")
+            self._write_xml(xml_bytes, output_filename, prettify)
+
+            if self.verbose:
+                print(f"[Extractor] presentation.xml -> {output_filename}")
 
         except KeyError as e:
             print(f"ERROR: {e}")
@@ -165,67 +215,104 @@ class PPTXXMLExtractor:
             List of output file paths.
         """
         os.makedirs(output_dir, exist_ok=True)
+        items = [
+            (slide_file, os.path.join(output_dir, os.path.basename(slide_file)), slide_file)
+            for slide_file in self._parts["slides"]
+        ]
+        return self._extract_parallel(items, prettify)
+
+    def _extract_parallel(
+        self,
+        items: List[Tuple[str, str, str]],
+        prettify: bool
+    ) -> List[str]:
+        """
+        Extract several parts to disk on a thread pool.
+
+        Inflating and writing (and lxml parsing when prettifying) release
+        the GIL, so the parts extract concurrently. Reads through the one
+        shared ZipFile handle are safe: ZipFile serializes the raw reads
+        and each thread decompresses its own member.
+
+        Args:
+            items: (internal path, output path, description) per part
+
+        Returns:
+            List of output file paths, in the order of items.
+        """
+        def extract_one(item: Tuple[str, str, str]) -> None:
+            internal_path, output_path, _ = item
+            self._write_xml(self.extract_raw(internal_path), output_path, prettify)
+
+        if not items:
+            return []
 
-        # Find all slide files
-        contents = self.list_contents()
-        slide_files = sorted([
-            f for f in contents
-            if f.startswith('ppt/slides/slide') and f.endswith('.xml')
-        ])
-
-        output_paths = []
-        for slide_file in slide_files:
-            # Extract slide number from path
-            filename = os.path.basename(slide_file)
-            output_path = os.path.join(output_dir, filename)
-
-            xml_bytes = self.extract_raw(slide_file)
-
-            if prettify:
-                tree = etree.fromstring(xml_bytes)
-                xml_content = etree.tostring(
-                    tree,
-                    encoding='UTF-8',
-                    pretty_print=True,
-                    xml_declaration=True
-                )
-                with open(output_path, 'wb') as f:
-                    f.write(xml_content)
-            else:
-                with open(output_path, 'wb') as f:
-                    f.write(xml_bytes)
-
-            output_paths.append(output_path)
-            print(f"[Extractor] {slide_file} -> {output_path}")
-
-        return output_paths
+        workers = min(os.cpu_count() or 1, len(items))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for (_, output_path, description), _ in zip(items, pool.map(extract_one, items)):
+                    if self.verbose:
+                        print(f"[Extractor] {description} -> {output_path}")
+        except KeyError as e:
+            print(f"ERROR: {e}")
+            raise
+
+        return [output_path for _, output_path, _ in items]
+
+    def _pretty_parser(self) -> etree.XMLParser:
+        """
+        Return this thread's reusable prettify parser.
+
+        Dropping the archive's own whitespace nodes lets pretty_print lay
+        the tree out consistently.
+        """
+        parser = getattr(self._local, "parser", None)
+        if parser is None:
+            parser = self._local.parser = etree.XMLParser(
+                remove_blank_text=True,
+                collect_ids=False,
+                resolve_entities=False,
+                no_network=True
+            )
+        return parser
+
+    def _write_xml(self, xml_bytes: bytes, output_path: str, prettify: bool) -> None:
+        """
+        Write a part to disk, raw or re-indented for human reading.
+
+        Raw output keeps the bytes exactly as they are in the PPTX
+        (namespace prefixes and structure), which processing relies on.
+        """
+        if prettify:
+            tree = etree.fromstring(xml_bytes, self._pretty_parser())
+            xml_bytes = etree.tostring(
+                tree,
+                encoding='UTF-8',
+                pretty_print=True,
+                xml_declaration=True
+            )
+        _write_bytes(output_path, xml_bytes)
 
     def get_slide_count(self) -> int:
         """Count the number of slides in the presentation."""
-        contents = self.list_contents()
-        slide_files = [
-            f for f in contents
-            if f.startswith('ppt/slides/slide') and f.endswith('.xml')
-        ]
-        return len(slide_files)
+        return len(self._parts["slides"])
+
+    def get_counts(self) -> Dict[str, int]:
+        """
+        Count slides, slide masters, slide layouts and charts in one pass.
+
+        Returns:
+            Dict with keys "slides", "slideMasters", "slideLayouts", "charts".
+        """
+        return {kind: len(names) for kind, names in self._parts.items()}
 
     def get_slide_master_count(self) -> int:
         """Count the number of slide masters in the presentation."""
-        contents = self.list_contents()
-        master_files = [
-            f for f in contents
-            if f.startswith('ppt/slideMasters/slideMaster') and f.endswith('.xml')
-        ]
-        return len(master_files)
+        return len(self._parts["slideMasters"])
 
     def get_slide_layout_count(self) -> int:
         """Count the number of slide layouts in the presentation."""
-        contents = self.list_contents()
-        layout_files = [
-            f for f in contents
-            if f.startswith('ppt/slideLayouts/slideLayout') and f.endswith('.xml')
-        ]
-        return len(layout_files)
+        return len(self._parts["slideLayouts"])
 
     def extract_slide_master_xml(
         self,
@@ -272,21 +359,10 @@ class PPTXXMLExtractor:
         try:
             xml_bytes = self.extract_raw(internal_path)
 
-            if prettify:
-                tree = etree.fromstring(xml_bytes)
-                xml_content = etree.tostring(
-                    tree,
-                    encoding='UTF-8',
-                    pretty_print=True,
-                    xml_declaration=True
-                )
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_content)
-            else:
-                with open(output_filename, 'wb') as f:
-                    f.write(xml_bytes)
-
-            print(f"[Extractor] {description} -> {output_filename}")
+            self._write_xml(xml_bytes, output_filename, prettify)
+
+            if self.verbose:
+                print(f"[Extractor] {description} -> {output_filename}")
 
         except KeyError as e:
             print(f"ERROR: {e}")
@@ -304,15 +380,15 @@ class PPTXXMLExtractor:
             List of output file paths.
         """
         os.makedirs(output_dir, exist_ok=True)
-        master_count = self.get_slide_master_count()
-        output_paths = []
-
-        for i in range(1, master_count + 1):
-            output_path = os.path.join(output_dir, f"slideMaster{i}.xml")
-            self.extract_slide_master_xml(i, output_path, prettify)
-            output_paths.append(output_path)
-
-        return output_paths
+        items = [
+            (
+                f"ppt/slideMasters/slideMaster{i}.xml",
+                os.path.join(output_dir, f"slideMaster{i}.xml"),
+                f"SlideMaster {i}"
+            )
+            for i in range(1, self.get_slide_master_count() + 1)
+        ]
+        return self._extract_parallel(items, prettify)
 
     def extract_all_layouts(
         self,
@@ -326,24 +402,19 @@ class PPTXXMLExtractor:
             List of output file paths.
         """
         os.makedirs(output_dir, exist_ok=True)
-        layout_count = self.get_slide_layout_count()
-        output_paths = []
-
-        for i in range(1, layout_count + 1):
-            output_path = os.path.join(output_dir, f"slideLayout{i}.xml")
-            self.extract_slide_layout_xml(i, output_path, prettify)
-            output_paths.append(output_path)
-
-        return output_paths
+        items = [
+            (
+                f"ppt/slideLayouts/slideLayout{i}.xml",
+                os.path.join(output_dir, f"slideLayout{i}.xml"),
+                f"SlideLayout {i}"
+            )
+            for i in range(1, self.get_slide_layout_count() + 1)
+        ]
+        return self._extract_parallel(items, prettify)
 
     def get_chart_count(self) -> int:
         """Count the number of charts in the presentation."""
-        contents = self.list_contents()
-        chart_files = [
-            f for f in contents
-            if f.startswith('ppt/charts/chart') and f.endswith('.xml') and '_rels' not in f
-        ]
-        return len(chart_files)
+        return len(self._parts["charts"])
 
     def extract_chart_xml(
         self,
@@ -374,52 +445,45 @@ class PPTXXMLExtractor:
             List of output file paths.
         """
         os.makedirs(output_dir, exist_ok=True)
-        chart_count = self.get_chart_count()
-        output_paths = []
-
-        for i in range(1, chart_count + 1):
-            output_path = os.path.join(output_dir, f"chart{i}.xml")
-            self.extract_chart_xml(i, output_path, prettify)
-            output_paths.append(output_path)
-
-        return output_paths
+        items = [
+            (
+                f"ppt/charts/chart{i}.xml",
+                os.path.join(output_dir, f"chart{i}.xml"),
+                f"Chart {i}"
+            )
+            for i in range(1, self.get_chart_count() + 1)
+        ]
+        return self._extract_parallel(items, prettify)
 
 
 # ============================================================================
 # MAIN EXECUTION
 # ============================================================================
 if __name__ == "__main__":
-    import glob
     import datetime
+    import sys
+    # The shared harness helpers live in the translator package
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from translator.harness import latest_matching
 
     OUTPUT_DIR = "./output_xmls"
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
-    # Find the latest PPTX file in common locations
-    pptx_patterns = [
-        "*.pptx",
-        os.path.join(os.path.dirname(__file__), "..", "..", "*.pptx"),
-        "C:\\Users\\user\\Downloads\\*.pptx",
+    # Find the latest PPTX file in common locations, skipping known outputs
+    pptx_dirs = [
+        ".",
+        os.path.join(os.path.dirname(__file__), "..", ".."),
+        "C:\\Users\\user\\Downloads",
     ]
+    pptx_path = latest_matching(pptx_dirs, ["*.pptx"], exclude=("output", "translated", "flipped"))
 
-    pptx_files = []
-    for pattern in pptx_patterns:
-        for f in glob.glob(pattern):
-            # Exclude output files (those with timestamps or known outputs)
-            basename = os.path.basename(f).lower()
-            if not any(exclude in basename for exclude in ["output", "translated", "flipped"]):
-                pptx_files.append(f)
-
-    if not pptx_files:
+    if pptx_path is None:
         print("ERROR: No PPTX files found.")
-        print("Searched patterns:")
-        for pattern in pptx_patterns:
-            print(f"  - {pattern}")
+        print("Searched directories:")
+        for d in pptx_dirs:
+            print(f"  - {d}")
         exit(1)
 
-    # Pick the latest PPTX file by modification time
-    pptx_path = max(pptx_files, key=os.path.getmtime)
-
     # Timestamped output filenames
     OUTPUT_SLIDE_XML = os.path.join(OUTPUT_DIR, f"slide1_{timestamp}.xml")
     OUTPUT_PRES_XML = os.path.join(OUTPUT_DIR, f"presentation_{timestamp}.xml")
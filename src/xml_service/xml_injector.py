@@ -1,200 +1,316 @@
 import zipfile
 import os
+import copy
 import shutil
+import sys
+from typing import Union
+from lxml import etree
 
 #from translator.visual_engine import OUTPUT_FILENAME
 
+# Entries are streamed in blocks of this size, never held whole in memory
+_COPY_CHUNK_SIZE = 1 << 16
+
+# zlib level for entries we deflate ourselves (replaced XML parts). Level 1
+# is several times faster than the default 6 and only a few percent larger
+# on repetitive slide markup; untouched entries keep their original bytes.
+_DEFLATE_LEVEL = 1
+
+# Linux sendfile() accepts a regular file as the destination (macOS/BSD don't)
+_USE_SENDFILE = sys.platform.startswith("linux") and hasattr(os, "sendfile")
+
 class PPTXRebuilder:
     """
     A tool to inject modified XML files back into a PowerPoint (.pptx) archive.
     This allows you to verify that your XML edits result in a working presentation.
     """
 
-    def __init__(self, original_pptx_path: str):
+    def __init__(self, original_pptx_path: str, verbose: bool = True):
         """
         Args:
             original_pptx_path (str): The path to the valid source PPTX file.
+            verbose (bool): Print progress (errors are always printed).
         """
         self.original_pptx_path = original_pptx_path
+        self.verbose = verbose
         if not os.path.exists(self.original_pptx_path):
             raise FileNotFoundError(f"Original file '{self.original_pptx_path}' not found.")
 
-    def inject_slide_xml(self, modified_xml_path: str, slide_index: int, output_pptx_path: str) -> None:
+    def inject_slide_xml(self, modified_xml: Union[str, bytes], slide_index: int, output_pptx_path: str) -> None:
         """
         Creates a new PPTX file by copying the original and replacing a specific slide's XML.
 
         Args:
-            modified_xml_path (str): Path to your edited XML file.
+            modified_xml (str | bytes): Path to your edited XML file, or its bytes.
             slide_index (int): The 1-based index of the slide to replace (e.g., 1).
             output_pptx_path (str): The name of the new PPTX file to generate.
         """
         target_internal_file = f"ppt/slides/slide{slide_index}.xml"
         
-        print(f"--- Starting Injection ---")
-        print(f"Source: {self.original_pptx_path}")
-        print(f"Injecting: {modified_xml_path} -> {target_internal_file}")
+        if self.verbose:
+            print(f"--- Starting Injection ---")
+            print(f"Source: {self.original_pptx_path}")
+            print(f"Injecting: {self._describe(modified_xml)} -> {target_internal_file}")
         
         try:
-            # Open the original PPTX (Read Mode) and the New PPTX (Write Mode)
-            with zipfile.ZipFile(self.original_pptx_path, 'r') as zin:
-                with zipfile.ZipFile(output_pptx_path, 'w', compression=zipfile.ZIP_DEFLATED) as zout:
-                    
-                    # Iterate through every file in the original PPTX
-                    for item in zin.infolist():
-                        buffer = zin.read(item.filename)
-                        
-                        if item.filename == target_internal_file:
-                            # FOUND IT: Don't write the original. Write the modified XML instead.
-                            print(f"  > Replacing {item.filename}...")
-                            
-                            with open(modified_xml_path, 'rb') as f_xml:
-                                modified_content = f_xml.read()
-                                # We write the modified content to the new zip using the original filename
-                                zout.writestr(item, modified_content)
-                        else:
-                            # Write the original file unchanged
-                            zout.writestr(item, buffer)
-                            
-            print(f"Success! Created '{output_pptx_path}'")
-            print("You can now open this file in PowerPoint to verify your XML edits.")
+            self._rebuild({target_internal_file: modified_xml}, output_pptx_path)
+
+            if self.verbose:
+                print(f"Success! Created '{output_pptx_path}'")
+                print("You can now open this file in PowerPoint to verify your XML edits.")
 
         except Exception as e:
             print(f"Error during rebuilding: {e}")
-            # Clean up partial file if failed
-            if os.path.exists(output_pptx_path):
-                os.remove(output_pptx_path)
 
-    def inject_presentation_xml(self, modified_xml_path: str, output_pptx_path: str) -> None:
+    def inject_presentation_xml(self, modified_xml: Union[str, bytes], output_pptx_path: str) -> None:
         """
         Replaces the main presentation.xml (useful if you changed slide order/size).
         """
         target_internal = "ppt/presentation.xml"
-        self._generic_inject(target_internal, modified_xml_path, output_pptx_path)
+        self._generic_inject(target_internal, modified_xml, output_pptx_path)
 
-    def inject_slide_master_xml(self, modified_xml_path: str, master_index: int, output_pptx_path: str) -> None:
+    def inject_slide_master_xml(self, modified_xml: Union[str, bytes], master_index: int, output_pptx_path: str) -> None:
         """
         Replaces a slide master's XML.
 
         Args:
-            modified_xml_path: Path to the modified master XML file.
+            modified_xml: Path to the modified master XML file, or its bytes.
             master_index: The 1-based index of the master to replace.
             output_pptx_path: The name of the new PPTX file to generate.
         """
         target_internal = f"ppt/slideMasters/slideMaster{master_index}.xml"
-        self._generic_inject(target_internal, modified_xml_path, output_pptx_path)
+        self._generic_inject(target_internal, modified_xml, output_pptx_path)
 
-    def inject_slide_layout_xml(self, modified_xml_path: str, layout_index: int, output_pptx_path: str) -> None:
+    def inject_slide_layout_xml(self, modified_xml: Union[str, bytes], layout_index: int, output_pptx_path: str) -> None:
         """
         Replaces a slide layout's XML.
 
         Args:
-            modified_xml_path: Path to the modified layout XML file.
+            modified_xml: Path to the modified layout XML file, or its bytes.
             layout_index: The 1-based index of the layout to replace.
             output_pptx_path: The name of the new PPTX file to generate.
         """
         target_internal = f"ppt/slideLayouts/slideLayout{layout_index}.xml"
-        self._generic_inject(target_internal, modified_xml_path, output_pptx_path)
+        self._generic_inject(target_internal, modified_xml, output_pptx_path)
+
+    @staticmethod
+    def serialize_xml(root: etree._Element) -> bytes:
+        """Serialize a parsed XML part the way PowerPoint writes it."""
+        return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
+
+    @staticmethod
+    def _copy_entry(zin: zipfile.ZipFile, zout: zipfile.ZipFile, item: zipfile.ZipInfo) -> None:
+        """
+        Copy an unchanged archive entry without decompressing and recompressing it.
+
+        The compressed payload is read straight from the source archive and
+        written behind a fresh local header, so media (images, fonts) cost a
+        plain byte copy. Encrypted or zip64 entries fall back to a streamed
+        decompress/recompress copy. Either way the payload moves in
+        _COPY_CHUNK_SIZE blocks, so a large embedded video never sits in memory.
+
+        Written entries (copied, or replaced via writestr/open(item)) keep the
+        source entry's compress_type, so STORED media is never deflated and
+        the output ZipFile needs no default compression of its own. Entries
+        that do get deflated here use _DEFLATE_LEVEL.
+        """
+        limit = zipfile.ZIP64_LIMIT
+        if (item.flag_bits & 0x1 or item.file_size >= limit
+                or item.compress_size >= limit or zout.fp.tell() >= limit):
+            with zin.open(item) as src, PPTXRebuilder._open_entry(zout, item, force_zip64=True) as dst:
+                shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+            return
+
+        # Skip the source local header (fixed 30 bytes + name + extra field)
+        zin.fp.seek(item.header_offset)
+        header = zin.fp.read(zipfile.sizeFileHeader)
+        name_length = int.from_bytes(header[26:28], "little")
+        extra_length = int.from_bytes(header[28:30], "little")
+        data_offset = zin.fp.seek(name_length + extra_length, os.SEEK_CUR)
+
+        info = copy.copy(item)
+        info.flag_bits &= ~0x08  # CRC and sizes are known: no data descriptor
+        info.header_offset = zout.fp.tell()
+        zout.fp.write(info.FileHeader(zip64=False))
+
+        remaining = item.compress_size
+        if _USE_SENDFILE:
+            remaining = PPTXRebuilder._send_raw(zin.fp, zout.fp, data_offset, remaining)
+        while remaining:
+            chunk = zin.fp.read(min(remaining, _COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated entry: '{item.filename}'")
+            zout.fp.write(chunk)
+            remaining -= len(chunk)
+
+        zout.filelist.append(info)
+        zout.NameToInfo[info.filename] = info
+        zout.start_dir = zout.fp.tell()
+
+    @staticmethod
+    def _send_raw(src, dst, offset: int, count: int) -> int:
+        """
+        Copy count bytes at offset in src to the end of dst inside the kernel.
+
+        Uses os.sendfile, so the payload never passes through Python buffers.
+        Returns the number of bytes still to copy (0 on success); anything
+        left over, e.g. without real file descriptors or when the filesystem
+        rejects sendfile, is finished by the caller's chunked copy.
+        """
+        try:
+            in_fd, out_fd = src.fileno(), dst.fileno()
+        except (AttributeError, OSError):
+            return count
+
+        dst.flush()
+        try:
+            while count:
+                sent = os.sendfile(out_fd, in_fd, offset, count)
+                if not sent:
+                    break  # Truncated source: the chunked copy reports it
+                offset += sent
+                count -= sent
+        except OSError:
+            pass  # Finish with buffered reads/writes from where sendfile stopped
+        finally:
+            # sendfile moved the fd offset behind the buffered file's back
+            dst.seek(0, os.SEEK_END)
+            src.seek(offset)
+        return count
+
+    @staticmethod
+    def _open_entry(zout: zipfile.ZipFile, item: zipfile.ZipInfo, force_zip64: bool = False):
+        """Open an entry for writing, deflating (if its compress_type does) at _DEFLATE_LEVEL."""
+        # zout.open() takes the level from the ZipInfo, not from the ZipFile
+        item._compresslevel = _DEFLATE_LEVEL
+        return zout.open(item, 'w', force_zip64=force_zip64)
+
+    @staticmethod
+    def _write_file_entry(zout: zipfile.ZipFile, item: zipfile.ZipInfo, local_path: str) -> None:
+        """Stream a local file into the archive under an existing entry's name and settings."""
+        with open(local_path, 'rb') as src, PPTXRebuilder._open_entry(zout, item) as dst:
+            shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+    def _rebuild(self, replacements: dict, output_pptx_path: str) -> None:
+        """
+        Write output_pptx_path as a copy of the original with some entries replaced.
+
+        One pass over the source central directory: replaced entries are
+        written from their new content (see _write_replacement), every other
+        entry is raw-copied with its compressed bytes and compress_type
+        untouched (see _copy_entry). A partial output file is removed if
+        anything fails, and the error is re-raised.
+
+        Args:
+            replacements: Dict mapping internal paths to a local XML file
+                         path, raw XML bytes, or a parsed root element
+            output_pptx_path: The output PPTX file path
+        """
+        try:
+            with zipfile.ZipFile(self.original_pptx_path, 'r') as zin:
+                with zipfile.ZipFile(output_pptx_path, 'w') as zout:
+                    for item in zin.infolist():
+                        replacement = replacements.get(item.filename)
+                        if replacement is None:
+                            self._copy_entry(zin, zout, item)
+                            continue
+
+                        if self.verbose:
+                            print(f"  > Replacing {item.filename}...")
+                        self._write_replacement(zout, item, replacement)
+        except Exception:
+            if os.path.exists(output_pptx_path):
+                os.remove(output_pptx_path)
+            raise
+
+    def _write_replacement(
+        self,
+        zout: zipfile.ZipFile,
+        item: zipfile.ZipInfo,
+        replacement: Union[str, bytes, etree._Element]
+    ) -> None:
+        """Write new content for an entry: a parsed root, XML bytes already in memory, or a local file path."""
+        if isinstance(replacement, etree._Element):
+            zout.writestr(item, self.serialize_xml(replacement), compresslevel=_DEFLATE_LEVEL)
+        elif isinstance(replacement, (bytes, bytearray)):
+            zout.writestr(item, replacement, compresslevel=_DEFLATE_LEVEL)
+        else:
+            self._write_file_entry(zout, item, replacement)
+
+    @staticmethod
+    def _describe(replacement: Union[str, bytes]) -> str:
+        """Label a replacement for progress output (its path, or its size if in memory)."""
+        if isinstance(replacement, (bytes, bytearray)):
+            return f"<{len(replacement)} bytes>"
+        return str(replacement)
 
     def inject_multiple_files(self, replacements: dict, output_pptx_path: str) -> None:
         """
         Replace multiple files in one pass.
 
         Args:
-            replacements: Dict mapping internal paths to local XML file paths
+            replacements: Dict mapping internal paths to the new content: a local
+                         XML file path, raw XML bytes, or a parsed root element
                          e.g., {"ppt/slides/slide1.xml": "/path/to/modified.xml"}
             output_pptx_path: The output PPTX file path
         """
-        print(f"--- Starting Multi-File Injection ---")
-        print(f"Source: {self.original_pptx_path}")
-        print(f"Replacements: {len(replacements)} files")
+        if self.verbose:
+            print(f"--- Starting Multi-File Injection ---")
+            print(f"Source: {self.original_pptx_path}")
+            print(f"Replacements: {len(replacements)} files")
 
         try:
-            with zipfile.ZipFile(self.original_pptx_path, 'r') as zin:
-                with zipfile.ZipFile(output_pptx_path, 'w', compression=zipfile.ZIP_DEFLATED) as zout:
+            self._rebuild(replacements, output_pptx_path)
 
-                    for item in zin.infolist():
-                        if item.filename in replacements:
-                            # Replace with modified content
-                            local_path = replacements[item.filename]
-                            print(f"  > Replacing {item.filename}...")
-                            with open(local_path, 'rb') as f:
-                                zout.writestr(item, f.read())
-                        else:
-                            # Keep original
-                            zout.writestr(item, zin.read(item.filename))
-
-            print(f"Success! Created '{output_pptx_path}'")
+            if self.verbose:
+                print(f"Success! Created '{output_pptx_path}'")
 
         except Exception as e:
             print(f"Error during multi-file injection: {e}")
-            if os.path.exists(output_pptx_path):
-                os.remove(output_pptx_path)
 
-    def _generic_inject(self, target_internal_filename: str, local_xml_path: str, output_path: str):
-        """Helper method to replace any file inside the archive."""
+    def _generic_inject(self, target_internal_filename: str, modified_xml: Union[str, bytes], output_path: str):
+        """Helper method to replace any file inside the archive (from a path or in-memory bytes)."""
         try:
-            with zipfile.ZipFile(self.original_pptx_path, 'r') as zin:
-                with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zout:
-                    for item in zin.infolist():
-                        if item.filename == target_internal_filename:
-                            with open(local_xml_path, 'rb') as f:
-                                zout.writestr(item, f.read())
-                        else:
-                            zout.writestr(item, zin.read(item.filename))
-            print(f"Replaced '{target_internal_filename}' and saved to '{output_path}'")
+            self._rebuild({target_internal_filename: modified_xml}, output_path)
+            if self.verbose:
+                print(f"Replaced '{target_internal_filename}' and saved to '{output_path}'")
         except Exception as e:
             print(f"Error: {e}")
 
+
 if __name__ == "__main__":
-    import glob
     import datetime
+    # The shared harness helpers live in the translator package
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    from translator.harness import latest_matching
 
     OUTPUT_DIR = "./output_pptx"
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
 
     # Find the latest PPTX source file (not output files)
-    pptx_patterns = [
-        "*.pptx",
-        os.path.join(os.path.dirname(__file__), "..", "..", "*.pptx"),
+    pptx_dirs = [
+        ".",
+        os.path.join(os.path.dirname(__file__), "..", ".."),
     ]
+    ORIGINAL_PPTX = latest_matching(pptx_dirs, ["*.pptx"], exclude=("output", "translated", "flipped"))
 
-    pptx_files = []
-    for pattern in pptx_patterns:
-        for f in glob.glob(pattern):
-            basename = os.path.basename(f).lower()
-            if not any(exclude in basename for exclude in ["output", "translated", "flipped"]):
-                pptx_files.append(f)
-
-    if not pptx_files:
+    if ORIGINAL_PPTX is None:
         print("ERROR: No source PPTX files found.")
-        print("Searched patterns:")
-        for pattern in pptx_patterns:
-            print(f"  - {pattern}")
+        print("Searched directories:")
+        for d in pptx_dirs:
+            print(f"  - {d}")
         exit(1)
 
-    ORIGINAL_PPTX = max(pptx_files, key=os.path.getmtime)
-
-    # Find the latest modified XML (Final first, then RTL)
-    xml_patterns = [
-        "output_xmls/slide*_Final*.xml",
-        "output_xmls/slide*_RTL*.xml",
-        "output_xmls/*_rtl*.xml",
-    ]
+    # Find the latest modified XML (Final or RTL)
+    xml_patterns = ["slide*_Final*.xml", "slide*_RTL*.xml", "*_rtl*.xml"]
+    MODIFIED_XML = latest_matching(["output_xmls"], xml_patterns)
 
-    xml_files = []
-    for pattern in xml_patterns:
-        xml_files.extend(glob.glob(pattern))
-
-    if not xml_files:
+    if MODIFIED_XML is None:
         print("ERROR: No modified XML files found.")
-        print("Searched patterns:")
-        for pattern in xml_patterns:
-            print(f"  - {pattern}")
+        print(f"Searched patterns: {xml_patterns} in output_xmls")
         print("\nRun the Visual Engine or Content Processor first.")
         exit(1)
 
-    MODIFIED_XML = max(xml_files, key=os.path.getmtime)
-
     # Ensure output directory exists
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -210,7 +326,7 @@ if __name__ == "__main__":
     # Run the Rebuilder
     rebuilder = PPTXRebuilder(ORIGINAL_PPTX)
     rebuilder.inject_slide_xml(
-        modified_xml_path=MODIFIED_XML,
+        modified_xml=MODIFIED_XML,
         slide_index=1,
         output_pptx_path=OUTPUT_PPTX
     )
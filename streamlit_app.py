@@ -9,20 +9,133 @@ from English to Arabic with RTL layout transformation.
 import streamlit as st
 import os
 import sys
+import contextlib
 import datetime
+import hashlib
+import queue
 import tempfile
+import threading
+from collections import deque
 from pathlib import Path
-from io import StringIO
+from io import BytesIO, TextIOBase
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
 from xml_service.xml_extractor import PPTXXMLExtractor
+from translator.translation_memory import TranslationMemory
 
 # Import the main translation orchestrator
 sys.path.insert(0, os.path.dirname(__file__))
 from main import SlideTranslator, parse_slides_arg
 
+
+@st.cache_data(show_spinner=False)
+def analyze_pptx(file_bytes: bytes) -> dict:
+    """
+    Count slides, charts, masters and layouts of an uploaded deck.
+
+    Cached on the file bytes, so widget reruns (typing the API key,
+    switching slide mode) reuse the result of the first analysis. The
+    archive is read straight from memory; nothing is written to disk.
+    """
+    with PPTXXMLExtractor(BytesIO(file_bytes), verbose=False) as extractor:
+        counts = extractor.get_counts()
+
+    return {
+        "slide_count": counts["slides"],
+        "chart_count": counts["charts"],
+        "master_count": counts["slideMasters"],
+        "layout_count": counts["slideLayouts"],
+    }
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def read_output(path: str, mtime_ns: int) -> bytes:
+    """
+    Bytes of a translated deck, read from disk once.
+
+    The download button of the previous output is re-rendered on every
+    rerun (each widget change); keyed on the file's mtime, the file is
+    read only the first time. cache_resource hands back the same bytes
+    object instead of a copy.
+    """
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+# Labels of the progress_callback stages of SlideTranslator.translate_slides()
+PIPELINE_STAGES = (
+    "Extracted slide content",
+    "Translated text",
+    "Applied translations to masters, layouts and charts",
+    "Mirrored slides for RTL",
+    "Rebuilt presentation",
+)
+
+
+def upload_hash(uploaded_file) -> str:
+    """Short content hash of an uploaded file (identifies re-uploads of the same deck)."""
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=8).hexdigest()
+
+
+def save_upload(uploaded_file) -> str:
+    """
+    Write an uploaded deck to this session's temp dir and return its path.
+
+    The directory is a TemporaryDirectory kept in the session state, so it
+    is removed when the session ends (its finalizer runs once the state is
+    dropped). The file is rewritten only when its content hash changes, so
+    translating the same upload again (e.g. with other settings) skips the
+    write; a new upload replaces the previous one on disk.
+    """
+    if "temp_dir" not in st.session_state:
+        st.session_state.temp_dir = tempfile.TemporaryDirectory(prefix="pptx_")
+
+    file_hash = upload_hash(uploaded_file)
+    input_path = os.path.abspath(os.path.join(st.session_state.temp_dir.name, uploaded_file.name))
+    previous = st.session_state.get("upload_hash")
+    if previous != (file_hash, input_path) or not os.path.exists(input_path):
+        if previous is not None and previous[1] != input_path:
+            with contextlib.suppress(OSError):
+                os.remove(previous[1])
+        with open(input_path, 'wb') as f:
+            f.write(uploaded_file.getbuffer())
+        st.session_state.upload_hash = (file_hash, input_path)
+
+    return input_path
+
+
+class LogBuffer(TextIOBase):
+    """
+    Thread-safe stdout replacement keeping only the last max_lines lines.
+
+    The pipeline prints from a worker thread while the script thread
+    redraws the log, so the page never renders more than the tail.
+    """
+
+    def __init__(self, max_lines: int = 500):
+        self._lines = deque(maxlen=max_lines)
+        self._partial = ""
+        self._lock = threading.Lock()
+        self.version = 0  # Bumped on every write, to skip redundant redraws
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        with self._lock:
+            *lines, self._partial = (self._partial + text).split("\n")
+            self._lines.extend(lines)
+            self.version += 1
+        return len(text)
+
+    def tail(self) -> str:
+        """The buffered lines (including an unfinished last line)."""
+        with self._lock:
+            return "\n".join([*self._lines, self._partial]) if self._partial else "\n".join(self._lines)
+
+
 # Page configuration
 st.set_page_config(
     page_title="Slide Translator - Project C",
@@ -30,8 +143,9 @@ st.set_page_config(
     layout="wide"
 )
 
-# Custom CSS for better UI
-st.markdown("""
+# Custom CSS, watermark and header as one HTML element (st.html needs no
+# unsafe_allow_html; the page is re-sent on every rerun, so keep it to one)
+st.html("""
     <style>
     .project-watermark {
         position: absolute;
@@ -78,14 +192,10 @@ st.markdown("""
         margin: 1rem 0;
     }
     </style>
-""", unsafe_allow_html=True)
-
-# Project watermark background
-st.markdown('<div class="project-watermark">PROJECT C</div>', unsafe_allow_html=True)
-
-# Header
-st.markdown('<div class="main-header">🌐 Slide Translator</div>', unsafe_allow_html=True)
-st.markdown('<div class="sub-header">Professional English → Arabic Presentation Translation with RTL Layout</div>', unsafe_allow_html=True)
+    <div class="project-watermark">PROJECT C</div>
+    <div class="main-header">🌐 Slide Translator</div>
+    <div class="sub-header">Professional English → Arabic Presentation Translation with RTL Layout</div>
+""")
 
 # Sidebar - User Guide
 with st.sidebar:
@@ -113,6 +223,8 @@ with st.sidebar:
       - Excellent for consulting terminology
       - Context-aware translations
       - Cost: ~$0.02-0.04 per slide
+    - **Batch API**: half the cost of either engine, but
+      results can take up to 24 hours
 
     **Step 4: Provide API Key**
     - Get your API key from:
@@ -160,6 +272,17 @@ with st.sidebar:
     - No data sent to third parties
     """)
 
+    st.markdown("---")
+
+    st.markdown("""
+    ### 💾 Translation Cache
+    Translations are remembered on this server for 30 days, so
+    re-translating a revised deck only sends the changed text.
+    """)
+    if st.button("🗑️ Clear translation cache", use_container_width=True):
+        TranslationMemory().clear()
+        st.success("Translation cache cleared")
+
 # Main content area
 col1, col2 = st.columns([2, 1])
 
@@ -182,21 +305,14 @@ with col1:
         </div>
         """, unsafe_allow_html=True)
 
-        # Save uploaded file temporarily
-        temp_dir = tempfile.mkdtemp()
-        temp_input_path = os.path.join(temp_dir, uploaded_file.name)
-
-        with open(temp_input_path, 'wb') as f:
-            f.write(uploaded_file.getbuffer())
-
         # Analyze presentation
         try:
             with st.spinner("Analyzing presentation..."):
-                extractor = PPTXXMLExtractor(temp_input_path)
-                slide_count = extractor.get_slide_count()
-                chart_count = extractor.get_chart_count()
-                master_count = extractor.get_slide_master_count()
-                layout_count = extractor.get_slide_layout_count()
+                analysis = analyze_pptx(uploaded_file.getvalue())
+            slide_count = analysis["slide_count"]
+            chart_count = analysis["chart_count"]
+            master_count = analysis["master_count"]
+            layout_count = analysis["layout_count"]
 
             st.markdown(f"""
             <div class="info-box">
@@ -209,7 +325,6 @@ with col1:
             """, unsafe_allow_html=True)
 
             # Store in session state
-            st.session_state.temp_input_path = temp_input_path
             st.session_state.slide_count = slide_count
             st.session_state.chart_count = chart_count
 
@@ -238,6 +353,17 @@ with col2:
         else:
             slide_range = "all"
 
+        # Validate as the user types (each edit reruns the script), so a
+        # bad range is reported before translation starts
+        try:
+            slide_indices = parse_slides_arg(slide_range, st.session_state.slide_count)
+        except ValueError as e:
+            slide_indices = []
+            st.error(f"❌ {e}")
+        else:
+            if not slide_indices and slide_range.strip():
+                st.error("❌ No slides selected")
+
         # AI Engine selection
         st.subheader("2. Choose AI Engine")
         ai_engine = st.selectbox(
@@ -248,6 +374,22 @@ with col2:
 
         translator_name = "openai" if "OpenAI" in ai_engine else "anthropic"
 
+        use_batch_api = st.checkbox(
+            "Use Batch API (cheaper, up to 24h)",
+            help="Submit all requests as one batch job at about half the price. Results usually arrive within minutes but can take up to 24 hours; keep this page open until then."
+        )
+        if use_batch_api:
+            translator_name += "-batch"
+
+        concurrency = st.slider(
+            "Parallel requests",
+            min_value=1,
+            max_value=32,
+            value=8,
+            disabled=use_batch_api,
+            help="How many translation requests run at once. Lower it if your API key hits rate limits (429 errors are retried with backoff)."
+        )
+
         # API Key input
         st.subheader("3. Enter API Key")
         api_key = st.text_input(
@@ -265,8 +407,10 @@ with col2:
 
         # Estimated cost
         if api_key:
-            estimated_slides = st.session_state.get('slide_count', 0)
+            estimated_slides = len(slide_indices)
             cost_per_slide = 0.002 if "OpenAI" in ai_engine else 0.03
+            if use_batch_api:
+                cost_per_slide /= 2
             estimated_cost = estimated_slides * cost_per_slide
 
             st.markdown(f"""
@@ -282,9 +426,10 @@ if uploaded_file is not None:
     st.header("🚀 Start Translation")
 
     col_left, col_right = st.columns([1, 1])
+    process_button = False
 
     with col_left:
-        if api_key:
+        if api_key and slide_indices:
             process_button = st.button(
                 "▶️ Start Translation",
                 type="primary",
@@ -296,20 +441,50 @@ if uploaded_file is not None:
                 disabled=True,
                 use_container_width=True
             )
-            st.caption("⚠️ Please enter API key first")
+            if not api_key:
+                st.caption("⚠️ Please enter API key first")
+            else:
+                st.caption("⚠️ Please choose the slides to translate")
 
     with col_right:
-        if st.session_state.get('output_path'):
-            with open(st.session_state.output_path, 'rb') as f:
+        # The previous run's output; a run started now offers its own below
+        previous_output = st.session_state.get('output_path')
+        if previous_output and not process_button:
+            try:
+                previous_mtime = os.stat(previous_output).st_mtime_ns
+            except OSError:
+                previous_mtime = None  # Output deleted since the run
+            if previous_mtime is not None:
                 st.download_button(
                     "📥 Download Translated File",
-                    data=f.read(),
+                    data=read_output(previous_output, previous_mtime),
                     file_name=f"Translated_{uploaded_file.name}",
                     mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                     use_container_width=True
                 )
 
-    if 'process_button' in locals() and process_button:
+    # Identical deck, slides and engine: reuse this session's earlier output
+    output_key = None
+    cached_output = None
+    if process_button:
+        output_key = (upload_hash(uploaded_file), tuple(slide_indices), translator_name)
+        cached_output = st.session_state.setdefault("output_cache", {}).get(output_key)
+        if cached_output and not os.path.exists(cached_output):
+            cached_output = None
+
+    if cached_output:
+        st.info("♻️ This presentation was already translated with these settings - reusing the result.")
+        st.session_state.output_path = cached_output
+        with open(cached_output, 'rb') as f:
+            st.download_button(
+                "📥 Download Translated Presentation",
+                data=f,
+                file_name=os.path.basename(cached_output),
+                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
+                type="primary"
+            )
+
+    elif process_button:
         # Prepare output path
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         output_filename = f"Translated_{os.path.splitext(uploaded_file.name)[0]}_{timestamp}.pptx"
@@ -317,8 +492,11 @@ if uploaded_file is not None:
         os.makedirs(output_dir, exist_ok=True)
         output_path = os.path.join(output_dir, output_filename)
 
+        # Save the upload to disk only now (the translator works from a path),
+        # into one temp dir per session and only when the file changed
+        input_path = save_upload(uploaded_file)
+
         # Get absolute paths
-        input_path = os.path.abspath(st.session_state.temp_input_path)
         output_path_abs = os.path.abspath(output_path)
 
         # Progress tracking
@@ -327,11 +505,8 @@ if uploaded_file is not None:
         log_container = st.expander("📋 Processing Log", expanded=True)
 
         try:
-            # Capture stdout for logging
-            import io
-            import contextlib
-
-            log_stream = StringIO()
+            # Capture stdout for logging (only the tail is kept and shown)
+            log_stream = LogBuffer()
 
             with log_container:
                 st.text("🔍 Starting Translation:")
@@ -344,41 +519,62 @@ if uploaded_file is not None:
             status_text.text("🔄 Initializing translation pipeline...")
             progress_bar.progress(10)
 
-            # Create translator instance
+            # Create translator instance. No worker processes: the pipeline runs in
+            # a thread of the server, and each session would start its own pool
             translator = SlideTranslator(
                 input_pptx=input_path,
                 output_pptx=output_path_abs,
-                verbose=True
+                verbose=True,
+                max_concurrency=concurrency,
+                max_workers=1
             )
 
-            # Parse slide range
-            if slide_range == "all":
-                slide_indices = list(range(1, translator.slide_count + 1))
-            else:
-                slide_indices = parse_slides_arg(slide_range, translator.slide_count)
-
             progress_bar.progress(20)
-            status_text.text("🔄 Processing slides...")
+            if use_batch_api:
+                status_text.text("⏳ Batch job submitted - waiting for results (usually minutes, at most 24h)...")
+            else:
+                status_text.text("🔄 Processing slides...")
+
+            # Run translation on a worker thread with captured output; this
+            # thread keeps the progress bar moving as pipeline stages finish
+            # (Streamlit elements can only be updated from the script thread)
+            progress_queue = queue.Queue()
+
+            def stage_updates(future):
+                """Poll the worker: move the progress bar, redraw the log tail, yield finished stages."""
+                shown_version = -1
+                while not future.done() or not progress_queue.empty():
+                    try:
+                        done, total = progress_queue.get(timeout=0.2)
+                        progress_bar.progress(20 + done * 80 // total)
+                        yield f"✓ {PIPELINE_STAGES[done - 1]}  \n"
+                    except queue.Empty:
+                        pass
+                    if log_stream.version != shown_version:
+                        shown_version = log_stream.version
+                        log_placeholder.code(log_stream.tail(), language=None)
 
-            # Run translation with captured output
             with log_container:
+                stage_placeholder = st.empty()
                 log_placeholder = st.empty()
 
-                # Redirect stdout to capture verbose output
-                with contextlib.redirect_stdout(log_stream):
-                    translator.translate_slides(
-                        slide_indices=slide_indices,
-                        translator=translator_name,
-                        api_key=api_key
-                    )
-
-                # Display the log
-                log_text = log_stream.getvalue()
-                log_placeholder.text_area(
-                    "Processing Output",
-                    value=log_text,
-                    height=300
-                )
+                # Redirect stdout to capture verbose output; leaving the block
+                # also closes the translator's handle on the input PPTX
+                with contextlib.redirect_stdout(log_stream), translator:
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        future = pool.submit(
+                            translator.translate_slides,
+                            slide_indices=slide_indices,
+                            translator=translator_name,
+                            api_key=api_key,
+                            progress_callback=lambda done, total: progress_queue.put((done, total))
+                        )
+                        # Stage lines are streamed (only the new line is sent each time)
+                        stage_placeholder.write_stream(stage_updates(future))
+                        future.result()  # Re-raise any pipeline error here
+
+                # Display the end of the log
+                log_placeholder.code(log_stream.tail(), language=None)
 
             progress_bar.progress(100)
             status_text.text("✅ Translation completed successfully!")
@@ -400,12 +596,13 @@ if uploaded_file is not None:
 
             # Store output path for download button
             st.session_state.output_path = output_path_abs
+            st.session_state.output_cache[output_key] = output_path_abs
 
-            # Offer download
+            # Offer download (Streamlit reads the open file itself)
             with open(output_path_abs, 'rb') as f:
                 st.download_button(
                     "📥 Download Translated Presentation",
-                    data=f.read(),
+                    data=f,
                     file_name=output_filename,
                     mime="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                     type="primary"